@@ -1,18 +1,31 @@
 """RAYLAB: Extensions and custom algorithms in RLlib."""
-import poetry_version
-
 __author__ = """Ângelo Gregório Lovatto"""
 __email__ = "angelolovatto@gmail.com"
-__version__ = poetry_version.extract(source_file=__file__)
+
+
+def __getattr__(name):
+    # Extracting the version parses the project files, so only do it on demand
+    if name == "__version__":
+        import poetry_version
+
+        return poetry_version.extract(source_file=__file__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def register_agent(name):
+    """Register a single trainer name in Tune, importing its class."""
+    from ray.tune import register_trainable
+    from raylab.agents.registry import AGENTS
+
+    register_trainable(name, AGENTS[name]())
 
 
 def register_all_agents():
     """Register all trainer names in Tune."""
-    from ray.tune import register_trainable
     from raylab.agents.registry import AGENTS
 
-    for name, trainer_import in AGENTS.items():
-        register_trainable(name, trainer_import())
+    for name in AGENTS:
+        register_agent(name)
 
 
 def register_all_environments():
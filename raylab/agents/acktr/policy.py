@@ -8,6 +8,7 @@ from ray.rllib import SampleBatch
 from ray.rllib.evaluation.postprocessing import compute_advantages
 from ray.rllib.evaluation.postprocessing import Postprocessing
 from ray.rllib.utils import override
+from torch.nn.utils import parameters_to_vector
 
 import raylab.utils.dictionaries as dutil
 from raylab.agents.trpo.policy import LINESEARCH_DEFAULTS
@@ -17,6 +18,7 @@ from raylab.policy import learner_stats
 from raylab.policy import TorchPolicy
 from raylab.policy.action_dist import WrapStochasticPolicy
 from raylab.torch.nn.distributions import Normal
+from raylab.torch.nn.utils import batched_params_call
 from raylab.torch.optim import build_optimizer
 from raylab.torch.optim.hessian_free import line_search
 from raylab.torch.optim.kfac import KFACMixin
@@ -207,8 +209,25 @@ class ACKTRTorchPolicy(TorchPolicy):
             avg_kl = torch.mean(old_logp - new_logp)
             return surr_loss.item() if avg_kl < kl_clip else np.inf
 
+        @torch.no_grad()
+        def f_barrier_batched(scales):
+            params = list(self.module.actor.parameters())
+            grads = parameters_to_vector([p.grad for p in params])
+            params = parameters_to_vector(params)
+
+            def surr_loss_and_kl(actor):
+                new_logp = actor.log_prob(cur_obs, actions)
+                surr_loss = self._compute_surr_loss(old_logp, new_logp, advantages)
+                return torch.stack([surr_loss, torch.mean(old_logp - new_logp)])
+
+            losses, avg_kls = batched_params_call(
+                self.module.actor, params + scales[:, None] * grads, surr_loss_and_kl
+            ).unbind(-1)
+            return losses.masked_fill(avg_kls >= kl_clip, np.inf)
+
+        batched = self.config["line_search_options"]["batched"]
         scale, expected_improvement, improvement = line_search(
-            f_barrier,
+            f_barrier_batched if batched else f_barrier,
             1,
             1,
             expected_improvement,
@@ -224,7 +243,7 @@ class ACKTRTorchPolicy(TorchPolicy):
             "improvement_ratio": improvement_ratio,
         }
         for par in self.module.actor.parameters():
-            par.data.add_(par.grad.data, alpha=scale)
+            par.data.add_(par.grad.data, alpha=float(scale))
         return info
 
     @staticmethod
@@ -17,6 +17,7 @@ from raylab.policy.model_based.policy import MBPolicyMixin
 from raylab.policy.model_based.policy import model_based_options
 from raylab.policy.model_based.sampling import SamplingSpec
 from raylab.torch.optim import build_optimizer
+from raylab.utils.profiler import profile
 from raylab.utils.replay_buffer import NumpyReplayBuffer
 from raylab.utils.timer import TimerStat
 from raylab.utils.types import StatDict
@@ -114,25 +115,26 @@ class MBPOTorchPolicy(MBPolicyMixin, EnvFnMixin, ModelSamplingMixin, SACTorchPol
 
     @learner_stats
     def learn_on_batch(self, samples: SampleBatch) -> dict:
-        self.add_to_buffer(samples)
+        with profile("add_to_buffer"):
+            self.add_to_buffer(samples)
         self._learn_calls += 1
 
         info = {}
         warmup = self._learn_calls == 1
         if self._learn_calls % self.config["model_update_interval"] == 0 or warmup:
-            with self.timers["model"] as timer:
+            with self.timers["model"] as timer, profile("train_dynamics_model"):
                 losses, model_info = self.train_dynamics_model(warmup=warmup)
                 timer.push_units_processed(model_info["model_epochs"])
                 info.update(model_info)
             self.set_new_elite(losses)
 
-        with self.timers["augmentation"] as timer:
+        with self.timers["augmentation"] as timer, profile("populate_virtual_buffer"):
             count_before = len(self.virtual_replay)
             self.populate_virtual_buffer()
             timer.push_units_processed(len(self.virtual_replay) - count_before)
 
-        with self.timers["policy"] as timer:
-            times = self.config["improvement_steps"]
+        with self.timers["policy"] as timer, profile("update_policy"):
+            times = self.num_improvement_steps(samples)
             policy_info = self.update_policy(times=times)
             timer.push_units_processed(times)
             info.update(policy_info)
@@ -162,14 +164,16 @@ class MBPOTorchPolicy(MBPolicyMixin, EnvFnMixin, ModelSamplingMixin, SACTorchPol
         model_batch_size = batch_size - env_batch_size
 
         for _ in range(times):
-            samples = []
-            if env_batch_size:
-                samples += [self.replay.sample(env_batch_size)]
-            if model_batch_size:
-                samples += [self.virtual_replay.sample(model_batch_size)]
-            batch = SampleBatch.concat_samples(samples)
+            with profile("replay_sample"):
+                samples = []
+                if env_batch_size:
+                    samples += [self.replay.sample(env_batch_size)]
+                if model_batch_size:
+                    samples += [self.virtual_replay.sample(model_batch_size)]
+                batch = SampleBatch.concat_samples(samples)
             batch = self.lazy_tensor_dict(batch)
-            info = self.improve_policy(batch)
+            with profile("improve_policy"):
+                info = self.improve_policy(batch)
 
         return info
 
@@ -62,6 +62,15 @@ class ModelBasedMixin:
       and next state) i.e., the states should be markovian.
     """
 
+    def validate_config(self, config: dict):
+        # pylint:disable=missing-function-docstring
+        super().validate_config(config)
+        # Model training doesn't go through OptimizerCollection.optimize, so
+        # data-parallel learners would train diverging models
+        assert (
+            config.get("num_learners", 1) == 1
+        ), "Model-based agents don't support data-parallel learners."
+
     def after_init(self):
         # pylint:disable=missing-function-docstring
         super().after_init()
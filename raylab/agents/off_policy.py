@@ -9,7 +9,10 @@ from ray.rllib.execution.train_ops import TrainOneStep
 from ray.rllib.utils.typing import ResultDict
 from ray.rllib.utils.typing import TrainerConfigDict
 
+from raylab.execution import BroadcastWeights
 from raylab.execution import LearningStarts
+from raylab.execution import LearnOnLocalWorker
+from raylab.execution import TrainDataParallel
 from raylab.options import option
 
 
@@ -23,28 +26,70 @@ def off_policy_execution_plan(workers: WorkerSet, config: TrainerConfigDict):
         LearningStarts(learning_starts=config["learning_starts"])
     )
     # Then, train the policy on those experiences and update the workers.
-    train_op = rollouts.for_each(TrainOneStep(workers))
+    if config["num_learners"] > 1:
+        # Or split gradient computation across data-parallel learners.
+        train_op = rollouts.for_each(TrainDataParallel(workers, config))
+    else:
+        train_op = rollouts.for_each(TrainOneStep(workers))
 
     # Add on the standard episode reward, etc. metrics reporting. This returns
     # a LocalIterator[metrics_dict] representing metrics for each train step.
     return StandardMetricsReporting(train_op, workers, config)
 
 
+def off_policy_async_execution_plan(workers: WorkerSet, config: TrainerConfigDict):
+    """Execution plan with rollout workers sampling asynchronously from learning.
+
+    Remote workers keep sampling while the local policy learns. Each batch is
+    added to the replay buffer as soon as it arrives, and weights are sent back
+    to the workers every `broadcast_interval` learning calls.
+    """
+    # Collects experiences from remote RolloutWorker actors as they finish.
+    rollouts = ParallelRollouts(
+        workers,
+        mode="async",
+        num_async=config["max_sample_requests_in_flight_per_worker"],
+    )
+    rollouts = rollouts.combine(
+        LearningStarts(learning_starts=config["learning_starts"])
+    )
+    if config["num_learners"] > 1:
+        train_op = rollouts.for_each(TrainDataParallel(workers, config))
+    else:
+        train_op = rollouts.for_each(LearnOnLocalWorker(workers))
+    train_op = train_op.for_each(
+        BroadcastWeights(workers, interval=config["broadcast_interval"])
+    )
+
+    return StandardMetricsReporting(train_op, workers, config)
+
+
 class OffPolicyMixin:
     """Mixin for off-policy agents."""
 
     # pylint:disable=missing-function-docstring
     def validate_config(self, config: dict):
         super().validate_config(config)
-        assert config["num_workers"] == 0, "No point in using additional workers."
+        if config["async_rollouts"]:
+            assert config["num_workers"] >= 1, "Async rollouts need remote workers."
+            assert config["broadcast_interval"] >= 1
+        else:
+            assert config["num_workers"] == 0, "No point in using additional workers."
         assert (
             config["rollout_fragment_length"] >= 1
         ), "At least one sample must be collected."
+        assert config["num_learners"] >= 1, "At least one learner is needed."
+        assert (
+            max(config["learning_starts"], config["rollout_fragment_length"])
+            >= config["num_learners"]
+        ), "Each data-parallel learner needs samples before its first update."
 
     @property
     def execution_plan(
         self,
     ) -> Callable[[WorkerSet, TrainerConfigDict], Iterable[ResultDict]]:
+        if self.config["async_rollouts"]:
+            return off_policy_async_execution_plan
         return off_policy_execution_plan
 
     @staticmethod
@@ -56,6 +101,44 @@ class OffPolicyMixin:
                 default=0,
                 help="Hold this number of timesteps before first training operation.",
             ),
+            option(
+                "num_learners",
+                default=1,
+                help="""Number of learner processes for data-parallel training.
+
+                If greater than 1, each learner holds a replica of the policy and
+                an equal shard of the replay buffer, samples its own minibatches,
+                and averages gradients with the others via `torch.distributed`.
+                Rollouts are still collected by the rollout workers. The effective
+                minibatch size is 'policy/batch_size' times the number of learners.
+                Not supported by model-based agents.
+                """,
+            ),
+            option(
+                "async_rollouts",
+                default=False,
+                help="""Whether to sample with remote workers asynchronously.
+
+                If True, 'num_workers' rollout workers sample continuously with
+                periodically synced weights, while the local policy learns on
+                their batches as they arrive. Use the policy's
+                'update_to_data_ratio' to fix the number of updates per sample.
+                Consider increasing 'rollout_fragment_length' to reduce
+                communication overhead.
+                """,
+            ),
+            option(
+                "max_sample_requests_in_flight_per_worker",
+                default=2,
+                help="Number of sample batches each remote worker may have pending"
+                " with 'async_rollouts'.",
+            ),
+            option(
+                "broadcast_interval",
+                default=1,
+                help="Number of learning calls between sending weights to remote"
+                " workers with 'async_rollouts'.",
+            ),
             option("rollout_fragment_length", default=1, override=True),
             option("num_workers", default=0, override=True),
             option("evaluation_config/explore", False, override=True),
@@ -86,7 +86,10 @@ AGENTS = {
 def get_agent_cls(agent_name):
     """Retrieve agent class from global registry.
 
-    The user must have called `raylab.register_all_agents()` beforehand to
-    have access to Raylab's agents.
+    Raylab's agents are imported on demand, so that only the requested
+    trainer class is loaded. Other agents must have been registered in Tune
+    beforehand.
     """
+    if agent_name in AGENTS:
+        return AGENTS[agent_name]()
     return get_trainable_cls(agent_name)
@@ -13,6 +13,7 @@ from raylab.policy.losses import ReparameterizedSoftPG
 from raylab.policy.modules.critic import SoftValue
 from raylab.policy.off_policy import off_policy_options
 from raylab.policy.off_policy import OffPolicyMixin
+from raylab.torch.nn.utils import memoize_forward
 from raylab.torch.nn.utils import update_polyak
 from raylab.torch.optim import build_optimizer
 from raylab.utils.types import TensorDict
@@ -100,10 +101,12 @@ class SACTorchPolicy(OffPolicyMixin, TorchPolicy):
     def improve_policy(self, batch: TensorDict) -> dict:
         info = {}
 
-        info.update(self._update_critic(batch))
-        info.update(self._update_actor(batch))
-        if self.config["target_entropy"] is not None:
-            info.update(self._update_alpha(batch))
+        # Let the temperature update reuse the actor's distribution parameters
+        with memoize_forward(self.module.actor):
+            info.update(self._update_critic(batch))
+            info.update(self._update_actor(batch))
+            if self.config["target_entropy"] is not None:
+                info.update(self._update_alpha(batch))
 
         update_polyak(
             self.module.critics, self.module.target_critics, self.config["polyak"]
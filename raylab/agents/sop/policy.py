@@ -22,6 +22,7 @@ from raylab.utils.types import TensorDict
 @option("batch_size", 256)
 @option("std_obs", False)
 @option("improvement_steps", 1)
+@option("update_to_data_ratio", None)
 @option(
     "dpg_loss",
     "default",
@@ -18,6 +18,7 @@ from raylab.policy import TorchPolicy
 from raylab.policy.losses import OneStepSVG
 from raylab.policy.off_policy import off_policy_options
 from raylab.policy.off_policy import OffPolicyMixin
+from raylab.torch.nn.utils import memoize_forward
 from raylab.torch.optim import get_optimizer_class
 from raylab.utils.replay_buffer import ReplayField
 from raylab.utils.types import TensorDict
@@ -110,20 +111,23 @@ class SVGOneTorchPolicy(OffPolicyMixin, AdaptiveKLCoeffMixin, SVGTorchPolicy):
 
     @override(OffPolicyMixin)
     def improve_policy(self, batch: TensorDict) -> dict:
-        batch, info = self.add_truncated_importance_sampling_ratios(batch)
+        # Share the actor's distribution parameters between the importance
+        # sampling ratios, SVG loss, KL penalty, and entropy stats
+        with memoize_forward(self.module.actor):
+            batch, info = self.add_truncated_importance_sampling_ratios(batch)
 
-        with self.optimizers.optimize("all"):
-            model_value_loss, stats = self.compute_joint_model_value_loss(batch)
-            info.update(stats)
-            model_value_loss.backward()
-
-            with self.freeze_model_and_critic():
-                svg_loss, stats = self.loss_actor(batch)
+            with self.optimizers.optimize("all"):
+                model_value_loss, stats = self.compute_joint_model_value_loss(batch)
                 info.update(stats)
-                kl_loss = self.curr_kl_coeff * self._avg_kl_divergence(batch)
-                (svg_loss + kl_loss).backward()
+                model_value_loss.backward()
+
+                with self.freeze_model_and_critic():
+                    svg_loss, stats = self.loss_actor(batch)
+                    info.update(stats)
+                    kl_loss = self.curr_kl_coeff * self._avg_kl_divergence(batch)
+                    (svg_loss + kl_loss).backward()
 
-        info.update(self.extra_grad_info(batch))
+            info.update(self.extra_grad_info(batch))
         self._update_polyak()
         return info
 
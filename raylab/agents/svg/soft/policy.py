@@ -13,6 +13,7 @@ from raylab.policy.losses import MaximumEntropyDual
 from raylab.policy.losses import OneStepSoftSVG
 from raylab.policy.off_policy import off_policy_options
 from raylab.policy.off_policy import OffPolicyMixin
+from raylab.torch.nn.utils import memoize_forward
 from raylab.torch.optim import build_optimizer
 from raylab.utils.replay_buffer import ReplayField
 from raylab.utils.types import TensorDict
@@ -127,13 +128,15 @@ class SoftSVGTorchPolicy(OffPolicyMixin, SVGTorchPolicy):
 
     @override(OffPolicyMixin)
     def improve_policy(self, batch: TensorDict) -> dict:
-        batch, info = self.add_truncated_importance_sampling_ratios(batch)
-
-        info.update(self._update_model(batch))
-        info.update(self._update_critic(batch))
-        info.update(self._update_actor(batch))
-        if self.config["target_entropy"] is not None:
-            info.update(self._update_alpha(batch))
+        # Share the actor's distribution parameters between losses and stats
+        with memoize_forward(self.module.actor):
+            batch, info = self.add_truncated_importance_sampling_ratios(batch)
+
+            info.update(self._update_model(batch))
+            info.update(self._update_critic(batch))
+            info.update(self._update_actor(batch))
+            if self.config["target_entropy"] is not None:
+                info.update(self._update_alpha(batch))
 
         self._update_polyak()
         return info
@@ -14,6 +14,8 @@ from ray.rllib.agents.trainer import MAX_WORKER_FAILURE_RETRIES
 from ray.rllib.agents.trainer_template import default_execution_plan
 from ray.rllib.env.env_context import EnvContext
 from ray.rllib.evaluation.worker_set import WorkerSet
+from ray.rllib.execution.common import LEARNER_INFO
+from ray.rllib.policy.policy import LEARNER_STATS_KEY
 from ray.rllib.utils import override as overrides
 from ray.rllib.utils.typing import EnvType
 from ray.rllib.utils.typing import PartialTrainerConfigDict
@@ -207,9 +209,26 @@ class Trainer(RLlibTrainer, metaclass=ABCMeta):
     def step(self) -> dict:
         res = self.evaluate_pre_learning()
         res.update(next(self.train_exec_impl))
+        self.add_profiler_stats(res)
         res.update(self.evaluate_if_needed())
         return res
 
+    def add_profiler_stats(self, result: ResultDict):
+        """Adds the local policies' profiler stats to their learner stats.
+
+        Flushes the profilers once per training iteration, instead of on
+        every call to `learn_on_batch`. Data-parallel learners report their
+        own profiler stats (see `TrainDataParallel`).
+        """
+        for policy_id, policy in self.workers.local_worker().policy_map.items():
+            if not hasattr(policy, "profiler_stats"):
+                continue
+            stats = policy.profiler_stats()
+            if stats:
+                learner = result.setdefault("info", {}).setdefault(LEARNER_INFO, {})
+                info = learner.setdefault(policy_id, {})
+                info.setdefault(LEARNER_STATS_KEY, {}).update(stats)
+
     def evaluate_pre_learning(self) -> dict:
         """Runs evaluation before any optimizations if requested.
 
@@ -14,6 +14,7 @@ from raylab.options import option
 from raylab.policy import learner_stats
 from raylab.policy import TorchPolicy
 from raylab.policy.action_dist import WrapStochasticPolicy
+from raylab.torch.nn.utils import batched_params_call
 from raylab.torch.optim import build_optimizer
 from raylab.torch.optim.hessian_free import conjugate_gradient
 from raylab.torch.optim.hessian_free import hessian_vector_product
@@ -28,6 +29,8 @@ LINESEARCH_DEFAULTS = {
     "backtrack_ratio": 0.8,
     "max_backtracks": 15,
     "atol": 1e-7,
+    # Whether to evaluate all step sizes in a single batched forward pass
+    "batched": False,
 }
 
 
@@ -184,6 +187,7 @@ class TRPOTorchPolicy(TorchPolicy):
         return descent_direction, {"cg_iters": elapsed_iters, "cg_residual": residual}
 
     def _perform_line_search(self, pol_grad, descent_step, surr_loss, batch_tensors):
+        # pylint:disable=too-many-locals
         expected_improvement = pol_grad.dot(descent_step).item()
 
         cur_obs, actions, old_logp, advantages = get_keys(
@@ -202,8 +206,22 @@ class TRPOTorchPolicy(TorchPolicy):
             avg_kl = torch.mean(old_logp - new_logp)
             return surr_loss.item() if avg_kl < self.config["delta"] else np.inf
 
+        @torch.no_grad()
+        def f_barrier_batched(params):
+            def surr_loss_and_kl(actor):
+                new_logp = actor.log_prob(cur_obs, actions)
+                surr_loss = self._compute_surr_loss(old_logp, new_logp, advantages)
+                return torch.stack([surr_loss, torch.mean(old_logp - new_logp)])
+
+            losses, avg_kls = batched_params_call(
+                self.module.actor, params, surr_loss_and_kl
+            ).unbind(-1)
+            return losses.masked_fill(avg_kls >= self.config["delta"], np.inf)
+
+        batched = self.config["line_search_options"]["batched"]
+
         new_params, expected_improvement, improvement = line_search(
-            f_barrier,
+            f_barrier_batched if batched else f_barrier,
             parameters_to_vector(self.module.actor.parameters()),
             descent_step,
             expected_improvement,
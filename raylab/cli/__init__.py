@@ -3,6 +3,7 @@ import click
 
 from .best_checkpoint import find_best
 from .evaluate_checkpoint import rollout
+from .evaluate_checkpoints import evaluate
 from .experiment import experiment
 from .info import info_cli
 
@@ -29,10 +30,14 @@ def dashboard(paths):
 @raylab.command()
 @click.argument(
     "path",
-    type=click.Path(exists=True, file_okay=True, dir_okay=False, resolve_path=True),
+    type=click.Path(exists=True, file_okay=True, dir_okay=True, resolve_path=True),
 )
 def episodes(path):
-    """Launch the episode dashboard to monitor state and action distributions."""
+    """Launch the episode dashboard to monitor state and action distributions.
+
+    PATH may be a columnar episode directory or a shelve file saved by
+    `raylab rollout`.
+    """
     from streamlit.cli import _main_run
     from . import episode_dashboard
 
@@ -56,4 +61,5 @@ def test_module(agent_id, checkpoint):
 raylab.add_command(experiment)
 raylab.add_command(find_best)
 raylab.add_command(rollout)
+raylab.add_command(evaluate)
 raylab.add_command(info_cli)
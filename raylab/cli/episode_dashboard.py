@@ -1,13 +1,15 @@
 """Episode monitoring with Streamlit."""
 import os.path as osp
-import shelve
 
-import numpy as np
 import pandas as pd
 import streamlit as st
 from bokeh.layouts import gridplot
 from bokeh.plotting import figure
 
+from raylab.utils.episodes import convert_shelve
+from raylab.utils.episodes import load_episodes
+from raylab.utils.episodes import timestep_stats
+
 # pylint:disable=invalid-name,missing-docstring,pointless-string-statement
 # pylint:disable=no-value-for-parameter
 """
@@ -15,37 +17,36 @@ from bokeh.plotting import figure
 """
 
 
+@st.cache
+def load_stats(path):
+    if not osp.isdir(path):
+        # Convert RLlib's shelve logs once
+        shelf_path, _ = osp.splitext(path)
+        columns_path = shelf_path + ".columns"
+        if not osp.exists(columns_path):
+            convert_shelve(shelf_path, columns_path)
+        path = columns_path
+
+    fields, offsets = load_episodes(path)
+    means, stds = {}, {}
+    for name, values in fields.items():
+        mean, std = timestep_stats(values, offsets)
+        if values.ndim == 1:
+            means[name], stds[name] = mean, std
+        else:
+            for dim in range(values.shape[1]):
+                key = f"{name}[{dim}]"
+                means[key], stds[key] = mean[:, dim], std[:, dim]
+
+    return pd.DataFrame(means), pd.DataFrame(stds)
+
+
 def main():
-    # pylint:disable=too-many-locals
     import sys
 
-    assert len(sys.argv) <= 2, "Only one episode log from `rllib rollout` allowed."
-    path, _ = osp.splitext(sys.argv[1])
-
-    episodes = []
-    with shelve.open(path) as rollouts:
-        for episode_index in range(rollouts["num_episodes"]):
-            episodes += [rollouts[str(episode_index)]]
-
-    rows = []
-    for idx, episode in enumerate(episodes):
-        for timestep, transition in enumerate(episode):
-            obs, act, _, rew, done, *_ = transition
-            row = {"episode": idx, "timestep": timestep, "reward": rew, "done": done}
-            for dim, ob_ in enumerate(obs):
-                row[f"obs[{dim}]"] = ob_
-            for dim, ac_ in enumerate(act):
-                row[f"act[{dim}]"] = ac_
-            rows += [row]
-
-    keys = rows[0].keys()
-    data = pd.DataFrame(data={k: np.stack([r[k] for r in rows]) for k in keys})
-    data["done"] = data["done"].astype(np.float32)
-
-    stats_columns = [c for c in data.columns if c not in {"timestep", "episode"}]
-    grouped = data.groupby("timestep")[stats_columns]
-    means = grouped.mean()
-    stds = grouped.std()
+    assert len(sys.argv) <= 2, "Only one episode log from `raylab rollout` allowed."
+    means, stds = load_stats(sys.argv[1])
+    stats_columns = means.columns
 
     pics = []
     for key in stats_columns:
@@ -6,6 +6,39 @@ import click
 from .utils import initialize_raylab
 
 
+class ColumnarSaver:
+    """Saves rollouts with `raylab.utils.episodes.EpisodeWriter`.
+
+    Implements the interface of RLlib's `RolloutSaver` used by its `rollout`.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._writer = None
+
+    def __enter__(self):
+        from raylab.utils.episodes import EpisodeWriter
+
+        self._writer = EpisodeWriter(self._path)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._writer.close()
+
+    def begin_rollout(self):
+        # pylint:disable=missing-function-docstring
+        pass
+
+    def append_step(self, obs, action, next_obs, reward, done, info):
+        # pylint:disable=missing-function-docstring,too-many-arguments
+        # pylint:disable=unused-argument
+        self._writer.add_step(obs, action, reward, done)
+
+    def end_rollout(self):
+        # pylint:disable=missing-function-docstring
+        self._writer.end_episode()
+
+
 @click.command()
 @click.argument(
     "checkpoint",
@@ -80,6 +113,13 @@ from .utils import initialize_raylab
     "as it is generated). An output filename must be set using --out.",
     show_default=True,
 )
+@click.option(
+    "--columnar/--no-columnar",
+    default=False,
+    help="Save rollouts into a columnar episode directory, which the episode "
+    "dashboard can memory-map. An output directory must be set using --out.",
+    show_default=True,
+)
 @click.option(
     "--track-progress/--no-progress",
     default=False,
@@ -92,6 +132,9 @@ from .utils import initialize_raylab
 def rollout(checkpoint, agent, env, eval_config, **rollout_kwargs):
     """Wrap `rllib rollout` with customized options."""
     # pylint:disable=too-many-locals
+    if rollout_kwargs["columnar"] and rollout_kwargs["out"] is None:
+        raise click.UsageError("--columnar requires an output directory (--out).")
+
     import ray
     from ray.rllib.rollout import rollout as rllib_rollout, RolloutSaver
     from raylab.utils.checkpoints import get_agent_from_checkpoint
@@ -105,14 +148,19 @@ def rollout(checkpoint, agent, env, eval_config, **rollout_kwargs):
         config_overrides=rollout_kwargs["config"],
     )
 
-    with RolloutSaver(
-        rollout_kwargs["out"],
-        rollout_kwargs["shelve"],
-        write_update_file=rollout_kwargs["track_progress"],
-        target_steps=rollout_kwargs["steps"],
-        target_episodes=rollout_kwargs["episodes"],
-        save_info=rollout_kwargs["save_info"],
-    ) as saver:
+    if rollout_kwargs["columnar"]:
+        saver = ColumnarSaver(rollout_kwargs["out"])
+    else:
+        saver = RolloutSaver(
+            rollout_kwargs["out"],
+            rollout_kwargs["shelve"],
+            write_update_file=rollout_kwargs["track_progress"],
+            target_steps=rollout_kwargs["steps"],
+            target_episodes=rollout_kwargs["episodes"],
+            save_info=rollout_kwargs["save_info"],
+        )
+
+    with saver:
         rllib_rollout(
             agent,
             env,
@@ -0,0 +1,114 @@
+"""CLI for evaluating many checkpoints in parallel."""
+import json
+
+import click
+
+from .utils import initialize_raylab
+
+
+@click.command()
+@click.argument(
+    "checkpoints",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, resolve_path=True),
+)
+@click.option(
+    "--agent", required=True, default=None, help="Name of the raylab agent to restore."
+)
+@click.option(
+    "--env",
+    default=None,
+    help="Name of the environment to interact with. "
+    "Optional; can be inferred from config.",
+)
+@click.option(
+    "--episodes",
+    "-n",
+    default=10,
+    show_default=True,
+    help="Number of episodes to evaluate per checkpoint.",
+)
+@click.option(
+    "--seed",
+    default=0,
+    show_default=True,
+    help="Environment seed of the first episode. Episode i uses seed + i.",
+)
+@click.option(
+    "--num-envs",
+    default=8,
+    show_default=True,
+    help="Number of environments stepped in lockstep by each process.",
+)
+@click.option(
+    "--max-steps",
+    type=int,
+    default=None,
+    help="Maximum number of steps per episode.",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of worker processes. Defaults to the number of processors. "
+    "Use 0 to evaluate in the main process.",
+)
+@click.option(
+    "--eval-config/--train-config",
+    default=True,
+    help="Whether to use the evaluation_config for the agent.",
+    show_default=True,
+)
+@click.option(
+    "--config",
+    default="{}",
+    type=json.loads,
+    help="Algorithm-specific configuration overrides, merged with the "
+    "configuration loaded from the checkpoint.",
+)
+@click.option(
+    "--out",
+    type=click.Path(file_okay=True, dir_okay=False, resolve_path=True),
+    default="evaluation.columns.pkl",
+    show_default=True,
+    help="Output filename. Per-episode results are appended in columnar format, "
+    "readable with `raylab.logger.columnar_logger.read_columnar_progress`.",
+)
+@initialize_raylab
+def evaluate(checkpoints, agent, env, out, **kwargs):
+    """Evaluate policies from one or many checkpoints in parallel.
+
+    Writes the return and length of every episode. Only raylab agents are
+    supported: policies are restored without building the full trainer.
+    """
+    import pickle
+
+    import numpy as np
+
+    from raylab.utils.evaluation import evaluate_checkpoints
+
+    results = evaluate_checkpoints(
+        checkpoints,
+        agent,
+        episodes=kwargs["episodes"],
+        env=env,
+        seed=kwargs["seed"],
+        num_envs=kwargs["num_envs"],
+        max_steps=kwargs["max_steps"],
+        workers=kwargs["workers"],
+        use_eval_config=kwargs["eval_config"],
+        config_overrides=kwargs["config"],
+    )
+    with open(out, "ab") as file:
+        for checkpoint, stats in results:
+            returns = stats["episode_reward"]
+            click.echo(
+                f"{checkpoint}: {returns.mean():.3f} +- {returns.std():.3f}"
+                f" (episode length {stats['episode_length'].mean():.1f})"
+            )
+            batch = {
+                "checkpoint": np.full(len(returns), checkpoint, dtype=object),
+                **stats,
+            }
+            pickle.dump(batch, file, protocol=pickle.HIGHEST_PROTOCOL)
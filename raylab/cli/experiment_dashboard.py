@@ -1,4 +1,6 @@
 """Experiment monitoring with Streamlit."""
+import os
+
 import streamlit as st
 
 from raylab.cli.viz import time_series
@@ -14,7 +16,16 @@ from raylab.utils import exp_data as exp_util
 # https://discuss.streamlit.io/t/how-can-i-clear-a-specific-cache-only/1963/6
 @st.cache(allow_output_mutation=True)
 def load_data(directories, include_errors=False):
-    return [exp_util.load_exps_data(directories, include_errors=include_errors)]
+    return [load_exps_data(directories, include_errors=include_errors)]
+
+
+def load_exps_data(directories, include_errors=False):
+    return exp_util.load_exps_data(
+        directories,
+        include_errors=include_errors,
+        use_cache=True,
+        workers=os.cpu_count(),
+    )
 
 
 @st.cache
@@ -73,7 +84,7 @@ def get_selector(folders, sidebar_options):
     if st.button("Reload Data"):
         data_wrapper.clear()
         data_wrapper.append(
-            exp_util.load_exps_data(
+            load_exps_data(
                 tuple(folders), include_errors=sidebar_options["include_errors"]
             )
         )
@@ -8,13 +8,17 @@ import click
 
 
 def initialize_raylab(func):
-    """Wrap cli to register raylab's algorithms and environments."""
+    """Wrap cli to register raylab's environments.
+
+    Raylab's algorithms are imported on demand by
+    :func:`raylab.agents.registry.get_agent_cls`.
+    """
 
     @functools.wraps(func)
     def wrapped(*args, **kwargs):
         import raylab
 
-        raylab.register_all()
+        raylab.register_all_environments()
 
         return func(*args, **kwargs)
 
@@ -45,8 +49,13 @@ def tune_experiment(func):
         import ray
         from ray import tune
         from ray.rllib.utils import merge_dicts
+        import raylab
+        from raylab.agents.registry import AGENTS
 
         trainable, config, tune_overrides = func(*args, **kwargs)
+        if isinstance(trainable, str) and trainable in AGENTS:
+            # Only import the requested trainer
+            raylab.register_agent(trainable)
         tune_kwargs = merge_dicts(tune_kwargs, tune_overrides)
         process_tune_kwargs(ctx, **tune_kwargs)
 
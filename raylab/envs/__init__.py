@@ -1,6 +1,7 @@
 """OpenAI Gym environments and utilities."""
 from ray.tune import register_env
 
+from .compiled import CompiledEnvFn
 from .rewards import get_reward_fn
 from .rewards import has_reward_fn
 from .rewards import register as register_reward_fn
@@ -11,6 +12,7 @@ from .utils import get_env_creator
 from .utils import has_env_creator
 
 __all__ = [
+    "CompiledEnvFn",
     "get_reward_fn",
     "has_reward_fn",
     "register_reward_fn",
@@ -0,0 +1,117 @@
+"""Compiled environment functions for model-based rollouts."""
+import warnings
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import torch
+import torch.nn as nn
+from torch import Tensor
+
+Signature = Tuple[Tuple[torch.Size, torch.dtype, torch.device], ...]
+
+
+class CompiledEnvFn(nn.Module):
+    """Reward or termination function with TorchScript and shape specialization.
+
+    Inputs with the same leading batch dimensions, e.g., `(particles, batch)`,
+    are flattened into a single batch dimension so that all particles of a
+    vectorized rollout are scored in one call. The function is then traced
+    once per input signature (shapes, dtypes, and devices), producing graphs
+    specialized to those shapes. Each trace is checked against the eager
+    function on its first call and discarded if the outputs differ or if
+    tracing detected data-dependent control flow. Signatures without a valid
+    trace use the scripted function, or the eager one if it cannot be scripted.
+
+    Args:
+        function: callable mapping (state, action, next_state) triplets to
+            rewards or terminations
+        max_specializations: maximum number of input signatures to trace
+        rtol: relative tolerance when checking traces against the eager function
+        atol: absolute tolerance when checking traces against the eager function
+
+    Attributes:
+        function: the eager function
+        scripted: the function compiled with TorchScript, or None if unsupported
+    """
+
+    def __init__(
+        self,
+        function: Callable[[Tensor, Tensor, Tensor], Tensor],
+        max_specializations: int = 8,
+        rtol: float = 1e-5,
+        atol: float = 1e-6,
+    ):
+        super().__init__()
+        self.function = function
+        self.scripted = _script(function)
+        self.max_specializations = max_specializations
+        self.rtol = rtol
+        self.atol = atol
+        self._specialized: Dict[Signature, Callable] = {}
+
+    def forward(self, state, action, next_state):
+        # pylint:disable=arguments-differ
+        batch_shape = next_state.shape[:-1]
+        inputs = (state, action, next_state)
+        if all(x.shape[:-1] == batch_shape for x in inputs):
+            inputs = tuple(x.reshape(-1, x.shape[-1]) for x in inputs)
+            outputs = self.specialize(*inputs)(*inputs)
+            return outputs.reshape(batch_shape + outputs.shape[1:])
+
+        return self.default(*inputs)
+
+    @property
+    def default(self) -> Callable:
+        """The function used for inputs without a shape-specialized version."""
+        return self.function if self.scripted is None else self.scripted
+
+    def specialize(self, state, action, next_state) -> Callable:
+        """Return the function specialized to the signature of the inputs."""
+        inputs = (state, action, next_state)
+        signature = tuple((x.shape, x.dtype, x.device) for x in inputs)
+        if signature not in self._specialized:
+            if len(self._specialized) >= self.max_specializations:
+                return self.default
+
+            traced = _trace(self.function, inputs)
+            if traced is None or not self.check(traced, *inputs):
+                traced = self.default
+            self._specialized[signature] = traced
+
+        return self._specialized[signature]
+
+    @torch.no_grad()
+    def check(self, function: Callable, state, action, next_state) -> bool:
+        """Whether a compiled version agrees with the eager function on inputs."""
+        expected = self.function(state, action, next_state)
+        outputs = function(state, action, next_state)
+        if outputs.shape != expected.shape or outputs.dtype != expected.dtype:
+            return False
+        if expected.dtype == torch.bool:
+            return torch.equal(outputs, expected)
+        return torch.allclose(outputs, expected, rtol=self.rtol, atol=self.atol)
+
+
+def _script(function: Callable) -> Optional[Callable]:
+    if isinstance(function, torch.jit.ScriptModule):
+        return function
+    try:
+        return torch.jit.script(function)
+    except Exception as err:  # pylint:disable=broad-except
+        warnings.warn(f"Could not compile {function} with TorchScript: {err}")
+        return None
+
+
+def _trace(function: Callable, inputs: Tuple[Tensor, ...]) -> Optional[Callable]:
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", torch.jit.TracerWarning)
+        try:
+            traced = torch.jit.trace(function, inputs, check_trace=False)
+        except Exception:  # pylint:disable=broad-except
+            return None
+
+    if any(issubclass(w.category, torch.jit.TracerWarning) for w in caught):
+        return None
+    return traced
@@ -1,11 +1,21 @@
 # pylint:disable=import-outside-toplevel
 """Registry of custom Gym environments."""
 import importlib
+import json
+import os
 
 import gym
 
 from .utils import wrap_if_needed
 
+# Libraries which register environments in Gym upon import
+EXTERNAL_LIBRARIES = ("gym_cartpole_swingup", "gym_industrial", "pybullet_envs")
+# Optional dependencies which determine whether some Gym environments are valid
+OPTIONAL_DEPENDENCIES = ("atari_py", "mujoco_py", "Box2D")
+# Environment variable with the path of a file in which to cache the
+# environment ids of external libraries, so that they're imported lazily
+MANIFEST_PATH_ENV = "RAYLAB_ENV_MANIFEST"
+
 
 def filtered_gym_env_ids():
     """
@@ -24,6 +34,75 @@ def filtered_gym_env_ids():
     return {s.id for s in specs}
 
 
+def _library_signature(library_name):
+    """Identify an installed library without importing it."""
+    spec = importlib.util.find_spec(library_name)
+    if spec is None:
+        return None
+
+    origin = spec.origin
+    if origin is None or not os.path.exists(origin):
+        return [origin, None]
+    return [origin, os.path.getmtime(origin)]
+
+
+def _compute_env_ids_manifest():
+    manifest = {}
+    known_ids = filtered_gym_env_ids()
+    for library_name in EXTERNAL_LIBRARIES:
+        if importlib.util.find_spec(library_name) is None:
+            continue
+
+        importlib.import_module(library_name)
+        new_ids = filtered_gym_env_ids() - known_ids
+        manifest[library_name] = sorted(new_ids)
+        known_ids.update(new_ids)
+    return manifest
+
+
+def env_ids_manifest(path=None):
+    """Return the Gym environment ids registered by external libraries.
+
+    Collecting these requires importing the external libraries, which is slow.
+    If a path is given, the result is cached in that file and only recomputed
+    if Gym, the external libraries or their optional dependencies are
+    installed, removed or updated. The libraries are then only imported when
+    creating one of their environments.
+
+    Args:
+        path: optional location of the cache file
+
+    Returns:
+        A mapping from each installed external library to the environment ids
+        it registers
+    """
+    if not path:
+        return _compute_env_ids_manifest()
+
+    path = os.path.expanduser(path)
+    signature = {
+        name: _library_signature(name)
+        for name in ("gym",) + EXTERNAL_LIBRARIES + OPTIONAL_DEPENDENCIES
+    }
+
+    try:
+        with open(path, "r") as file:
+            cached = json.load(file)
+        if cached["signature"] == signature:
+            return cached["ids"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    manifest = _compute_env_ids_manifest()
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as file:
+            json.dump({"signature": signature, "ids": manifest}, file)
+    except OSError:
+        pass
+    return manifest
+
+
 IDS = filtered_gym_env_ids()
 # kwarg trick from:
 # https://github.com/satwikkansal/wtfpython#-the-sticky-output-function
@@ -31,15 +110,24 @@ ENVS = {
     i: wrap_if_needed(lambda config, i=i: gym.make(i, **config.get("kwargs", {})))
     for i in IDS
 }
+# Opt in to caching with, e.g., RAYLAB_ENV_MANIFEST=~/.cache/raylab/envs.json
+MANIFEST = env_ids_manifest(os.environ.get(MANIFEST_PATH_ENV))
 
 
 def register_external_library_environments(library_name):
-    """Conveniency function for adding external environments to the global registry."""
+    """Conveniency function for adding external environments to the global registry.
+
+    The library is only imported when creating one of its environments if its
+    environment ids are in the cached manifest (see `MANIFEST_PATH_ENV`).
+    """
     if importlib.util.find_spec(library_name) is None:
         return
 
-    importlib.import_module(library_name)
-    new_ids = filtered_gym_env_ids() - IDS
+    if library_name in MANIFEST:
+        new_ids = set(MANIFEST[library_name]) - IDS
+    else:
+        importlib.import_module(library_name)
+        new_ids = filtered_gym_env_ids() - IDS
     for name in new_ids:
 
         @wrap_if_needed
@@ -91,6 +179,5 @@ ENVS.update(
 )
 
 
-register_external_library_environments("gym_cartpole_swingup")
-register_external_library_environments("gym_industrial")
-register_external_library_environments("pybullet_envs")
+for _library_name in EXTERNAL_LIBRARIES:
+    register_external_library_environments(_library_name)
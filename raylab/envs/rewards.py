@@ -9,6 +9,7 @@ import torch.nn as nn
 from raylab.tune.registry import _raylab_registry
 from raylab.tune.registry import RAYLAB_REWARD
 
+from .compiled import CompiledEnvFn
 from .utils import get_env_parameters
 from .utils import has_env_creator
 
@@ -34,10 +35,17 @@ def has_reward_fn(env_id: str) -> bool:
     return _raylab_registry.contains(RAYLAB_REWARD, env_id)
 
 
-def get_reward_fn(env_id: str, env_config: Optional[dict] = None) -> "RewardFn":
+def get_reward_fn(
+    env_id: str, env_config: Optional[dict] = None, compiled: bool = False
+) -> "RewardFn":
     """Return the reward funtion for the given environment name and configuration.
 
     Only returns reward functions for environments which have been registered with Tune.
+
+    Args:
+        env_id: the environment id
+        env_config: the environment configuration
+        compiled: whether to wrap the reward function in a `CompiledEnvFn`
     """
     assert has_env_creator(env_id), f"{env_id} environment not registered with Tune."
     assert has_reward_fn(env_id), f"{env_id} environment reward not registered."
@@ -46,6 +54,8 @@ def get_reward_fn(env_id: str, env_config: Optional[dict] = None) -> "RewardFn":
     reward_fn = _raylab_registry.get(RAYLAB_REWARD, env_id)(env_config)
     if env_config.get("time_aware", False):
         reward_fn = TimeAwareRewardFn(reward_fn)
+    if compiled:
+        reward_fn = CompiledEnvFn(reward_fn)
     return reward_fn
 
 
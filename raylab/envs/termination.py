@@ -5,6 +5,7 @@ import torch.nn as nn
 from raylab.tune.registry import _raylab_registry
 from raylab.tune.registry import RAYLAB_TERMINATION
 
+from .compiled import CompiledEnvFn
 from .utils import get_env_parameters
 from .utils import has_env_creator
 
@@ -17,10 +18,15 @@ def has_termination_fn(env_id: str) -> bool:
     return _raylab_registry.contains(RAYLAB_TERMINATION, env_id)
 
 
-def get_termination_fn(env_id, env_config=None):
+def get_termination_fn(env_id, env_config=None, compiled=False):
     """Return the termination funtion for the given environment name and configuration.
 
     Only returns for environments which have been registered with Tune.
+
+    Args:
+        env_id: the environment id
+        env_config: the environment configuration
+        compiled: whether to wrap the termination function in a `CompiledEnvFn`
     """
     assert has_env_creator(env_id), f"{env_id} environment not registered with Tune."
     assert has_termination_fn(
@@ -31,6 +37,8 @@ def get_termination_fn(env_id, env_config=None):
     termination_fn = _raylab_registry.get(RAYLAB_TERMINATION, env_id)(env_config)
     if env_config.get("time_aware", False):
         termination_fn = TimeAwareTerminationFn(termination_fn)
+    if compiled:
+        termination_fn = CompiledEnvFn(termination_fn)
     return termination_fn
 
 
@@ -98,7 +106,9 @@ class NoTermination(TerminationFn):
         super().__init__()
 
     def forward(self, state, action, next_state):
-        return torch.zeros(next_state.shape[:-1]).bool()
+        return torch.zeros(
+            next_state.shape[:-1], dtype=torch.bool, device=next_state.device
+        )
 
 
 @register(
@@ -213,7 +223,9 @@ class Walker2DTermination(TerminationFn):
     def forward(self, state, action, next_state):
         if self._terminate_when_unhealthy:
             return ~self._is_healthy(next_state)
-        return torch.zeros(next_state.shape[:-1]).bool()
+        return torch.zeros(
+            next_state.shape[:-1], dtype=torch.bool, device=next_state.device
+        )
 
 
 @register("Hopper-v3")
@@ -235,7 +247,9 @@ class HopperTermination(TerminationFn):
     def forward(self, state, action, next_state):
         if self._terminate_when_unhealthy:
             return ~self.is_healthy(next_state)
-        return torch.zeros(next_state.shape[:-1]).bool()
+        return torch.zeros(
+            next_state.shape[:-1], dtype=torch.bool, device=next_state.device
+        )
 
     def is_healthy(self, state):
         # pylint:disable=invalid-name
@@ -1,11 +1,17 @@
 """Custom Gym wrappers for environments."""
 from .correlated_irrelevant import CorrelatedIrrelevant
+from .correlated_irrelevant import VectorCorrelatedIrrelevant
 from .gaussian_random_walks import GaussianRandomWalks
+from .gaussian_random_walks import VectorGaussianRandomWalks
 from .linear_redundant import LinearRedundant
+from .linear_redundant import VectorLinearRedundant
 from .nonlinear_redundant import NonlinearRedundant
+from .nonlinear_redundant import VectorNonlinearRedundant
 from .random_irrelevant import RandomIrrelevant
+from .random_irrelevant import VectorRandomIrrelevant
 from .single_precision import SinglePrecision
 from .time_aware_env import AddRelativeTimestep
+from .vector import VectorSinglePrecision
 
 
 __all__ = [
@@ -16,4 +22,10 @@ __all__ = [
     "NonlinearRedundant",
     "RandomIrrelevant",
     "SinglePrecision",
+    "VectorCorrelatedIrrelevant",
+    "VectorGaussianRandomWalks",
+    "VectorLinearRedundant",
+    "VectorNonlinearRedundant",
+    "VectorRandomIrrelevant",
+    "VectorSinglePrecision",
 ]
@@ -1,11 +1,13 @@
 # pylint:disable=missing-module-docstring
 import gym
 import numpy as np
-from gym.spaces import Box
+from ray.rllib.env.vector_env import VectorEnv
 
 from .mixins import IrrelevantRedundantMixin
 from .mixins import RNGMixin
 from .utils import assert_flat_box_space
+from .utils import augment_box_space
+from .vector import VectorIrrelevantRedundant
 
 
 class CorrelatedIrrelevant(IrrelevantRedundantMixin, RNGMixin, gym.ObservationWrapper):
@@ -27,11 +29,8 @@ class CorrelatedIrrelevant(IrrelevantRedundantMixin, RNGMixin, gym.ObservationWr
         self._timestep: int = 0
         self._uvars: np.ndarray = None
 
-        original = self.observation_space
-        low = np.concatenate([original.low, [0] * self._size])
-        high = np.concatenate([original.high, [1] * self._size])
-        self.observation_space = Box(
-            low=low.astype(original.dtype), high=high.astype(original.dtype)
+        self.observation_space = augment_box_space(
+            self.observation_space, [0] * size, [1] * size
         )
 
         self._set_reward_if_possible()
@@ -52,3 +51,28 @@ class CorrelatedIrrelevant(IrrelevantRedundantMixin, RNGMixin, gym.ObservationWr
 
     def _added_vars(self, _) -> np.ndarray:
         return self._uvars ** self._timestep
+
+
+class VectorCorrelatedIrrelevant(VectorIrrelevantRedundant):
+    """Batched counterpart of :class:`CorrelatedIrrelevant` for vector envs.
+
+    Args:
+        env: RLlib vector environment
+        size: Number of random reward-irrelevant variables
+    """
+
+    def __init__(self, env: VectorEnv, size: int):
+        super().__init__(env, [0] * size, [1] * size)
+        self._timestep = np.zeros((self.num_envs, 1), dtype=np.int64)
+        self._uvars = np.zeros((self.num_envs, size))
+
+    def reset_vars(self, index: slice):
+        uvars = self._uvars[index]
+        uvars[:] = self.np_random.uniform(size=uvars.shape)
+        self._timestep[index] = 0
+
+    def step_vars(self):
+        self._timestep += 1
+
+    def _added_vars(self, observations: np.ndarray, index: slice, out: np.ndarray):
+        np.power(self._uvars[index], self._timestep[index], out=out)
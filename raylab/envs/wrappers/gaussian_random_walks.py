@@ -1,11 +1,13 @@
 """Wrapper for introducing irrelevant state variables."""
 import gym
 import numpy as np
-from gym.spaces import Box
+from ray.rllib.env.vector_env import VectorEnv
 
 from .mixins import IrrelevantRedundantMixin
 from .mixins import RNGMixin
 from .utils import assert_flat_box_space
+from .utils import augment_box_space
+from .vector import VectorIrrelevantRedundant
 
 
 class GaussianRandomWalks(IrrelevantRedundantMixin, RNGMixin, gym.ObservationWrapper):
@@ -26,10 +28,9 @@ class GaussianRandomWalks(IrrelevantRedundantMixin, RNGMixin, gym.ObservationWra
         self._scale = scale
         self._random_walk = None
 
-        original = self.env.observation_space
-        low = np.concatenate([original.low, [-np.inf] * size])
-        high = np.concatenate([original.high, [np.inf] * size])
-        self.observation_space = Box(low=low, high=high, dtype=original.dtype)
+        self.observation_space = augment_box_space(
+            self.env.observation_space, [-np.inf] * size, [np.inf] * size
+        )
 
         self._set_reward_if_possible()
         self._set_termination_if_possible()
@@ -49,3 +50,33 @@ class GaussianRandomWalks(IrrelevantRedundantMixin, RNGMixin, gym.ObservationWra
             loc=self._loc, scale=self._scale, size=self._size
         )
         return super().reset(**kwargs)
+
+
+class VectorGaussianRandomWalks(VectorIrrelevantRedundant):
+    """Batched counterpart of :class:`GaussianRandomWalks` for vector envs.
+
+    Arguments:
+        env: an RLlib vector environment
+        size: the number of random walks to append to the observation.
+        loc: mean of the Gaussian distribution
+        scale: stddev of the Gaussian distribution
+    """
+
+    def __init__(self, env: VectorEnv, size: int, loc: float = 0.0, scale: float = 1.0):
+        super().__init__(env, [-np.inf] * size, [np.inf] * size)
+        self._loc = loc
+        self._scale = scale
+        self._random_walk = np.zeros((self.num_envs, size))
+
+    def reset_vars(self, index: slice):
+        walks = self._random_walk[index]
+        walks[:] = self.np_random.normal(
+            loc=self._loc, scale=self._scale, size=walks.shape
+        )
+
+    def _added_vars(self, observations: np.ndarray, index: slice, out: np.ndarray):
+        walks = self._random_walk[index]
+        walks += self.np_random.normal(
+            loc=self._loc, scale=self._scale, size=walks.shape
+        )
+        out[:] = walks
@@ -3,12 +3,14 @@ from typing import Optional
 
 import gym
 import numpy as np
-from gym.spaces import Box
+from ray.rllib.env.vector_env import VectorEnv
 
 from .mixins import IrrelevantRedundantMixin
 from .mixins import RNGMixin
 from .utils import assert_flat_box_space
+from .utils import augment_box_space
 from .utils import check_redundant_size_compat
+from .vector import VectorIrrelevantRedundant
 
 
 class LinearRedundant(IrrelevantRedundantMixin, RNGMixin, gym.ObservationWrapper):
@@ -34,16 +36,16 @@ class LinearRedundant(IrrelevantRedundantMixin, RNGMixin, gym.ObservationWrapper
 
         self._wmat: np.ndarray = None
 
-        low = np.concatenate([original.low, [-np.inf] * size]).astype(original.dtype)
-        high = np.concatenate([original.high, [np.inf] * size]).astype(original.dtype)
-        self.observation_space = Box(low=low, high=high)
+        self.observation_space = augment_box_space(
+            original, [-np.inf] * size, [np.inf] * size
+        )
 
         self._set_reward_if_possible()
         self._set_termination_if_possible()
 
     @property
     def added_size(self):
-        return self.env.observation_space.shape[0]
+        return self._size
 
     def reset(self, **kwargs) -> np.ndarray:
         size = self._size
@@ -52,3 +54,29 @@ class LinearRedundant(IrrelevantRedundantMixin, RNGMixin, gym.ObservationWrapper
 
     def _added_vars(self, observation: np.ndarray) -> np.ndarray:
         return self._wmat @ observation[: self._size]
+
+
+class VectorLinearRedundant(VectorIrrelevantRedundant):
+    """Batched counterpart of :class:`LinearRedundant` for vector envs.
+
+    Args:
+        env: RLlib vector environment
+        size: Number of left-most features from the observation to use in
+            computing redundant variables. Defaults to the observation size
+    """
+
+    def __init__(self, env: VectorEnv, size: Optional[int] = None):
+        assert_flat_box_space(env.observation_space, self)
+        original = env.observation_space
+        size = size or original.shape[0]
+        check_redundant_size_compat(size, original)
+        super().__init__(env, [-np.inf] * size, [np.inf] * size)
+        self._wmat = np.zeros((self.num_envs, size, size))
+
+    def reset_vars(self, index: slice):
+        wmat = self._wmat[index]
+        wmat[:] = self.np_random.uniform(low=0.0, high=1.0, size=wmat.shape)
+
+    def _added_vars(self, observations: np.ndarray, index: slice, out: np.ndarray):
+        inputs = observations[:, : self.added_size, None]
+        np.matmul(self._wmat[index], inputs, out=out[..., None])
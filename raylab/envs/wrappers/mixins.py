@@ -7,6 +7,7 @@ from typing import Optional
 import gym.utils.seeding as seeding
 import numpy as np
 
+from .utils import drop_rightmost_variables
 from .utils import ignore_rightmost_variables
 
 
@@ -42,9 +43,19 @@ class IrrelevantRedundantMixin(ABC):
 
     def observation(self, observation: np.ndarray) -> np.ndarray:
         """Concatenate irrelevant/redundant variables to the observation."""
-        irrelevant_or_redundant = self._added_vars(observation)
-        observation = np.concatenate([observation, irrelevant_or_redundant])
-        return observation.astype(self.observation_space.dtype)
+        space = self.observation_space
+        size = space.shape[0] - self.added_size
+        augmented = np.empty(space.shape, dtype=space.dtype)
+        augmented[:size] = observation
+        augmented[size:] = self._added_vars(observation)
+        return augmented
+
+    def original_observations(self, observations):
+        """Remove the added variables from (batches of) observations.
+
+        Works with arrays and tensors, e.g., inside model rollouts.
+        """
+        return drop_rightmost_variables(observations, self.added_size)
 
     @staticmethod
     def wrap_env_function(func: callable, size: int) -> callable:
@@ -3,11 +3,13 @@ from typing import Optional
 
 import gym
 import numpy as np
-from gym.spaces import Box
+from ray.rllib.env.vector_env import VectorEnv
 
 from .mixins import IrrelevantRedundantMixin
 from .utils import assert_flat_box_space
+from .utils import augment_box_space
 from .utils import check_redundant_size_compat
+from .vector import VectorIrrelevantRedundant
 
 
 class NonlinearRedundant(IrrelevantRedundantMixin, gym.ObservationWrapper):
@@ -30,16 +32,16 @@ class NonlinearRedundant(IrrelevantRedundantMixin, gym.ObservationWrapper):
         self._size = size = size or original.shape[0]
         check_redundant_size_compat(size, original)
 
-        low = np.concatenate([original.low, [-1] * 2 * size]).astype(original.dtype)
-        high = np.concatenate([original.high, [1] * 2 * size]).astype(original.dtype)
-        self.observation_space = Box(low=low, high=high)
+        self.observation_space = augment_box_space(
+            original, [-1] * 2 * size, [1] * 2 * size
+        )
 
         self._set_reward_if_possible()
         self._set_termination_if_possible()
 
     @property
     def added_size(self):
-        return 2 * self.env.observation_space.shape[0]
+        return 2 * self._size
 
     def _added_vars(self, observation: np.ndarray) -> np.ndarray:
         cos = np.cos(observation[: self._size])
@@ -49,3 +51,26 @@ class NonlinearRedundant(IrrelevantRedundantMixin, gym.ObservationWrapper):
     @staticmethod
     def wrap_env_function(func: callable, size: int) -> callable:
         return IrrelevantRedundantMixin.wrap_env_function(func, size * 2)
+
+
+class VectorNonlinearRedundant(VectorIrrelevantRedundant):
+    """Batched counterpart of :class:`NonlinearRedundant` for vector envs.
+
+    Args:
+        env: RLlib vector environment
+        size: Number of left-most features from the observation to use in
+            computing redundant variables. Defaults to the observation size
+    """
+
+    def __init__(self, env: VectorEnv, size: Optional[int] = None):
+        assert_flat_box_space(env.observation_space, self)
+        original = env.observation_space
+        size = size or original.shape[0]
+        check_redundant_size_compat(size, original)
+        super().__init__(env, [-1] * 2 * size, [1] * 2 * size)
+        self._size = size
+
+    def _added_vars(self, observations: np.ndarray, index: slice, out: np.ndarray):
+        inputs = observations[:, : self._size]
+        np.cos(inputs, out=out[:, : self._size])
+        np.sin(inputs, out=out[:, self._size :])
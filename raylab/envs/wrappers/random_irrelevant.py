@@ -1,11 +1,13 @@
 # pylint:disable=missing-module-docstring
 import gym
 import numpy as np
-from gym.spaces import Box
+from ray.rllib.env.vector_env import VectorEnv
 
 from .mixins import IrrelevantRedundantMixin
 from .mixins import RNGMixin
 from .utils import assert_flat_box_space
+from .utils import augment_box_space
+from .vector import VectorIrrelevantRedundant
 
 
 class RandomIrrelevant(IrrelevantRedundantMixin, RNGMixin, gym.ObservationWrapper):
@@ -25,11 +27,8 @@ class RandomIrrelevant(IrrelevantRedundantMixin, RNGMixin, gym.ObservationWrappe
         self._loc = loc
         self._scale = scale
 
-        original = self.observation_space
-        low = np.concatenate([original.low, [-np.inf] * self._size])
-        high = np.concatenate([original.high, [np.inf] * self._size])
-        self.observation_space = Box(
-            low=low.astype(original.dtype), high=high.astype(original.dtype)
+        self.observation_space = augment_box_space(
+            self.observation_space, [-np.inf] * size, [np.inf] * size
         )
 
         self._set_reward_if_possible()
@@ -41,3 +40,22 @@ class RandomIrrelevant(IrrelevantRedundantMixin, RNGMixin, gym.ObservationWrappe
 
     def _added_vars(self, observation: np.ndarray) -> np.ndarray:
         return self.np_random.normal(loc=self._loc, scale=self._scale, size=self._size)
+
+
+class VectorRandomIrrelevant(VectorIrrelevantRedundant):
+    """Batched counterpart of :class:`RandomIrrelevant` for vector envs.
+
+    Args:
+        env: RLlib vector environment
+        size: Number of random reward-irrelevant variables
+        loc: Normal mean
+        scale: Normal standard deviation
+    """
+
+    def __init__(self, env: VectorEnv, size: int, loc: float = 0.0, scale: float = 1.0):
+        super().__init__(env, [-np.inf] * size, [np.inf] * size)
+        self._loc = loc
+        self._scale = scale
+
+    def _added_vars(self, observations: np.ndarray, index: slice, out: np.ndarray):
+        out[:] = self.np_random.normal(loc=self._loc, scale=self._scale, size=out.shape)
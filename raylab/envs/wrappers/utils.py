@@ -2,6 +2,7 @@
 import textwrap
 from typing import Any
 
+import numpy as np
 from gym.spaces import Box
 from gym.spaces import Space
 
@@ -37,6 +38,27 @@ def check_redundant_size_compat(size: int, space: Box):
     )
 
 
+def augment_box_space(space: Box, low: np.ndarray, high: np.ndarray) -> Box:
+    """Append bounds of added variables to a 1D Box space, keeping its dtype."""
+    return Box(
+        low=np.concatenate([space.low, low]).astype(space.dtype),
+        high=np.concatenate([space.high, high]).astype(space.dtype),
+        dtype=space.dtype,
+    )
+
+
+def drop_rightmost_variables(observations, size: int):
+    """Remove added variables from (batches of) observations.
+
+    Works with arrays and tensors with any number of leading dimensions.
+
+    Args:
+        observations: Array or tensor of augmented observations
+        size: Number of irrelevant/redundant variables
+    """
+    return observations[..., : observations.shape[-1] - size]
+
+
 def ignore_rightmost_variables(func: callable, size: int) -> callable:
     """Wrap base env reward/termination function to ignore added variables.
 
@@ -46,6 +68,10 @@ def ignore_rightmost_variables(func: callable, size: int) -> callable:
     """
 
     def env_fn(state, action, next_state):
-        return func(state[..., :-size], action, next_state[..., :-size])
+        return func(
+            drop_rightmost_variables(state, size),
+            action,
+            drop_rightmost_variables(next_state, size),
+        )
 
     return env_fn
@@ -0,0 +1,184 @@
+"""Wrappers for RLlib vector environments that process observations in batch."""
+from abc import ABCMeta
+from abc import abstractmethod
+from typing import List
+from typing import Optional
+
+import gym
+import gym.utils.seeding as seeding
+import numpy as np
+from gym.spaces import Box
+from ray.rllib.env.vector_env import VectorEnv
+
+from .utils import assert_flat_box_space
+from .utils import augment_box_space
+from .utils import drop_rightmost_variables
+from .utils import ignore_rightmost_variables
+
+
+class VectorObservationWrapper(VectorEnv, metaclass=ABCMeta):
+    """Base class for vector env wrappers that transform observations in batch.
+
+    Observations of all sub-environments are transformed with a single call to
+    :meth:`observations`, which receives the index of the sub-environments in
+    the batch as a slice. Subclasses with per-environment state should keep it
+    in arrays with the number of sub-environments as leading dimension, and
+    update it in :meth:`reset_vars` and :meth:`step_vars`.
+
+    Args:
+        env: RLlib vector environment
+        observation_space: Observation space of the wrapped environment
+        action_space: Action space of the wrapped environment. Defaults to the
+            base environment's action space
+
+    Attributes:
+        env: The base vector environment
+        np_random: A numpy RandomState separate from the environments'
+    """
+
+    def __init__(
+        self,
+        env: VectorEnv,
+        observation_space: gym.Space,
+        action_space: Optional[gym.Space] = None,
+    ):
+        super().__init__(
+            observation_space, action_space or env.action_space, env.num_envs
+        )
+        self.env = env
+        self.np_random, _ = seeding.np_random()
+
+    def seed(self, seed: Optional[int] = None) -> List[int]:
+        """Seed the wrapper's random number generator."""
+        self.np_random, seed_ = seeding.np_random(seed)
+        return [seed_]
+
+    def vector_reset(self) -> List[np.ndarray]:
+        observations = self.env.vector_reset()
+        index = slice(None)
+        self.reset_vars(index)
+        return list(self.observations(observations, index))
+
+    def reset_at(self, index: int) -> np.ndarray:
+        observation = self.env.reset_at(index)
+        index = slice(index, index + 1)
+        self.reset_vars(index)
+        return self.observations([observation], index)[0]
+
+    def vector_step(self, actions: List[np.ndarray]) -> tuple:
+        observations, rewards, dones, infos = self.env.vector_step(
+            self.actions(actions)
+        )
+        self.step_vars()
+        observations = list(self.observations(observations, slice(None)))
+        return observations, rewards, dones, infos
+
+    def get_unwrapped(self) -> List[gym.Env]:
+        return self.env.get_unwrapped()
+
+    @abstractmethod
+    def observations(self, observations: List[np.ndarray], index: slice) -> np.ndarray:
+        """Transform a batch of observations into a single array.
+
+        Args:
+            observations: Observations from the base environment
+            index: Sub-environments that produced the observations
+        """
+
+    def actions(self, actions: List[np.ndarray]) -> List[np.ndarray]:
+        """Transform a batch of actions before sending them to the base env."""
+        return actions
+
+    def reset_vars(self, index: slice):
+        """Reset the state of the sub-environments in `index`."""
+
+    def step_vars(self):
+        """Advance the state of all sub-environments by one timestep."""
+
+    def base_env_function(self, name: str) -> Optional[callable]:
+        """Return the base environment's reward/termination function, if any."""
+        if hasattr(self.env, name):
+            return getattr(self.env, name)
+        envs = self.env.get_unwrapped()
+        return getattr(envs[0], name, None) if envs else None
+
+
+class VectorSinglePrecision(VectorObservationWrapper):
+    """Ensures vector environment observations are single-precision floats.
+
+    Batched counterpart of :class:`~raylab.envs.wrappers.SinglePrecision`.
+    Converts the observations of all sub-environments with a single cast.
+    Only compatible with continuous state-action environments.
+    """
+
+    def __init__(self, env: VectorEnv):
+        try:
+            assert isinstance(env.observation_space, Box)
+            assert isinstance(env.action_space, Box)
+        except AssertionError as err:
+            msg = f"{type(self).__name__} only compatible with Box obs/act spaces"
+            raise ValueError(msg) from err
+
+        observation_space = Box(
+            low=env.observation_space.low.astype(np.float32),
+            high=env.observation_space.high.astype(np.float32),
+        )
+        action_space = Box(
+            low=env.action_space.low.astype(np.float32),
+            high=env.action_space.high.astype(np.float32),
+        )
+        super().__init__(env, observation_space, action_space)
+
+        for name in ("reward_fn", "termination_fn"):
+            function = self.base_env_function(name)
+            if function is not None:
+                setattr(self, name, function)
+
+    def observations(self, observations: List[np.ndarray], index: slice) -> np.ndarray:
+        return np.asarray(observations, dtype=self.observation_space.dtype)
+
+
+class VectorIrrelevantRedundant(VectorObservationWrapper):
+    """Batched counterpart of irrelevant/redundant observation wrappers.
+
+    Each step allocates a single array for the observations of all
+    sub-environments, in the final dtype, and subclasses write the added
+    variables into it in place. The array is not reused across steps, since
+    RLlib's samplers hold on to the observations they are given.
+
+    Args:
+        env: RLlib vector environment with a 1D Box observation space
+        low: Lower bounds of the added variables
+        high: Upper bounds of the added variables
+    """
+
+    def __init__(self, env: VectorEnv, low: np.ndarray, high: np.ndarray):
+        assert_flat_box_space(env.observation_space, self)
+        super().__init__(env, augment_box_space(env.observation_space, low, high))
+        self.added_size = len(low)
+
+        for name in ("reward_fn", "termination_fn"):
+            function = self.base_env_function(name)
+            if function is not None:
+                setattr(
+                    self, name, ignore_rightmost_variables(function, self.added_size)
+                )
+
+    def observations(self, observations: List[np.ndarray], index: slice) -> np.ndarray:
+        space = self.observation_space
+        size = space.shape[0] - self.added_size
+        augmented = np.empty((len(observations),) + space.shape, dtype=space.dtype)
+        augmented[:, :size] = observations
+        self._added_vars(augmented[:, :size], index, augmented[:, size:])
+        return augmented
+
+    def original_observations(self, observations):
+        """Remove the added variables from (batches of) observations.
+
+        Works with arrays and tensors, e.g., inside model rollouts.
+        """
+        return drop_rightmost_variables(observations, self.added_size)
+
+    @abstractmethod
+    def _added_vars(self, observations: np.ndarray, index: slice, out: np.ndarray):
+        """Write the added variables of the sub-environments in `index` to `out`."""
@@ -1,2 +1,5 @@
 """Customizes execution plan components."""
+from .data_parallel import TrainDataParallel
+from .train import BroadcastWeights
+from .train import LearnOnLocalWorker
 from .warmup import LearningStarts
@@ -0,0 +1,192 @@
+"""Data-parallel training of off-policy policies with multiple learners."""
+import socket
+from typing import Tuple
+
+import ray
+import torch.distributed as dist
+from ray.rllib import SampleBatch
+from ray.rllib.evaluation.worker_set import WorkerSet
+from ray.rllib.execution.common import _check_sample_batch_type
+from ray.rllib.execution.common import _get_global_vars
+from ray.rllib.execution.common import _get_shared_metrics
+from ray.rllib.execution.common import LEARN_ON_BATCH_TIMER
+from ray.rllib.execution.common import LEARNER_INFO
+from ray.rllib.execution.common import STEPS_TRAINED_COUNTER
+from ray.rllib.policy.policy import DEFAULT_POLICY_ID
+from ray.rllib.policy.policy import LEARNER_STATS_KEY
+from ray.rllib.utils.typing import SampleBatchType
+from ray.rllib.utils.typing import TrainerConfigDict
+
+
+class DataParallelLearner:
+    """Policy replica that averages gradients with its peers.
+
+    Meant to be used as a Ray actor. Joins a `torch.distributed` process group
+    with the gloo backend on construction, so all learners in a group must be
+    created concurrently.
+
+    The replica's replay buffer is a shard of the data: it only stores every
+    `world_size`-th added transition, starting at the learner's rank. If the
+    policy normalizes observations, it uses the statistics of its shard.
+
+    Args:
+        policy_cls: the off-policy policy class
+        obs_space: the observation space
+        action_space: the action space
+        config: the trainer config
+        rank: index of this learner in the group
+        world_size: number of learners in the group
+        init_method: URL specifying how to initialize the process group
+    """
+
+    # pylint:disable=too-many-arguments
+    def __init__(
+        self,
+        policy_cls: type,
+        obs_space,
+        action_space,
+        config: TrainerConfigDict,
+        rank: int,
+        world_size: int,
+        init_method: str,
+    ):
+        dist.init_process_group(
+            "gloo", init_method=init_method, rank=rank, world_size=world_size
+        )
+        # Replicas sample independent minibatches from their replay buffers
+        if config["seed"] is not None:
+            config = {**config, "seed": config["seed"] + rank}
+        self.policy = policy_cls(obs_space, action_space, config)
+        if config["policy"].get("compile", False):
+            self.policy.compile()
+        self.policy.optimizers.distributed = True
+        self.policy.replay.num_shards = world_size
+        self.policy.replay.shard_index = rank
+
+    def set_weights(self, weights: dict):
+        """Set the state of the policy."""
+        self.policy.set_weights(weights)
+
+    def learn_on_batch(self, samples: SampleBatch, global_vars: dict) -> dict:
+        """Add this learner's shard of the samples and run the policy's updates.
+
+        All learners must receive the same samples, so that they perform the
+        same number of updates.
+        """
+        self.policy.on_global_var_update(global_vars)
+        return self.policy.learn_on_batch(samples)
+
+    def get_weights(self) -> dict:
+        """Return the state of the policy."""
+        # Make sure the observation statistics, if any, are up to date
+        self.policy.replay.obs_stats()
+        return self.policy.get_weights()
+
+    def profiler_stats(self) -> dict:
+        """Summarize and reset the policy's profiled durations, if any."""
+        return self.policy.profiler_stats()
+
+
+def _free_address() -> str:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"tcp://127.0.0.1:{port}"
+
+
+class TrainDataParallel:
+    """Callable that trains the local policy with data-parallel learners.
+
+    Drop-in replacement for `TrainOneStep` or `LearnOnLocalWorker` with
+    off-policy policies. Each learner is a Ray actor with a full replica of
+    the policy and a shard of the replay buffer, sized so that all shards
+    together hold 'policy/buffer_size' transitions. New samples are sent to
+    all learners, which store their shard, sample independent minibatches
+    from it and average gradients with an all-reduce before every optimizer
+    step. The local policy keeps no samples and receives the trained state of
+    the first learner, including its observation statistics if the policy
+    normalizes observations.
+
+    Learners are created on the first call, so that they start from the state
+    of the local policy, e.g., after restoring from a checkpoint.
+
+    Only updates made through `OptimizerCollection.optimize` are averaged;
+    every learner must perform the same sequence of these updates.
+
+    If profiling is enabled, the first learner's profiler stats are added to
+    the learner stats on every call. This is once per training iteration
+    unless 'timesteps_per_iteration' or 'min_iter_time_s' group several calls
+    into one, in which case only the last call's stats are reported.
+
+    Examples:
+        >>> rollouts = ParallelRollouts(...)
+        >>> train_op = rollouts.for_each(TrainDataParallel(workers, config))
+    """
+
+    # pylint:disable=too-few-public-methods
+    def __init__(self, workers: WorkerSet, config: TrainerConfigDict):
+        self.workers = workers
+        self.config = config
+        self.learners = None
+
+    def __call__(self, batch: SampleBatchType) -> Tuple[SampleBatchType, dict]:
+        _check_sample_batch_type(batch)
+        metrics = _get_shared_metrics()
+        learn_timer = metrics.timers[LEARN_ON_BATCH_TIMER]
+        local_worker = self.workers.local_worker()
+        policy = local_worker.get_policy(DEFAULT_POLICY_ID)
+
+        with learn_timer:
+            if self.learners is None:
+                self.learners = self._make_learners(policy)
+
+            global_vars = _get_global_vars()
+            batch_ref = ray.put(batch)
+            infos = ray.get(
+                [
+                    learner.learn_on_batch.remote(batch_ref, global_vars)
+                    for learner in self.learners
+                ]
+            )
+            weights, profiler_stats = ray.get(
+                [
+                    self.learners[0].get_weights.remote(),
+                    self.learners[0].profiler_stats.remote(),
+                ]
+            )
+            policy.set_weights(weights)
+
+            infos[0][LEARNER_STATS_KEY].update(policy.get_exploration_info())
+            infos[0][LEARNER_STATS_KEY].update(profiler_stats)
+            info = {DEFAULT_POLICY_ID: infos[0]}
+            metrics.info[LEARNER_INFO] = info
+            learn_timer.push_units_processed(batch.count)
+        metrics.counters[STEPS_TRAINED_COUNTER] += batch.count
+
+        local_worker.set_global_vars(_get_global_vars())
+        return batch, info
+
+    def _make_learners(self, policy) -> list:
+        num_learners = self.config["num_learners"]
+        shard_size = -(-policy.config["buffer_size"] // num_learners)
+        config = {
+            **self.config,
+            "policy": {**self.config["policy"], "buffer_size": shard_size},
+        }
+        init_method = _free_address()
+        remote_cls = ray.remote(num_cpus=1)(DataParallelLearner)
+        learners = [
+            remote_cls.remote(
+                type(policy),
+                policy.observation_space,
+                policy.action_space,
+                config,
+                rank,
+                num_learners,
+                init_method,
+            )
+            for rank in range(num_learners)
+        ]
+        weights = ray.put(policy.get_weights())
+        ray.get([learner.set_weights.remote(weights) for learner in learners])
+        return learners
@@ -0,0 +1,75 @@
+# pylint:disable=missing-module-docstring
+from typing import Tuple
+
+import ray
+from ray.rllib.evaluation.worker_set import WorkerSet
+from ray.rllib.execution.common import _check_sample_batch_type
+from ray.rllib.execution.common import _get_global_vars
+from ray.rllib.execution.common import _get_shared_metrics
+from ray.rllib.execution.common import LEARN_ON_BATCH_TIMER
+from ray.rllib.execution.common import LEARNER_INFO
+from ray.rllib.execution.common import STEPS_TRAINED_COUNTER
+from ray.rllib.execution.common import WORKER_UPDATE_TIMER
+from ray.rllib.utils.typing import SampleBatchType
+
+
+class LearnOnLocalWorker:
+    """Callable that improves the local worker's policies on each batch.
+
+    Like RLlib's `TrainOneStep`, but leaves weight synchronization with remote
+    workers to :class:`BroadcastWeights`.
+
+    Examples:
+        >>> rollouts = ParallelRollouts(...)
+        >>> train_op = rollouts.for_each(LearnOnLocalWorker(workers))
+    """
+
+    # pylint:disable=too-few-public-methods
+    def __init__(self, workers: WorkerSet):
+        self.workers = workers
+
+    def __call__(self, batch: SampleBatchType) -> Tuple[SampleBatchType, dict]:
+        _check_sample_batch_type(batch)
+        metrics = _get_shared_metrics()
+        learn_timer = metrics.timers[LEARN_ON_BATCH_TIMER]
+        with learn_timer:
+            info = self.workers.local_worker().learn_on_batch(batch)
+            metrics.info[LEARNER_INFO] = info
+            learn_timer.push_units_processed(batch.count)
+        metrics.counters[STEPS_TRAINED_COUNTER] += batch.count
+
+        self.workers.local_worker().set_global_vars(_get_global_vars())
+        return batch, info
+
+
+class BroadcastWeights:
+    """Callable that periodically sends the local weights to remote workers.
+
+    Weights are sent without waiting for the remote workers, so that they keep
+    sampling with the previous weights until the update arrives.
+
+    Args:
+        workers: the worker set
+        interval: number of calls between broadcasts
+
+    Examples:
+        >>> train_op = rollouts.for_each(LearnOnLocalWorker(workers))
+        >>> train_op = train_op.for_each(BroadcastWeights(workers, interval=4))
+    """
+
+    # pylint:disable=too-few-public-methods
+    def __init__(self, workers: WorkerSet, interval: int = 1):
+        self.workers = workers
+        self.interval = interval
+        self.calls = 0
+
+    def __call__(self, item):
+        self.calls += 1
+        if self.calls % self.interval == 0 and self.workers.remote_workers():
+            metrics = _get_shared_metrics()
+            with metrics.timers[WORKER_UPDATE_TIMER]:
+                weights = ray.put(self.workers.local_worker().get_weights())
+                global_vars = _get_global_vars()
+                for worker in self.workers.remote_workers():
+                    worker.set_weights.remote(weights, global_vars)
+        return item
@@ -1,9 +1,10 @@
 """Custom loggers to use with Tune."""
 from ray.tune.logger import CSVLogger
 
+from .columnar_logger import ColumnarLogger
 from .progress_json_logger import ProgressJsonLogger
 
-DEFAULT_LOGGERS = (ProgressJsonLogger, CSVLogger)
+DEFAULT_LOGGERS = (ColumnarLogger, CSVLogger)
 
 try:
     from .torch_tensorboard_logger import TorchTBLogger
@@ -0,0 +1,133 @@
+# pylint:disable=missing-module-docstring
+import json
+import os
+import pickle
+import time
+from collections import defaultdict
+
+import numpy as np
+import ray.cloudpickle as cloudpickle
+from ray.rllib.utils import override
+from ray.tune.logger import Logger
+from ray.tune.result import EXPR_PARAM_FILE
+from ray.tune.result import EXPR_PARAM_PICKLE_FILE
+from ray.tune.utils.util import SafeFallbackEncoder
+from ray.tune.utils.util import flatten_dict
+
+COLUMNAR_PROGRESS_FILE = "progress.columns.pkl"
+
+
+class ColumnarLogger(Logger):
+    """Logger that buffers results and appends them to disk in column batches.
+
+    Each flush appends a single pickled mapping of column names to arrays to
+    the progress file. New keys may appear at any time: columns missing from
+    a batch are simply absent from it, and are filled with NaN when reading.
+    Use `read_columnar_progress` to load the file as a DataFrame.
+
+    Like Tune's JsonLogger, also saves the trial config to `params.json` and
+    `params.pkl`, which checkpoint restoration and experiment loading rely on.
+
+    Attributes:
+        flush_interval: Maximum number of results to buffer before writing
+        flush_secs: Maximum number of seconds between writes
+    """
+
+    flush_interval: int = 10
+    flush_secs: float = 60.0
+
+    @classmethod
+    def with_options(cls, **options) -> type:
+        """Return a subclass with the given class attributes overridden.
+
+        Useful for passing a customized logger class to Tune, e.g.,
+        `ColumnarLogger.with_options(flush_interval=100)`.
+        """
+        return type(cls.__name__, (cls,), options)
+
+    def __init__(self, config: dict, logdir: str, trial=None):
+        self.config = config
+        self._path = os.path.join(logdir, COLUMNAR_PROGRESS_FILE)
+        self._buffer = []
+        self._last_flush = time.time()
+        super().__init__(config, logdir, trial=trial)
+
+    @override(Logger)
+    def _init(self):
+        self.update_config(self.config)
+
+    @override(Logger)
+    def update_config(self, config):
+        self.config = config
+        with open(os.path.join(self.logdir, EXPR_PARAM_FILE), "w") as file:
+            json.dump(config, file, indent=2, sort_keys=True, cls=SafeFallbackEncoder)
+        with open(os.path.join(self.logdir, EXPR_PARAM_PICKLE_FILE), "wb") as file:
+            cloudpickle.dump(config, file)
+
+    @override(Logger)
+    def on_result(self, result):
+        self._buffer.append(
+            {
+                k: v
+                for k, v in flatten_dict(result).items()
+                if k.split("/", 1)[0] != "config"
+            }
+        )
+        if (
+            len(self._buffer) >= self.flush_interval
+            or time.time() - self._last_flush >= self.flush_secs
+        ):
+            self.flush()
+
+    @override(Logger)
+    def flush(self):
+        self._last_flush = time.time()
+        if not self._buffer:
+            return
+
+        columns = defaultdict(lambda: [None] * len(self._buffer))
+        for idx, result in enumerate(self._buffer):
+            for key, val in result.items():
+                columns[key][idx] = val
+        self._buffer = []
+
+        batch = {key: _to_array(values) for key, values in columns.items()}
+        with open(self._path, "ab") as file:
+            pickle.dump(batch, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @override(Logger)
+    def close(self):
+        self.flush()
+
+
+def _to_array(values: list) -> np.ndarray:
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        array = None
+    if array is None or array.ndim != 1:
+        # Sequence-valued entries: keep each as a single object
+        array = np.empty(len(values), dtype=object)
+        for idx, val in enumerate(values):
+            array[idx] = val
+    return array
+
+
+def read_columnar_progress(path: str):
+    """Load a progress file written by `ColumnarLogger` as a DataFrame.
+
+    Reading stops at the first incomplete batch, e.g., one cut off by a crash
+    or still being written, returning the results read so far.
+    """
+    import pandas as pd
+
+    frames = []
+    with open(path, "rb") as file:
+        while True:
+            try:
+                frames.append(pd.DataFrame(pickle.load(file)))
+            except (EOFError, pickle.UnpicklingError, ValueError):
+                break
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True, sort=False)
@@ -30,8 +30,6 @@ class TorchTBLogger(Logger):
             if isinstance(val, tuple(VALID_SUMMARY_TYPES)):
                 self._file_writer.add_scalar("/".join(["ray", "tune", key]), val, step)
 
-        self._file_writer.flush()
-
     @override(Logger)
     def flush(self):
         self._file_writer.flush()
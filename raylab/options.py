@@ -1,6 +1,7 @@
 """Utilities for default trainer configurations and descriptions."""
 import copy
 import inspect
+import pickle
 import textwrap
 from collections import namedtuple
 from dataclasses import dataclass
@@ -34,6 +35,9 @@ __all__ = [
 Config = Dict[str, Union[Json, "Config"]]
 Info = Dict[str, Union[str, "Info"]]
 
+# Marks defaults that failed to pickle
+_UNPICKLABLE = object()
+
 
 # ==============================================================================
 # Programatic config setting
@@ -116,6 +120,9 @@ class RaylabOptions:
     override_all_if_type_changes: Set[str] = field(default_factory=set)
     dict_info_key: str = field(default="__help__", init=False, repr=False)
     _options_to_set: List[Option] = field(default_factory=list, init=False, repr=False)
+    _frozen_defaults: Union[bytes, object, None] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def all_options_set(self) -> bool:
@@ -183,7 +190,7 @@ class RaylabOptions:
             See :meth:`set_option`.
         """
         new = type(self)(
-            defaults=copy.deepcopy(self.defaults),
+            defaults=self.copy_defaults(),
             infos=copy.deepcopy(self.infos),
             allow_unknown_subkeys=copy.deepcopy(self.allow_unknown_subkeys),
             override_all_if_type_changes=copy.deepcopy(
@@ -198,9 +205,29 @@ class RaylabOptions:
 
         return new
 
+    def copy_defaults(self) -> Config:
+        """Returns an independent deep copy of the default configurations.
+
+        Defaults are serialized once and every copy is deserialized from this
+        snapshot, which is considerably faster than `copy.deepcopy` for large
+        configs (e.g., those including RLlib's common config). Falls back to
+        `copy.deepcopy` if the defaults cannot be pickled, without retrying
+        until the defaults change.
+        """
+        if self._frozen_defaults is None:
+            try:
+                self._frozen_defaults = pickle.dumps(
+                    self.defaults, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            except (pickle.PicklingError, TypeError, AttributeError):
+                self._frozen_defaults = _UNPICKLABLE
+        if self._frozen_defaults is _UNPICKLABLE:
+            return copy.deepcopy(self.defaults)
+        return pickle.loads(self._frozen_defaults)
+
     def merge_defaults_with(self, config: Config) -> Config:
         """Deep merge the given config with the defaults."""
-        defaults = copy.deepcopy(self.defaults)
+        defaults = self.copy_defaults()
         new = deep_update(
             defaults,
             config,
@@ -233,6 +260,7 @@ class RaylabOptions:
                 same default value.
         """
         # pylint:disable=too-many-arguments
+        self._frozen_defaults = None
         if key.endswith(separator):
             if not override and not isinstance(default, (dict, type(None))):
                 raise ValueError(
@@ -377,11 +405,26 @@ class TrainerOptions(RaylabOptions):
     _rllib_keys: Set[str] = field(
         default_factory=lambda: set(COMMON_CONFIG.keys()), init=False, repr=False
     )
+    _rllib_defaults: Optional[Config] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def rllib_defaults(self) -> Config:
-        """Default configurations for RLlib trainers."""
-        return {k: v for k, v in self.defaults.items() if k in self._rllib_keys}
+        """Default configurations for RLlib trainers.
+
+        The selection of RLlib keys is cached, and a shallow copy is returned.
+        """
+        if self._rllib_defaults is None:
+            self._rllib_defaults = {
+                k: v for k, v in self.defaults.items() if k in self._rllib_keys
+            }
+        return self._rllib_defaults.copy()
+
+    def set_option(self, *args, **kwargs):
+        # pylint:disable=signature-differs
+        self._rllib_defaults = None
+        super().set_option(*args, **kwargs)
 
     def rllib_subconfig(self, config: dict) -> dict:
         """Get the rllib subconfig from `config`."""
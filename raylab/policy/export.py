@@ -0,0 +1,77 @@
+"""Export actors as self-contained TorchScript modules for serving."""
+import copy
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+from torch import Tensor
+
+from .modules.actor.policy.stochastic import StochasticPolicy
+
+ACTOR_FILE = "actor.pt"
+
+
+class _DeterministicSample(nn.Module):
+    """Maps observations to the deterministic action of a stochastic policy."""
+
+    def __init__(self, policy: StochasticPolicy):
+        super().__init__()
+        self.policy = policy
+
+    def forward(self, obs: Tensor) -> Tensor:  # pylint:disable=arguments-differ
+        act, _ = self.policy.deterministic(obs)
+        return act
+
+
+class ExportedActor(nn.Module):
+    """Maps raw observations to environment actions.
+
+    Normalizes observations with fixed statistics before calling the actor.
+    Actions are already squashed into the action space bounds, so the output
+    can be fed directly to the environment.
+
+    Args:
+        actor: Deterministic or stochastic policy. Stochastic policies output
+            their deterministic (e.g., mode) action.
+        obs_mean: Mean to subtract from observations
+        obs_std: Standard deviation to divide observations by
+    """
+
+    def __init__(self, actor: nn.Module, obs_mean: Tensor, obs_std: Tensor):
+        super().__init__()
+        if hasattr(actor, "deterministic"):
+            # Stochastic policy, possibly already scripted
+            actor = _DeterministicSample(actor)
+        self.actor = actor
+        self.register_buffer("obs_mean", obs_mean)
+        self.register_buffer("obs_std", obs_std)
+
+    def forward(self, obs: Tensor) -> Tensor:  # pylint:disable=arguments-differ
+        obs = (obs - self.obs_mean) / self.obs_std
+        return self.actor(obs)
+
+
+def export_actor(
+    actor: nn.Module, obs_stats: Optional[Tuple[np.ndarray, np.ndarray]] = None
+) -> torch.jit.ScriptModule:
+    """Compile a copy of an actor to a standalone TorchScript module.
+
+    The copy lives on CPU, in evaluation mode and without gradients, so that
+    exporting doesn't affect the training actor.
+
+    Args:
+        actor: Deterministic or stochastic policy
+        obs_stats: Optional mean and standard deviation for normalizing
+            observations, e.g., from `NumpyReplayBuffer.obs_stats`
+
+    Returns:
+        A scripted `ExportedActor`
+    """
+    actor = copy.deepcopy(actor).cpu().eval()
+    actor.requires_grad_(False)
+
+    mean, std = obs_stats if obs_stats is not None else (0.0, 1.0)
+    mean, std = (torch.as_tensor(np.asarray(x, dtype=np.float32)) for x in (mean, std))
+    return torch.jit.script(ExportedActor(actor, mean, std))
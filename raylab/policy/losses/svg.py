@@ -125,6 +125,10 @@ class TrajectorySVG(EnvFunctionsMixin, Loss):
         model: model that reproduces state and its log density
         actor: policy that reproduces action and its log density
         critic: state-value function
+
+    Attributes:
+        batched: whether to reproduce all episodes in parallel by padding them
+            to the same length. Otherwise, reproduces each episode sequentially
     """
 
     batch_keys: Tuple[str, str, str] = (
@@ -132,6 +136,7 @@ class TrajectorySVG(EnvFunctionsMixin, Loss):
         SampleBatch.ACTIONS,
         SampleBatch.NEXT_OBS,
     )
+    batched: bool = True
 
     def __init__(self, model: StochasticModel, actor: StochasticPolicy, critic: VValue):
         super().__init__()
@@ -155,6 +160,18 @@ class TrajectorySVG(EnvFunctionsMixin, Loss):
             self._rollout is not None
         ), "Rollout module not set. Did you call `set_reward_fn`?"
 
+        if self.batched:
+            total_ret = self.padded_episodes_return(episodes)
+        else:
+            total_ret = self.sequential_episodes_return(episodes)
+
+        sim_return_mean = total_ret / len(episodes)
+        loss = -sim_return_mean
+        info = {"loss(actor)": loss.item(), "sim_return_mean": sim_return_mean.item()}
+        return loss, info
+
+    def sequential_episodes_return(self, episodes: List[TensorDict]) -> Tensor:
+        """Sum of reproduced returns, unrolling one episode at a time."""
         total_ret = 0
         for episode in episodes:
             init_obs = episode[SampleBatch.CUR_OBS][0]
@@ -163,11 +180,57 @@ class TrajectorySVG(EnvFunctionsMixin, Loss):
 
             _, _, rewards = self._rollout(actions, next_obs, init_obs)
             total_ret += rewards.sum()
+        return total_ret
 
-        sim_return_mean = total_ret / len(episodes)
-        loss = -sim_return_mean
-        info = {"loss(actor)": loss.item(), "sim_return_mean": sim_return_mean.item()}
-        return loss, info
+    def padded_episodes_return(self, episodes: List[TensorDict]) -> Tensor:
+        """Sum of reproduced returns, unrolling all episodes in parallel.
+
+        Episodes are stacked along the batch dimension, so that the rollout
+        steps through time only once for the longest episode. Rewards from
+        padded timesteps are masked out, yielding the same value and gradients
+        as the sequential version.
+        """
+        actions, next_obs, init_obs, mask = pad_episodes(episodes)
+        _, _, rewards = self._rollout(actions, next_obs, init_obs)
+        return torch.where(mask, rewards, torch.zeros_like(rewards)).sum()
+
+
+def pad_episodes(episodes: List[TensorDict]) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
+    """Stack episodes of different lengths in time-major padded tensors.
+
+    Shorter episodes are padded by repeating their last action and next
+    observation, so that reproducing padded timesteps stays within the data
+    distribution and never produces non-finite values.
+
+    Args:
+        episodes: list of tensor dicts, one per episode
+
+    Returns:
+        A tuple with the padded actions and next observations, with shapes
+        (T, E, ...), the initial observations, with shape (E, ...), and a
+        boolean mask of valid timesteps, with shape (T, E), where T is the
+        longest episode length and E is the number of episodes
+    """
+    lengths = [len(ep[SampleBatch.ACTIONS]) for ep in episodes]
+    horizon = max(lengths)
+
+    def pad(tensor: Tensor, length: int) -> Tensor:
+        if length == horizon:
+            return tensor
+        padding = tensor[-1:].expand((horizon - length,) + tensor.shape[1:])
+        return torch.cat([tensor, padding])
+
+    actions = torch.stack(
+        [pad(ep[SampleBatch.ACTIONS], n) for ep, n in zip(episodes, lengths)], dim=1
+    )
+    next_obs = torch.stack(
+        [pad(ep[SampleBatch.NEXT_OBS], n) for ep, n in zip(episodes, lengths)], dim=1
+    )
+    init_obs = torch.stack([ep[SampleBatch.CUR_OBS][0] for ep in episodes])
+
+    timesteps = torch.arange(horizon, device=actions.device).unsqueeze(-1)
+    mask = timesteps < torch.as_tensor(lengths, device=actions.device)
+    return actions, next_obs, init_obs, mask
 
 
 class ReproduceRewards(nn.Module):
@@ -205,7 +268,9 @@ class ReproduceRewards(nn.Module):
 
         Note:
             Assumes the first tensor dimension of `acts` and `next_obs`
-            corresponds to the timestep and iterates over it.
+            corresponds to the timestep and iterates over it. Any remaining
+            batch dimensions (e.g., multiple episodes) are processed in
+            parallel.
         """
         # pylint:disable=arguments-differ
         obs_seq = []
@@ -35,9 +35,14 @@ class EnvFnMixin:
         self.dynamics_fn = None
 
     def set_reward_from_config(self):
-        """Build and set the reward function from environment configurations."""
+        """Build and set the reward function from environment configurations.
+
+        The function is compiled if the policy's `compile` option is set.
+        """
         env_id, env_config = self.config["env"], self.config["env_config"]
-        self.reward_fn = envs.get_reward_fn(env_id, env_config)
+        self.reward_fn = envs.get_reward_fn(
+            env_id, env_config, compiled=self.config["compile"]
+        )
         self._set_reward_hook()
 
     def set_reward_from_callable(self, function: RewardFn):
@@ -52,9 +57,14 @@ class EnvFnMixin:
         self._set_reward_hook()
 
     def set_termination_from_config(self):
-        """Build and set a termination function from environment configurations."""
+        """Build and set a termination function from environment configurations.
+
+        The function is compiled if the policy's `compile` option is set.
+        """
         env_id, env_config = self.config["env"], self.config["env_config"]
-        self.termination_fn = envs.get_termination_fn(env_id, env_config)
+        self.termination_fn = envs.get_termination_fn(
+            env_id, env_config, compiled=self.config["compile"]
+        )
         self._set_termination_hook()
 
     def set_termination_from_callable(self, function: TerminationFn):
@@ -1,7 +1,7 @@
 # pylint:disable=missing-module-docstring
-import copy
 import statistics as stats
 import warnings
+from dataclasses import asdict
 from dataclasses import dataclass
 from dataclasses import field
 from typing import List
@@ -179,18 +179,154 @@ class ReplayDataset(Dataset):
 # ======================================================================================
 
 
+class EnsembleSnapshots:
+    """Snapshots of each ensemble member's state in preallocated flat buffers.
+
+    The state of each member is laid out in one flat buffer per dtype, so that
+    saving or restoring a member copies its tensors in place without any new
+    allocations.
+
+    Args:
+        models: Model ensemble. Other modules are treated as a single member
+    """
+
+    def __init__(self, models: nn.Module):
+        members = _ensemble_members(models)
+        self._layouts = []
+        self._buffers = []
+        for member in members:
+            layout, sizes = [], {}
+            for name, tensor in member.state_dict(keep_vars=True).items():
+                offset = sizes.get(tensor.dtype, 0)
+                layout += [(name, tensor.dtype, offset, tensor.shape)]
+                sizes[tensor.dtype] = offset + tensor.numel()
+            device = next(member.parameters()).device
+            self._layouts += [layout]
+            self._buffers += [
+                {
+                    dtype: torch.empty(size, dtype=dtype, device=device)
+                    for dtype, size in sizes.items()
+                }
+            ]
+        self.saved = torch.zeros(len(members), dtype=torch.bool)
+
+    def __len__(self) -> int:
+        return len(self._layouts)
+
+    def reset(self):
+        """Mark every member as not saved."""
+        self.saved.fill_(False)
+
+    @torch.no_grad()
+    def save(self, models: nn.Module, indices: List[int]):
+        """Copy the current state of the given members into their snapshots."""
+        members = _ensemble_members(models)
+        for idx in indices:
+            for tensor, snapshot in self._pairs(members[idx], idx):
+                snapshot.copy_(tensor)
+            self.saved[idx] = True
+
+    @torch.no_grad()
+    def restore(self, models: nn.Module):
+        """Copy the snapshots of every saved member into its current state."""
+        members = _ensemble_members(models)
+        for idx in self.saved.nonzero(as_tuple=True)[0].tolist():
+            for tensor, snapshot in self._pairs(members[idx], idx):
+                tensor.copy_(snapshot)
+
+    def _pairs(self, member: nn.Module, idx: int) -> List[Tuple[Tensor, Tensor]]:
+        # Query tensors on every call: moving modules across devices replaces
+        # their buffers
+        state = member.state_dict(keep_vars=True)
+        buffers = self._buffers[idx]
+        pairs = []
+        for name, dtype, offset, shape in self._layouts[idx]:
+            snapshot = buffers[dtype][offset : offset + shape.numel()].view(shape)
+            pairs += [(state[name].data, snapshot)]
+        return pairs
+
+    def state_dict(self) -> dict:
+        """Returns the snapshot buffers and which members were saved."""
+        return {"buffers": self._buffers, "saved": self.saved}
+
+    def load_state_dict(self, state_dict: dict):
+        """Loads snapshots returned by :meth:`state_dict`."""
+        for buffers, loaded in zip(self._buffers, state_dict["buffers"]):
+            for dtype, buffer in buffers.items():
+                buffer.copy_(loaded[dtype])
+        self.saved.copy_(state_dict["saved"])
+
+
+def _ensemble_members(models: nn.Module) -> List[nn.Module]:
+    return list(models) if isinstance(models, nn.ModuleList) else [models]
+
+
+@dataclass
+class _MemberProgress:
+    """Early stopping state of each ensemble member."""
+
+    best_losses: Tensor
+    wait_counts: Tensor
+    frozen: Tensor
+
+    @classmethod
+    def initial(cls, size: int) -> "_MemberProgress":
+        return cls(
+            best_losses=torch.full((size,), float("inf")),
+            wait_counts=torch.zeros(size, dtype=torch.long),
+            frozen=torch.zeros(size, dtype=torch.bool),
+        )
+
+
 class EarlyStopping(pl.callbacks.EarlyStopping):
-    # pylint:disable=missing-docstring
+    """Per-member early stopping for model ensembles.
+
+    Tracks the loss of each ensemble member separately. Members whose loss
+    improves have their state saved to :class:`EnsembleSnapshots`. Members
+    that fail to improve for `patience` epochs are frozen, so that no
+    gradients are computed for them, while the others keep training. Training
+    stops once every member is frozen.
+
+    Args:
+        snapshots: Preallocated snapshots for the ensemble being trained.
+            Built on setup if not given
+        **kwargs: Arguments for :class:`pl.callbacks.EarlyStopping`
+    """
+
+    # pylint:disable=missing-function-docstring,too-many-instance-attributes
     _train_outputs: List[Tuple[Tensor, StatDict]]
     _val_outputs: List[Tuple[Tensor, StatDict]]
     _loss: Tuple[List[float], StatDict] = None
-    _module_state: Optional[dict] = None
+
+    def __init__(self, snapshots: Optional[EnsembleSnapshots] = None, **kwargs):
+        super().__init__(**kwargs)
+        # Summaries of the per-member state, for the base class' checkpoints
+        self.wait_count = 0
+        self.best_score = torch.tensor(float("inf"))
+        self.stopped_epoch = 0
+        self._snapshots = snapshots
+        self._members = _MemberProgress.initial(0)
+        # Restored from a checkpoint on setup, once the ensemble is known
+        self._loaded_state: Optional[dict] = None
+        self._frozen_params: List[nn.Parameter] = []
 
     def setup(self, trainer, pl_module, stage: str):
         super().setup(trainer, pl_module, stage)
         self._train_outputs = []
         self._val_outputs = []
 
+        if self._snapshots is None:
+            self._snapshots = EnsembleSnapshots(pl_module.model)
+        if self._loaded_state is None:
+            self._snapshots.reset()
+            self._members = _MemberProgress.initial(len(self._snapshots))
+        else:
+            self._snapshots.load_state_dict(self._loaded_state["snapshots"])
+            self._members = _MemberProgress(**self._loaded_state["members"])
+            self._loaded_state = None
+            frozen = self._members.frozen.nonzero(as_tuple=True)[0].tolist()
+            self.freeze(pl_module.model, frozen)
+
     def on_train_epoch_start(self, trainer, pl_module):
         self._train_outputs = []
         super().on_train_epoch_start(trainer, pl_module)
@@ -217,49 +353,105 @@ class EarlyStopping(pl.callbacks.EarlyStopping):
             trainer, pl_module, outputs, batch, batch_idx, dataloader_idx
         )
 
+    def on_train_end(self, trainer, pl_module):
+        self.unfreeze()
+        super().on_train_end(trainer, pl_module)
+
     def _run_early_stopping_check(self, trainer, pl_module):
+        losses, info = self.epoch_outputs()
         if self.patience is None:
             # Always save latest outputs
-            self.save_outputs()
-        else:
-            super()._run_early_stopping_check(trainer, pl_module)
-            # Save outputs only if improved or none have been logged yet
-            if self.wait_count == 0:  # Improved
-                self.save_outputs()
-                self.save_module_state(pl_module)
-            elif self._loss is None:
-                self.save_outputs()
-
-    def save_outputs(self):
+            self._loss = (losses.tolist(), info)
+            return
+
+        members = self._members
+        # Frozen members keep their best state regardless of loss fluctuations
+        improved = ~members.frozen & (
+            losses < members.best_losses - abs(self.min_delta)
+        )
+        members.best_losses = torch.where(improved, losses, members.best_losses)
+        members.wait_counts = torch.where(
+            improved, torch.zeros_like(members.wait_counts), members.wait_counts + 1
+        )
+        self.wait_count = int(members.wait_counts.min())
+        self.best_score = members.best_losses.mean()
+
+        # Save outputs only if improved or none have been logged yet
+        if improved.any() or self._loss is None:
+            self._loss = (members.best_losses.tolist(), info)
+        if improved.any():
+            indices = improved.nonzero(as_tuple=True)[0].tolist()
+            self._snapshots.save(pl_module.model, indices)
+
+        converged = ~(members.frozen | improved) & (
+            members.wait_counts >= self.patience
+        )
+        self.freeze(pl_module.model, converged.nonzero(as_tuple=True)[0].tolist())
+        members.frozen |= converged
+        if members.frozen.all():
+            self.stopped_epoch = trainer.current_epoch
+            trainer.should_stop = True
+
+    def epoch_outputs(self) -> Tuple[Tensor, StatDict]:
+        """Returns the mean loss of each member and statistics of the last epoch."""
         # Give preference to validation outputs
         epoch_outputs = self._val_outputs or self._train_outputs
 
         epoch_losses, epoch_infos = zip(*epoch_outputs)
-        model_losses = torch.stack(epoch_losses, dim=0).mean(dim=0).tolist()
+        model_losses = torch.stack(epoch_losses, dim=0).mean(dim=0).detach().cpu()
         model_infos = {k: stats.mean(i[k] for i in epoch_infos) for k in epoch_infos[0]}
-        self._loss = (model_losses, model_infos)
+        return model_losses, model_infos
+
+    def freeze(self, models: nn.Module, indices: List[int]):
+        """Stop computing gradients for the given ensemble members.
 
-    def save_module_state(self, pl_module):
-        self._module_state = copy.deepcopy(pl_module.state_dict())
+        Also clears their gradients, so that optimizers skip their parameters.
+        """
+        members = _ensemble_members(models)
+        for idx in indices:
+            for par in members[idx].parameters():
+                if par.requires_grad:
+                    par.requires_grad_(False)
+                    par.grad = None
+                    self._frozen_params += [par]
+
+    def unfreeze(self):
+        """Restore gradient computation for all frozen members."""
+        for par in self._frozen_params:
+            par.requires_grad_(True)
+        self._frozen_params = []
+
+    def restore_best(self, pl_module: LightningModel):
+        """Load the best saved state of each ensemble member."""
+        self.unfreeze()
+        if self._snapshots is not None:
+            self._snapshots.restore(pl_module.model)
 
     @property
-    def loss(self) -> Tuple[Tensor, TensorDict]:
+    def loss(self) -> Tuple[List[float], StatDict]:
         return self._loss
 
     @property
-    def module_state(self) -> dict:
-        return self._module_state
+    def snapshots(self) -> Optional[EnsembleSnapshots]:
+        return self._snapshots
 
     def on_save_checkpoint(self, trainer, pl_module):
         state = super().on_save_checkpoint(trainer, pl_module)
-        state.update(loss=self._loss, module=self._module_state)
+        snapshots = None if self._snapshots is None else self._snapshots.state_dict()
+        state.update(
+            loss=self._loss, snapshots=snapshots, members=asdict(self._members)
+        )
         return state
 
     def on_load_checkpoint(self, checkpointed_state):
         state_dict = checkpointed_state
         self._loss = state_dict["loss"]
-        self._module_state = copy.deepcopy(state_dict["module"])
-        used = set("loss module".split())
+        if state_dict["snapshots"] is not None:
+            self._loaded_state = {
+                "snapshots": state_dict["snapshots"],
+                "members": state_dict["members"],
+            }
+        used = set("loss snapshots members".split())
         super().on_load_checkpoint(
             {k: v for k, v in state_dict.items() if k not in used}
         )
@@ -301,9 +493,18 @@ class LightningTrainerSpec(DataClassJsonMixin):
             self.improvement_delta, float
         ), "Improvement threshold must be a scalar"
 
-    def build_trainer(self, check_val: bool) -> pl.Trainer:
-        """Returns the Pytorch Lightning configured with this spec."""
+    def build_trainer(
+        self, check_val: bool, snapshots: Optional[EnsembleSnapshots] = None
+    ) -> Tuple[pl.Trainer, EarlyStopping]:
+        """Returns the Pytorch Lightning configured with this spec.
+
+        Args:
+            check_val: Whether to run sanity checks on the validation data
+            snapshots: Preallocated snapshots of the ensemble's best states to
+                reuse across training runs
+        """
         early_stopping = EarlyStopping(
+            snapshots=snapshots,
             monitor=LightningModel.early_stop_on,
             min_delta=self.improvement_delta,
             patience=self.patience,
@@ -353,6 +554,8 @@ class LightningModelTrainer:
         pl_model: Pytorch Lightning model
         datamodule: Lightning data module
         spec: Specifications for training the model
+        snapshots: Best states of each model in the ensemble, reused across
+            calls to :meth:`optimize`
         training_loss: Loss function used for model training and evaluation
         warmup_loss: Loss function used for model warm-up.
     """
@@ -373,6 +576,7 @@ class LightningModelTrainer:
         self.spec = TrainingSpec.from_dict(config["model_training"])
         self.pl_model = LightningModel(model=models, loss=loss_fn, optimizer=optimizer)
         self.datamodule = DataModule(replay, self.spec.datamodule)
+        self.snapshots = EnsembleSnapshots(models)
         self.training_loss = self.warmup_loss = loss_fn
 
     def optimize(self, warmup: bool = False) -> Tuple[List[float], StatDict]:
@@ -389,7 +593,9 @@ class LightningModelTrainer:
         self.pl_model.configure_losses(loss_fn)
 
         trainer_spec = self.spec.warmup if warmup else self.spec.training
-        trainer, early_stopping = trainer_spec.build_trainer(check_val=warmup)
+        trainer, early_stopping = trainer_spec.build_trainer(
+            check_val=warmup, snapshots=self.snapshots
+        )
 
         self.run_training(
             model=self.pl_model, trainer=trainer, datamodule=self.datamodule
@@ -419,10 +625,8 @@ class LightningModelTrainer:
 
     @staticmethod
     def check_early_stopping(early_stopping: EarlyStopping, model: LightningModel):
-        """Restore best model parameters if training was early stopped."""
-        saved_state = early_stopping.module_state
-        if saved_state:
-            model.load_state_dict(saved_state)
+        """Restore best parameters of each model if training was early stopped."""
+        early_stopping.restore_best(model)
 
     @staticmethod
     def add_options(cls_: type) -> type:
@@ -8,6 +8,7 @@ from typing import Tuple
 from ray.rllib import SampleBatch
 
 from raylab.options import option
+from raylab.utils.profiler import profile
 from raylab.utils.timer import TimerStat
 from raylab.utils.types import StatDict
 
@@ -48,18 +49,19 @@ class MBPolicyMixin(ABC):
     @learner_stats
     def learn_on_batch(self, samples: SampleBatch) -> dict:
         # pylint:disable=missing-function-docstring
-        self.add_to_buffer(samples)
+        with profile("add_to_buffer"):
+            self.add_to_buffer(samples)
         self._learn_calls += 1
 
         warmup = self._learn_calls == 1
         if (self._learn_calls % self.config["model_update_interval"] == 0) or warmup:
-            with self.timers["model"] as timer:
+            with self.timers["model"] as timer, profile("train_dynamics_model"):
                 _, model_info = self.train_dynamics_model(warmup=warmup)
                 timer.push_units_processed(model_info["model_epochs"])
                 self._info.update(model_info)
 
-        with self.timers["policy"] as timer:
-            times = self.config["improvement_steps"]
+        with self.timers["policy"] as timer, profile("update_policy"):
+            times = self.num_improvement_steps(samples)
             policy_info = self.update_policy(times=times)
             timer.push_units_processed(times)
             self._info.update(policy_info)
@@ -96,9 +98,11 @@ class MBPolicyMixin(ABC):
             A dictionary of training statistics
         """
         for _ in range(times):
-            batch = self.replay.sample(self.config["batch_size"])
+            with profile("replay_sample"):
+                batch = self.replay.sample(self.config["batch_size"])
             batch = self.lazy_tensor_dict(batch)
-            info = self.improve_policy(batch)
+            with profile("improve_policy"):
+                info = self.improve_policy(batch)
 
         return info
 
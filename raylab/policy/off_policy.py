@@ -12,6 +12,7 @@ from ray.rllib.evaluation.episode import MultiAgentEpisode
 from ray.rllib.utils.typing import TensorType
 
 from raylab.options import option
+from raylab.utils.profiler import profile
 from raylab.utils.replay_buffer import NumpyReplayBuffer
 from raylab.utils.types import TensorDict
 
@@ -41,13 +42,31 @@ def off_policy_options(cls: type) -> type:
             per environment step.
         """,
     )
+    update_to_data_ratio = option(
+        "update_to_data_ratio",
+        default=None,
+        help="""Policy improvement steps per sampled timestep.
+
+        If set, overrides 'improvement_steps': each call to `learn_on_batch`
+        performs as many steps as the ratio times the number of new timesteps,
+        carrying over fractional steps to the next call. Keeps the number of
+        updates per sample fixed regardless of how batches arrive, e.g., with
+        asynchronous rollout workers.
+        """,
+    )
     batch_size = option(
         "batch_size",
         default=128,
         help="Size of replay buffer batches sampled on each call to `improve_policy`.",
     )
 
-    options = [buffer_size, std_obs, improvement_steps, batch_size]
+    options = [
+        buffer_size,
+        std_obs,
+        improvement_steps,
+        update_to_data_ratio,
+        batch_size,
+    ]
     for opt in options:
         cls = opt(cls)
 
@@ -58,6 +77,7 @@ class OffPolicyMixin(ABC):
     """Adds a replay buffer and standard procedures for `learn_on_batch`."""
 
     replay: NumpyReplayBuffer
+    _pending_updates: float = 0.0
 
     def build_replay_buffer(self):
         """Construct the experience replay buffer.
@@ -77,18 +97,32 @@ class OffPolicyMixin(ABC):
         Returns:
             An info dict from this iteration.
         """
-        self.add_to_buffer(samples)
+        with profile("add_to_buffer"):
+            self.add_to_buffer(samples)
 
         info = {}
         info.update(self.get_exploration_info())
 
-        for _ in range(int(self.config["improvement_steps"])):
-            batch = self.replay.sample(self.config["batch_size"])
+        for _ in range(self.num_improvement_steps(samples)):
+            with profile("replay_sample"):
+                batch = self.replay.sample(self.config["batch_size"])
             batch = self.lazy_tensor_dict(batch)
-            info.update(self.improve_policy(batch))
+            with profile("improve_policy"):
+                info.update(self.improve_policy(batch))
 
         return info
 
+    def num_improvement_steps(self, samples: SampleBatch) -> int:
+        """Number of policy improvement steps to perform for new samples."""
+        ratio = self.config["update_to_data_ratio"]
+        if ratio is None:
+            return int(self.config["improvement_steps"])
+
+        self._pending_updates += ratio * samples.count
+        steps = int(self._pending_updates)
+        self._pending_updates -= steps
+        return steps
+
     def add_to_buffer(self, samples: SampleBatch):
         """Add sample batch to replay buffer"""
         self.replay.add(samples)
@@ -141,6 +175,9 @@ class OffPolicyMixin(ABC):
             prev_reward_batch=prev_reward_batch,
         )
 
+    def _obs_stats(self):
+        return self.replay.obs_stats()
+
     def get_weights(self) -> dict:
         state = super().get_weights()
         state["replay"] = self.replay.state_dict()
@@ -6,12 +6,22 @@ from typing import Iterator
 
 from torch.optim import Optimizer
 
+from raylab.torch.utils import all_reduce_grads
+from raylab.utils.profiler import profile
+
 
 class OptimizerCollection(MutableMapping):
-    """A collection of PyTorch `Optimizer`s with names."""
+    """A collection of PyTorch `Optimizer`s with names.
+
+    Attributes:
+        distributed: whether to average gradients across all processes in the
+            default `torch.distributed` process group before each step in
+            :meth:`optimize`
+    """
 
     def __init__(self):
         self._optimizers = OrderedDict()
+        self.distributed = False
 
     def __setitem__(self, key: str, value: Optimizer):
         """Adds an optimizer to the collection.
@@ -61,20 +71,51 @@ class OptimizerCollection(MutableMapping):
         return len(self._optimizers)
 
     @contextlib.contextmanager
-    def optimize(self, name: str):
-        """Nullify grads before context and step optimizer afterwards.
+    def optimize(self, *names: str):
+        """Nullify grads before context and step optimizers afterwards.
 
         Sets grads to `None` instead of calling :meth:`Optimizer.zero_grad` for
         better performance. See the following video for more info:
 
         `https://youtu.be/9mS1fIYj1So?t=530`
+
+        Several optimizers may be passed to update them together with
+        :meth:`step` when the losses computed in the context are independent.
+        """
+        optimizers = [self[name] for name in names]
+        params = [p for o in optimizers for g in o.param_groups for p in g["params"]]
+        for par in params:
+            par.grad = None
+        with profile(f"optimize({','.join(names)})"):
+            with profile("forward_backward"):
+                yield
+            with profile("step"):
+                if self.distributed:
+                    all_reduce_grads(params)
+                self.step(*names)
+
+    def step(self, *names: str):
+        """Step the named optimizers.
+
+        Optimizers of the same class defining a `fused_step` class method, e.g.,
+        the multi-tensor optimizers in :mod:`raylab.torch.optim`, are stepped
+        with a single call to it.
+
+        Args:
+            *names: the names of the optimizers in the collection
         """
-        optimizer = self[name]
-        for group in optimizer.param_groups:
-            for par in group["params"]:
-                par.grad = None
-        yield
-        optimizer.step()
+        by_cls = OrderedDict()
+        for name in names:
+            optimizer = self[name]
+            by_cls.setdefault(type(optimizer), []).append(optimizer)
+
+        for cls, optimizers in by_cls.items():
+            fusable = all(getattr(o, "foreach", False) for o in optimizers)
+            if len(optimizers) > 1 and fusable and hasattr(cls, "fused_step"):
+                cls.fused_step(optimizers)
+            else:
+                for optimizer in optimizers:
+                    optimizer.step()
 
     def state_dict(self) -> dict:
         """Returns the state of each optimizer in the collection."""
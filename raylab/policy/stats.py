@@ -5,13 +5,26 @@ from typing import Callable
 
 from ray.rllib.policy.policy import LEARNER_STATS_KEY
 
+from raylab.utils.profiler import profile
+
 
 def learner_stats(func: Callable[[Any], dict]) -> Callable[[Any], dict]:
-    """Wrap function to return stats under learner stats key."""
+    """Wrap function to return stats under learner stats key.
+
+    If the policy (first argument) has a :class:`~raylab.utils.profiler.Profiler`,
+    profiles the call. Durations accumulate in the profiler until its stats are
+    reported, once per training iteration (see `TorchPolicy.profiler_stats`).
+    """
 
     @functools.wraps(func)
     def wrapped(*args, **kwargs):
-        stats = func(*args, **kwargs)
+        profiler = getattr(args[0], "profiler", None) if args else None
+        if profiler is None or profiler.active:
+            stats = func(*args, **kwargs)
+        else:
+            with profiler.activate(), profile(func.__name__):
+                stats = func(*args, **kwargs)
+
         nested = stats.get(LEARNER_STATS_KEY, {})
         unnested = {k: v for k, v in stats.items() if k != LEARNER_STATS_KEY}
         return {LEARNER_STATS_KEY: {**nested, **unnested}}
@@ -1,5 +1,8 @@
 """Base for all PyTorch policies."""
+import os
+import pickle
 import textwrap
+import warnings
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -7,8 +10,10 @@ from typing import Set
 from typing import Tuple
 from typing import Union
 
+import numpy as np
 import torch
 import torch.nn as nn
+from gym.spaces import Box
 from gym.spaces import Space
 from ray.rllib import Policy
 from ray.rllib import SampleBatch
@@ -28,9 +33,13 @@ from raylab.options import configure
 from raylab.options import option
 from raylab.options import RaylabOptions
 from raylab.torch.utils import convert_to_tensor
+from raylab.utils.profiler import profile
+from raylab.utils.profiler import Profiler
 from raylab.utils.types import StatDict
 from raylab.utils.types import TensorDict
 
+from .export import ACTOR_FILE
+from .export import export_actor
 from .modules import get_module
 from .optimizer_collection import OptimizerCollection
 
@@ -58,6 +67,50 @@ from .optimizer_collection import OptimizerCollection
     allow_unknown_subkeys=True,
 )
 @option("compile", False, help="Whether to optimize the policy's backend")
+@option(
+    "fast_actions",
+    False,
+    help="""Whether to use a streamlined path for deterministic actions.
+
+    Only applies to flat Box observation spaces when not exploring. Skips RLlib's
+    observation unpacking, the exploration object, and extra action outputs,
+    reusing a preallocated observation tensor between calls.
+    """,
+)
+@option(
+    "profiler/",
+    help="""Hierarchical profiling of `learn_on_batch`.
+
+    Reports the number of calls, total time and duration percentiles of each
+    hot-path section (replay sampling, tensor conversion, loss forward and
+    backward, optimizer steps, target updates, ...) under the `profile/` prefix
+    of the learner stats. Durations are aggregated over each training iteration.
+    """,
+)
+@option("profiler/enabled", False, help="Whether to profile training.")
+@option(
+    "profiler/percentiles",
+    [50, 90, 99],
+    help="Percentiles of section durations to report.",
+)
+@option(
+    "profiler/cuda_sync",
+    False,
+    help="""Whether to synchronize CUDA at section boundaries.
+
+    Attributes asynchronous kernels to the sections that launch them, at the
+    cost of stalling the device.
+    """,
+)
+@option(
+    "profiler/chrome_trace_dir",
+    None,
+    help="""Directory in which to save Chrome trace files, if any.
+
+    Each process appends its sections to its own `trace-<pid>.json` file on
+    every training iteration.
+    """,
+)
 class TorchPolicy(Policy):
     """A Policy that uses PyTorch as a backend.
 
@@ -72,10 +125,11 @@ class TorchPolicy(Policy):
         module: The policy's neural network module. Should be compilable to
             TorchScript
         optimizers: The optimizers bound to the neural network (or submodules)
+        profiler: The profiler for training hot paths, if enabled
         options: Configuration object for this class
     """
 
-    # pylint:disable=abstract-method
+    # pylint:disable=abstract-method,too-many-instance-attributes
     observation_space: Space
     action_space: Space
     config: dict
@@ -83,6 +137,7 @@ class TorchPolicy(Policy):
     device: torch.device
     module: nn.Module
     optimizers: OptimizerCollection
+    profiler: Optional[Profiler]
     options: RaylabOptions = RaylabOptions()
 
     def __init__(self, observation_space: Space, action_space: Space, config: dict):
@@ -95,6 +150,7 @@ class TorchPolicy(Policy):
         self.module.to(self.device)
 
         self.optimizers = self._make_optimizers()
+        self.profiler = Profiler.from_config(self.config["profiler"])
 
         # === Policy attributes ===
         self.dist_class = action_dist
@@ -102,6 +158,18 @@ class TorchPolicy(Policy):
         self.framework = "torch"  # Needed to create exploration
         self.exploration = self._create_exploration()
 
+        # Reused for deterministic actions in the fast path. None if disabled
+        self._obs_buffer: Optional[Tensor] = None
+        if self.config["fast_actions"] and self._is_flat_box(observation_space):
+            self._obs_buffer = torch.empty(
+                (0,) + observation_space.shape, device=self.device
+            )
+        elif self.config["fast_actions"]:
+            warnings.warn(
+                f"Fast actions requested for observation space {observation_space},"
+                " but only flat Box spaces are supported. Using the default path."
+            )
+
     # ==========================================================================
     # PublicAPI
     # ==========================================================================
@@ -156,6 +224,9 @@ class TorchPolicy(Policy):
     ) -> Tuple[TensorType, List[TensorType], Dict[str, TensorType]]:
         # pylint:disable=too-many-arguments,too-many-locals
         explore = explore if explore is not None else self.config["explore"]
+        if self._obs_buffer is not None and not explore and not state_batches:
+            return self._compute_deterministic_actions(obs_batch)
+
         timestep = timestep if timestep is not None else self.global_timestep
 
         input_dict = self.lazy_tensor_dict(
@@ -251,13 +322,25 @@ class TorchPolicy(Policy):
         # Optimizer state dicts don't store tensors, only ids
         self.optimizers.load_state_dict(weights["optimizers"])
 
+    def profiler_stats(self) -> dict:
+        """Summarize and reset the profiled durations, if profiling is enabled.
+
+        Called by the trainer once per training iteration, which also appends
+        the recorded sections to the Chrome trace file, if any.
+
+        Returns:
+            The profiler's stats, or an empty dictionary without a profiler
+        """
+        return {} if self.profiler is None else self.profiler.stats()
+
     def convert_to_tensor(self, arr) -> Tensor:
         """Convert an array to a PyTorch tensor in this policy's device.
 
         Args:
             arr (array_like): object which can be converted using `np.asarray`
         """
-        return convert_to_tensor(arr, self.device)
+        with profile("convert_to_tensor"):
+            return convert_to_tensor(arr, self.device)
 
     def lazy_tensor_dict(self, sample_batch: SampleBatch) -> UsageTrackingDict:
         """Convert a sample batch into a dictionary of lazy tensors.
@@ -394,15 +477,82 @@ class TorchPolicy(Policy):
         # pylint:disable=unused-argument,no-self-use
         return {}
 
+    @staticmethod
+    def _is_flat_box(space: Space) -> bool:
+        return isinstance(space, Box) and len(space.shape) == 1
+
+    def _compute_deterministic_actions(
+        self, obs_batch: Union[List[TensorType], TensorType]
+    ) -> Tuple[np.ndarray, List[TensorType], StatDict]:
+        """Compute actions without exploration for flat observations.
+
+        Equivalent to `compute_actions` with `explore=False`, minus the extra
+        action outputs.
+        """
+        obs = np.asarray(obs_batch)
+        batch_size = obs.shape[0]
+        if self._obs_buffer.shape[0] < batch_size:
+            self._obs_buffer = torch.empty(
+                (batch_size,) + self.observation_space.shape, device=self.device
+            )
+        obs_tensor = self._obs_buffer[:batch_size]
+        obs_tensor.copy_(torch.from_numpy(obs))
+
+        dist_inputs, _ = self._compute_module_output(
+            {SampleBatch.CUR_OBS: obs_tensor, "is_training": False}, [], None
+        )
+        # pylint:disable=not-callable
+        action_dist = self.dist_class(dist_inputs, self.module)
+        # pylint:enable=not-callable
+        actions, _ = action_dist.deterministic_sample()
+        return actions.cpu().numpy(), [], {}
+
+    def _obs_stats(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Mean and stddev used to normalize observations before the module.
+
+        Subclasses which preprocess observations should override this so that
+        exported models reproduce the preprocessing.
+        """
+        # pylint:disable=no-self-use
+        return None
+
     # ==========================================================================
-    # Unimplemented Policy methods
+    # Export API
     # ==========================================================================
 
-    def export_model(self, export_dir):
-        pass
+    @override(Policy)
+    def export_model(self, export_dir: str):
+        """Save the policy's actor as a standalone TorchScript module.
 
-    def export_checkpoint(self, export_dir):
-        pass
+        The exported module maps raw observation batches to action batches,
+        including observation normalization and action squashing. Load it with
+        `torch.jit.load` or serve it with `raylab.utils.serving`.
+
+        Args:
+            export_dir: Directory in which to save the actor as `actor.pt`
+
+        Raises:
+            NotImplementedError: If the policy's module has no `actor`
+        """
+        if not hasattr(self.module, "actor"):
+            raise NotImplementedError(
+                f"{type(self).__name__}'s module has no actor to export"
+            )
+
+        os.makedirs(export_dir, exist_ok=True)
+        exported = export_actor(self.module.actor, self._obs_stats())
+        torch.jit.save(exported, os.path.join(export_dir, ACTOR_FILE))
+
+    @override(Policy)
+    def export_checkpoint(self, export_dir: str):
+        """Save the policy's weights as `policy_state.pkl`."""
+        os.makedirs(export_dir, exist_ok=True)
+        with open(os.path.join(export_dir, "policy_state.pkl"), "wb") as file:
+            pickle.dump(self.get_weights(), file)
+
+    # ==========================================================================
+    # Unimplemented Policy methods
+    # ==========================================================================
 
     def import_model_from_h5(self, import_file):
         pass
@@ -26,6 +26,7 @@ from .nonlinearities import SigmoidSquashTransform
 from .nonlinearities import SigmoidTransform
 from .nonlinearities import TanhSquashTransform
 from .nonlinearities import TanhTransform
+from .permutation import PermutationTransform
 
 
 __all__ = [
@@ -40,6 +41,7 @@ __all__ = [
     "InverseTransform",
     "MAF",
     "masks",
+    "PermutationTransform",
     "PiecewiseRQSCouplingTransform",
     "SigmoidTransform",
     "SigmoidSquashTransform",
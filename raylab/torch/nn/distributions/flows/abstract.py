@@ -102,9 +102,18 @@ class InverseTransform(ConditionalTransform):
 
 
 class CompositeTransform(ConditionalTransform):
-    # pylint:disable=missing-docstring
+    """Apply a sequence of transforms.
+
+    Permutations of features between transforms are fused, so that a stack of
+    coupling layers reorders its inputs at most once on entry and once on exit.
+    The fused layout is set on the coupling and permutation transforms in
+    place, so these should not be used outside the composite afterwards.
+    """
 
     def __init__(self, transforms, event_dim=None):
+        # pylint:disable=import-outside-toplevel,cyclic-import
+        from .permutation import fuse_permutations
+
         event_dim = event_dim or max(t.event_dim for t in transforms)
         super().__init__(event_dim=event_dim)
         assert self.event_dim >= max(t.event_dim for t in transforms), (
@@ -112,8 +121,10 @@ class CompositeTransform(ConditionalTransform):
             "of its components'"
         )
         transforms = self.unpack(transforms)
+        fuse_permutations(transforms)
         self.transforms = nn.ModuleList(transforms)
         self.inv_transforms = nn.ModuleList(transforms[::-1])
+        self.register_load_state_dict_post_hook(_fuse_loaded)
 
     @staticmethod
     def unpack(transforms):
@@ -149,3 +160,12 @@ class CompositeTransform(ConditionalTransform):
                 log_det, self.event_dim - transform.event_dim
             )
         return out, log_abs_det_jacobian
+
+
+def _fuse_loaded(module: CompositeTransform, _):
+    # pylint:disable=import-outside-toplevel,cyclic-import
+    from .permutation import fuse_permutations
+
+    # Runs after the components' own hooks, which lay out features according
+    # to the loaded masks and permutations
+    fuse_permutations(list(module.transforms))
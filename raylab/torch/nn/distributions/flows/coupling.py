@@ -30,6 +30,8 @@ import warnings
 from abc import ABCMeta
 from abc import abstractmethod
 from typing import Dict
+from typing import Optional
+from typing import Tuple
 
 import numpy as np
 import torch
@@ -47,6 +49,8 @@ from .utils import sum_rightmost
 class CouplingTransform(ConditionalTransform, metaclass=ABCMeta):
     """A base class for coupling layers. Supports 1D inputs (*, D), where D >= 2."""
 
+    # pylint:disable=too-many-instance-attributes
+
     def __init__(
         self,
         mask,
@@ -80,6 +84,20 @@ class CouplingTransform(ConditionalTransform, metaclass=ABCMeta):
         self.num_transform_features = len(self.transform_features)
         assert self.num_identity_features + self.num_transform_features == self.features
 
+        # Inputs are gathered into contiguous blocks of identity and transform
+        # features, which are concatenated and scattered back to the original
+        # order. The gathering orders are derived from the mask, so they are
+        # left out of the state dict and recomputed after loading one.
+        self.identity_first = True
+        self.reorder_inputs = False
+        self.reorder_outputs = False
+        self.register_buffer("input_order", indexes.clone(), persistent=False)
+        self.register_buffer("input_inverse", indexes.clone(), persistent=False)
+        self.register_buffer("output_order", indexes.clone(), persistent=False)
+        self.register_buffer("output_inverse", indexes.clone(), persistent=False)
+        self.use_mask_layout()
+        self.register_load_state_dict_post_hook(_reset_layout)
+
         self.transform_net = transform_net_create_fn(
             self.num_identity_features,
             self.num_transform_features * self.transform_dim_multiplier,
@@ -91,10 +109,91 @@ class CouplingTransform(ConditionalTransform, metaclass=ABCMeta):
                 features=self.num_identity_features
             )
 
+    def use_mask_layout(self):
+        """Gather and scatter features according to the mask.
+
+        Masks that already define contiguous blocks of features, such as
+        mid-split masks, are split without reordering the inputs.
+        """
+        indexes = torch.arange(self.features, device=self.identity_features.device)
+        transform_first = torch.cat([self.transform_features, self.identity_features])
+        if torch.equal(transform_first, indexes):
+            self.set_input_layout(identity_first=False)
+            self.set_output_order(None)
+        else:
+            order = torch.cat([self.identity_features, self.transform_features])
+            self.set_input_layout(identity_first=True, order=order)
+            self.set_output_order(torch.argsort(order))
+
+    def set_input_layout(
+        self, identity_first: bool, order: Optional[torch.Tensor] = None
+    ):
+        """Set how inputs are split into blocks of identity and transform features.
+
+        Used to fuse the reordering of features across consecutive layers, so
+        that features are selected by position without gathering the inputs.
+
+        Args:
+            identity_first: whether the block of identity features precedes the
+                block of transform features
+            order: optional indices gathering the inputs into these blocks.
+                Inputs are expected to be already laid out in blocks if None
+        """
+        self.identity_first = identity_first
+        self.reorder_inputs = self._set_ordering(
+            order, self.input_order, self.input_inverse
+        )
+
+    def set_output_order(self, order: Optional[torch.Tensor]):
+        """Set the indices gathering the concatenated blocks into the outputs.
+
+        Args:
+            order: optional indices applied to the concatenation of identity
+                and transform features. The blocks are output as is if None
+        """
+        self.reorder_outputs = self._set_ordering(
+            order, self.output_order, self.output_inverse
+        )
+
+    @staticmethod
+    def _set_ordering(
+        order: Optional[torch.Tensor], forward: torch.Tensor, inverse: torch.Tensor
+    ) -> bool:
+        indexes = torch.arange(len(forward), device=forward.device)
+        order = indexes if order is None else order.to(indexes.device)
+        forward.copy_(order)
+        inverse.copy_(torch.argsort(order))
+        return not torch.equal(order, indexes)
+
+    def _split(
+        self, inputs, order: torch.Tensor, reorder: bool
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        if reorder:
+            inputs = inputs.index_select(-1, order)
+        if self.identity_first:
+            identity_split = inputs[..., : self.num_identity_features]
+            transform_split = inputs[..., self.num_identity_features :]
+        else:
+            transform_split = inputs[..., : self.num_transform_features]
+            identity_split = inputs[..., self.num_transform_features :]
+        return identity_split, transform_split
+
+    def _merge(
+        self, identity_split, transform_split, order: torch.Tensor, reorder: bool
+    ):
+        if self.identity_first:
+            outputs = torch.cat([identity_split, transform_split], dim=-1)
+        else:
+            outputs = torch.cat([transform_split, identity_split], dim=-1)
+        if reorder:
+            outputs = outputs.index_select(-1, order)
+        return outputs
+
     @override(ConditionalTransform)
     def encode(self, inputs, params: Dict[str, torch.Tensor]):
-        identity_split = inputs.index_select(-1, self.identity_features)
-        transform_split = inputs.index_select(-1, self.transform_features)
+        identity_split, transform_split = self._split(
+            inputs, self.input_order, self.reorder_inputs
+        )
 
         transform_params = self.transform_net(identity_split, params)
         transform_split, logabsdet = self.coupling_transform_forward(
@@ -107,16 +206,16 @@ class CouplingTransform(ConditionalTransform, metaclass=ABCMeta):
             )
             logabsdet += logabsdet_identity
 
-        outputs = torch.empty_like(inputs)
-        outputs.index_copy_(-1, self.identity_features, identity_split)
-        outputs.index_copy_(-1, self.transform_features, transform_split)
-
+        outputs = self._merge(
+            identity_split, transform_split, self.output_order, self.reorder_outputs
+        )
         return outputs, logabsdet
 
     @override(ConditionalTransform)
     def decode(self, inputs, params: Dict[str, torch.Tensor]):
-        identity_split = inputs.index_select(-1, self.identity_features)
-        transform_split = inputs.index_select(-1, self.transform_features)
+        identity_split, transform_split = self._split(
+            inputs, self.output_inverse, self.reorder_outputs
+        )
 
         logabsdet = 0.0
         if self.unconditional_transform is not None:
@@ -130,10 +229,9 @@ class CouplingTransform(ConditionalTransform, metaclass=ABCMeta):
         )
         logabsdet += logabsdet_split
 
-        outputs = torch.empty_like(inputs)
-        outputs.index_copy_(-1, self.identity_features, identity_split)
-        outputs.index_copy_(-1, self.transform_features, transform_split)
-
+        outputs = self._merge(
+            identity_split, transform_split, self.input_inverse, self.reorder_inputs
+        )
         return outputs, logabsdet
 
     @property
@@ -150,6 +248,12 @@ class CouplingTransform(ConditionalTransform, metaclass=ABCMeta):
         """Inverse of the coupling transform."""
 
 
+def _reset_layout(module: CouplingTransform, _):
+    # The loaded mask may differ from the one the layout was planned for, as
+    # with random masks
+    module.use_mask_layout()
+
+
 class AffineCouplingTransform(CouplingTransform):
     """An affine coupling layer that scales and shifts part of the variables.
     Reference:
@@ -12,6 +12,11 @@ from torch import nn
 class Invertible1x1Conv(nn.Module):
     """
     As introduced in Glow paper.
+
+    When gradients are disabled, the assembled weight, its inverse and the log
+    determinant are cached and only recomputed after the parameters change.
+    With gradients enabled, the inverse direction uses triangular solves with
+    the LU factors instead of a dense inverse.
     """
 
     def __init__(self, dim):
@@ -19,29 +24,72 @@ class Invertible1x1Conv(nn.Module):
         self.dim = dim
         Q = torch.nn.init.orthogonal_(torch.randn(dim, dim))
         P, L, U = torch.lu_unpack(*Q.lu())
-        self.P = P  # remains fixed during optimization
+        self.register_buffer("P", P)  # remains fixed during optimization
         self.L = nn.Parameter(L)  # lower triangular portion
         self.S = nn.Parameter(U.diag())  # "crop out" the diagonal to its own parameter
         self.U = nn.Parameter(
             torch.triu(U, diagonal=1)
         )  # "crop out" diagonal, stored in S
+        self._cache_key = None
+        self._cache = None
+
+    def _factors(self):
+        """ unit lower and upper triangular factors of W = P L U """
+        L = torch.tril(self.L, diagonal=-1) + torch.eye(
+            self.dim, dtype=self.L.dtype, device=self.L.device
+        )
+        U = torch.triu(self.U, diagonal=1) + torch.diag(self.S)
+        return L, U
 
     def _assemble_W(self):
         """ assemble W from its pieces (P, L, U, S) """
-        L = torch.tril(self.L, diagonal=-1) + torch.diag(torch.ones(self.dim))
-        U = torch.triu(self.U, diagonal=1)
-        W = self.P @ L @ (U + torch.diag(self.S))
+        L, U = self._factors()
+        W = self.P @ L @ U
         return W
 
+    def _log_abs_det(self):
+        return torch.sum(torch.log(torch.abs(self.S)))
+
+    def _solve(self, z, L, U):
+        """ solve x W = z for x using the LU factors of W """
+        z_t = z.reshape(-1, self.dim).t()
+        y_t, _ = torch.triangular_solve(z_t, U, upper=True, transpose=True)
+        w_t, _ = torch.triangular_solve(
+            y_t, L, upper=False, transpose=True, unitriangular=True
+        )
+        return (w_t.t() @ self.P.t()).reshape(z.shape)
+
+    def _cached(self):
+        """ W, W^{-1} and log|det W|, recomputed only if the parameters changed """
+        params = (self.L, self.S, self.U)
+        if self._cache_key is None or not all(
+            p.device == c.device and torch.equal(p, c)
+            for p, c in zip(params, self._cache_key)
+        ):
+            with torch.no_grad():
+                L, U = self._factors()
+                W = self.P @ L @ U
+                W_inv = self._solve(torch.eye(self.dim).to(W), L, U)
+                self._cache = (W, W_inv, self._log_abs_det())
+                # Compare values, since in-place updates through `.data` (e.g.,
+                # by optimizers or Polyak averaging) don't bump tensor versions
+                self._cache_key = tuple(p.detach().clone() for p in params)
+        return self._cache
+
     def forward(self, x):
-        W = self._assemble_W()
+        if torch.is_grad_enabled():
+            W, log_abs_det_jacobian = self._assemble_W(), self._log_abs_det()
+        else:
+            W, _, log_abs_det_jacobian = self._cached()
         z = x @ W
-        log_abs_det_jacobian = torch.sum(torch.log(torch.abs(self.S)))
         return z, log_abs_det_jacobian
 
     def backward(self, z):
-        W = self._assemble_W()
-        W_inv = torch.inverse(W)
-        x = z @ W_inv
-        log_abs_det_jacobian = -torch.sum(torch.log(torch.abs(self.S)))
+        if torch.is_grad_enabled():
+            x = self._solve(z, *self._factors())
+            log_abs_det_jacobian = -self._log_abs_det()
+        else:
+            _, W_inv, log_abs_det = self._cached()
+            x = z @ W_inv
+            log_abs_det_jacobian = -log_abs_det
         return x, log_abs_det_jacobian
@@ -43,19 +43,26 @@ class MAF(Transform):
         self.parity = parity
 
     def encode(self, inputs):
-        # we have to decode the x one at a time, sequentially
-        out = torch.empty_like(inputs)
-        log_abs_det_jacobian = torch.zeros(inputs.shape[:-1])
+        # Invert the autoregressive transform by fixed-point iteration: every pass
+        # updates all dimensions in parallel and, since the i-th output only
+        # depends on the previous ones, the first i dimensions are exact after i
+        # passes. Hence, at most `size` passes are needed, each a single call to
+        # the MADE net with no in-place updates or clones.
         inputs = inputs.flip(-1) if self.parity else inputs
-        for idx in range(self.size):
-            # clone to avoid in-place op errors if using IAF
-            scale_shift = self.net(out.clone())
+        out = torch.zeros_like(inputs)
+        scale = torch.zeros_like(inputs)
+        # Stopping early is only safe for the values, not their gradients
+        early_stop = not torch.is_grad_enabled()
+        for _ in range(self.size):
+            scale_shift = self.net(out)
             scale, shift = scale_shift.split(self.size, dim=-1)
-            out[..., idx] = (inputs[..., idx] - shift[..., idx]) * torch.exp(
-                -scale[..., idx]
-            )
+            new_out = (inputs - shift) * torch.exp(-scale)
+            converged = early_stop and torch.equal(new_out, out)
+            out = new_out
+            if converged:
+                break
 
-            log_abs_det_jacobian += -scale[..., idx]
+        log_abs_det_jacobian = -torch.sum(scale, dim=-1)
         return out, log_abs_det_jacobian
 
     def decode(self, inputs):
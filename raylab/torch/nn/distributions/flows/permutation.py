@@ -0,0 +1,121 @@
+"""Feature permutations and their fusion across sequential flows."""
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import torch
+import torch.nn as nn
+from ray.rllib.utils import override
+
+from .abstract import ConditionalTransform
+from .coupling import CouplingTransform
+
+
+class PermutationTransform(ConditionalTransform):
+    """Reorder the features in the last dimension of the inputs.
+
+    Args:
+        permutation: a 1-dim tensor such that output `i` is input
+            `permutation[i]`
+    """
+
+    def __init__(self, permutation):
+        super().__init__(event_dim=1)
+        permutation = torch.as_tensor(permutation)
+        if permutation.dim() != 1:
+            raise ValueError("Permutation must be a 1-dim tensor.")
+        self.register_buffer("permutation", permutation)
+        # The indices actually gathered, which differ from the permutation
+        # when fused with neighboring transforms. Left out of the state dict
+        # and recomputed after loading one.
+        self.reorder = True
+        self.register_buffer("output_order", permutation.clone(), persistent=False)
+        self.register_buffer("output_inverse", permutation.clone(), persistent=False)
+        self.set_output_order(permutation)
+        self.register_load_state_dict_post_hook(_reset_order)
+
+    def set_output_order(self, order: Optional[torch.Tensor]):
+        """Set the indices gathering the inputs into the outputs.
+
+        Used to fuse permutations of features across consecutive layers.
+
+        Args:
+            order: optional indices to gather the inputs with instead of the
+                permutation. The inputs are output as is if None
+        """
+        indexes = torch.arange(len(self.permutation), device=self.permutation.device)
+        order = indexes if order is None else order.to(indexes.device)
+        self.reorder = not torch.equal(order, indexes)
+        self.output_order.copy_(order)
+        self.output_inverse.copy_(torch.argsort(order))
+
+    @override(ConditionalTransform)
+    def encode(self, inputs, params: Dict[str, torch.Tensor]):
+        outputs = inputs.index_select(-1, self.output_order) if self.reorder else inputs
+        return outputs, inputs.new_zeros(inputs.shape[:-1])
+
+    @override(ConditionalTransform)
+    def decode(self, inputs, params: Dict[str, torch.Tensor]):
+        outputs = (
+            inputs.index_select(-1, self.output_inverse) if self.reorder else inputs
+        )
+        return outputs, inputs.new_zeros(inputs.shape[:-1])
+
+
+def _reset_order(module: PermutationTransform, _):
+    module.set_output_order(module.permutation)
+
+
+def fuse_permutations(transforms: List[nn.Module]):
+    """Minimize the reordering of features in a sequence of transforms.
+
+    Permutations are absorbed into the order in which features are laid out
+    between transforms. Runs of coupling layers share this layout, so that
+    features are only reordered when a coupling's mask does not split the
+    current layout into contiguous blocks. Features are restored to their
+    original order before any other transform and at the end of the sequence.
+
+    Sets the feature layouts of the coupling and permutation transforms in
+    place, without adding or removing transforms, so the result depends only
+    on their masks and permutations. The sequence should own these transforms,
+    since their layouts are only valid as part of it.
+
+    Args:
+        transforms: conditional transforms applied in sequence
+    """
+    # Feature at each position of the current layout, relative to the logical
+    # order of the sequence being transformed. `None` is the logical order.
+    layout: Optional[torch.Tensor] = None
+    # Last transform that may reorder its outputs into the next layout
+    previous: Optional[nn.Module] = None
+
+    def restore_order():
+        if layout is not None:
+            previous.set_output_order(torch.argsort(layout))
+
+    for transform in transforms:
+        if isinstance(transform, PermutationTransform):
+            # Output feature `i` is input feature `permutation[i]`
+            permutation = transform.permutation.cpu()
+            current = torch.arange(len(permutation)) if layout is None else layout
+            layout = torch.argsort(permutation)[current]
+            transform.set_output_order(None)
+            previous = transform
+        elif isinstance(transform, CouplingTransform):
+            identity = transform.identity_features.cpu()
+            transform_ = transform.transform_features.cpu()
+            transform_first = torch.cat([transform_, identity])
+            current = torch.arange(transform.features) if layout is None else layout
+            if torch.equal(current, transform_first):
+                transform.set_input_layout(identity_first=False)
+            else:
+                layout = torch.cat([identity, transform_])
+                order = torch.argsort(current)[layout]
+                transform.set_input_layout(identity_first=True, order=order)
+            transform.set_output_order(None)
+            previous = transform
+        else:
+            restore_order()
+            layout, previous = None, None
+
+    restore_order()
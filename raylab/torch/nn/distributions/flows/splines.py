@@ -36,9 +36,14 @@ DEFAULT_MIN_BIN_HEIGHT = 1e-3
 DEFAULT_MIN_DERIVATIVE = 1e-3
 
 
-def searchsorted(bin_locations, inputs, eps: float = 1e-6):
-    bin_locations[..., -1] += eps
-    return torch.sum(inputs[..., None] >= bin_locations, dim=-1) - 1
+def searchsorted(bin_locations, inputs):
+    """Index of the bin each input falls in, clamped to the valid bins.
+
+    Does not modify `bin_locations`. Inputs at or beyond the rightmost bin
+    location are assigned to the last bin.
+    """
+    bin_idx = torch.searchsorted(bin_locations, inputs[..., None], right=True) - 1
+    return bin_idx[..., 0].clamp(0, bin_locations.size(-1) - 2)
 
 
 def unconstrained_rational_quadratic_spline(
@@ -52,26 +57,22 @@ def unconstrained_rational_quadratic_spline(
     min_bin_height: float = DEFAULT_MIN_BIN_HEIGHT,
     min_derivative: float = DEFAULT_MIN_DERIVATIVE,
 ):
+    # Evaluate the spline on all inputs (clamped to its domain) and select the
+    # identity for those outside the interval. Avoids boolean-mask indexing,
+    # which produces dynamically shaped copies.
     inside_interval_mask = (inputs >= -tail_bound) & (inputs <= tail_bound)
-    outside_interval_mask = ~inside_interval_mask
-
-    outputs = torch.zeros_like(inputs)
-    logabsdet = torch.zeros_like(inputs)
 
     # Always use linear tails
-    unnormalized_derivatives = F.pad(unnormalized_derivatives, pad=(1, 1))
     constant = math.log(math.exp(1 - min_derivative) - 1)
-    unnormalized_derivatives[..., 0] = constant
-    unnormalized_derivatives[..., -1] = constant
-
-    outputs[outside_interval_mask] = inputs[outside_interval_mask]
-    logabsdet[outside_interval_mask] = torch.zeros_like(inputs[outside_interval_mask])
+    unnormalized_derivatives = F.pad(
+        unnormalized_derivatives, pad=(1, 1), mode="constant", value=constant
+    )
 
-    spline_out = rational_quadratic_spline(
-        inputs=inputs[inside_interval_mask],
-        unnormalized_widths=unnormalized_widths[inside_interval_mask, :],
-        unnormalized_heights=unnormalized_heights[inside_interval_mask, :],
-        unnormalized_derivatives=unnormalized_derivatives[inside_interval_mask, :],
+    spline_outputs, spline_logabsdet = rational_quadratic_spline(
+        inputs=inputs.clamp(-tail_bound, tail_bound),
+        unnormalized_widths=unnormalized_widths,
+        unnormalized_heights=unnormalized_heights,
+        unnormalized_derivatives=unnormalized_derivatives,
         inverse=inverse,
         left=-tail_bound,
         right=tail_bound,
@@ -81,7 +82,10 @@ def unconstrained_rational_quadratic_spline(
         min_bin_height=min_bin_height,
         min_derivative=min_derivative,
     )
-    outputs[inside_interval_mask], logabsdet[inside_interval_mask] = spline_out
+    outputs = torch.where(inside_interval_mask, spline_outputs, inputs)
+    logabsdet = torch.where(
+        inside_interval_mask, spline_logabsdet, torch.zeros_like(spline_logabsdet)
+    )
     return outputs, logabsdet
 
 
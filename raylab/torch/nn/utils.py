@@ -1,6 +1,12 @@
 """Utilities for manipulating neural network modules."""
+import contextlib
+from typing import Callable
+
 import torch
 import torch.nn as nn
+from torch import Tensor
+
+from raylab.utils.profiler import profiled
 
 from .modules.utils import get_activation
 
@@ -8,9 +14,13 @@ __all__ = [
     "get_activation",
     "update_polyak",
     "perturb_params",
+    "substitute_params",
+    "batched_params_call",
+    "memoize_forward",
 ]
 
 
+@profiled("update_polyak")
 def update_polyak(from_module: nn.Module, to_module: nn.Module, polyak: float):
     """Update parameters between modules by polyak averaging.
 
@@ -44,3 +54,128 @@ def perturb_params(target: nn.Module, origin: nn.Module, stddev: float):
 
     for param in to_perturb:
         param.data.add_(torch.randn_like(param) * stddev)
+
+
+@contextlib.contextmanager
+def substitute_params(module: nn.Module, flat_params: Tensor):
+    """Temporarily replace the parameters of a module by views of a flat vector.
+
+    Operations on the module inside the context are differentiable w.r.t.
+    `flat_params` and leave the original parameters untouched.
+
+    Args:
+        module: the module whose parameters to replace
+        flat_params: a vector with the same number of elements as the module's
+            parameters, in the order of `module.parameters()`
+    """
+    # pylint:disable=protected-access
+    named = [
+        (mod, name, param)
+        for mod in module.modules()
+        for name, param in mod.named_parameters(recurse=False)
+    ]
+    views, idx = {}, 0
+    for param in module.parameters():
+        views[param] = flat_params[idx : idx + param.numel()].view_as(param)
+        idx += param.numel()
+    try:
+        for mod, name, param in named:
+            mod._parameters[name] = views[param]
+        yield module
+    finally:
+        for mod, name, param in named:
+            mod._parameters[name] = param
+
+
+def batched_params_call(
+    module: nn.Module, flat_params: Tensor, func: Callable[[nn.Module], Tensor]
+) -> Tensor:
+    """Evaluate a function of a module for each of a stack of parameter vectors.
+
+    Uses `torch.vmap` to evaluate all parameter vectors in a single batched
+    forward pass. Falls back to evaluating them one at a time if it is
+    unavailable.
+
+    Args:
+        module: the module to evaluate
+        flat_params: a tensor of shape `(K, N)` where `N` is the number of
+            elements in the module's parameters
+        func: function from the module to a tensor
+
+    Returns:
+        The stacked outputs of `func` for each parameter vector
+    """
+
+    def call(params):
+        with substitute_params(module, params):
+            return func(module)
+
+    if hasattr(torch, "vmap"):
+        return torch.vmap(call)(flat_params)
+    return torch.stack([call(p) for p in flat_params.unbind(0)])
+
+
+def _detach(outputs):
+    if isinstance(outputs, Tensor):
+        return outputs.detach()
+    if isinstance(outputs, dict):
+        return {k: _detach(v) for k, v in outputs.items()}
+    if isinstance(outputs, (tuple, list)):
+        return type(outputs)(_detach(o) for o in outputs)
+    return outputs
+
+
+@contextlib.contextmanager
+def memoize_forward(module: nn.Module):
+    """Reuse the outputs of a module's forward pass for the same inputs.
+
+    Inside the context, outputs are cached by the identity and version of the
+    input tensor, so that repeated calls with the same inputs, e.g., a batch's
+    observations, only run the forward pass once. Calls with gradients
+    disabled reuse detached outputs. Calls with gradients enabled recompute
+    outputs cached without gradients and otherwise share the cached graph, so
+    they should be backpropagated together.
+
+    Updates to the module's parameters inside the context are not reflected in
+    the cached outputs. TorchScript modules are left untouched.
+
+    Args:
+        module: the module whose forward pass to memoize
+    """
+    if isinstance(module, torch.jit.ScriptModule):
+        yield module
+        return
+
+    forward = module.forward
+    overridden = "forward" in vars(module)
+    cache = {}
+
+    def memoized(inputs, *args, **kwargs):
+        # Tensor._version is bumped by in-place operations, which invalidate
+        # the cached outputs. PyTorch exposes no public alternative
+        # pylint:disable=protected-access
+        if args or kwargs or not isinstance(inputs, Tensor):
+            return forward(inputs, *args, **kwargs)
+
+        cached = cache.get(id(inputs))
+        hit = (
+            cached is not None and cached[0] is inputs and cached[1] == inputs._version
+        )
+        if hit and not torch.is_grad_enabled():
+            return _detach(cached[3])
+        if hit and cached[2]:
+            return cached[3]
+
+        outputs = forward(inputs)
+        # Keep a reference to the inputs so that their id is not reused
+        cache[id(inputs)] = (inputs, inputs._version, torch.is_grad_enabled(), outputs)
+        return outputs
+
+    module.forward = memoized
+    try:
+        yield module
+    finally:
+        if overridden:
+            module.forward = forward
+        else:
+            del module.forward
@@ -66,9 +66,28 @@ def line_search(
     backtrack_ratio=0.8,
     max_backtracks=15,
     atol=1e-7,
+    batched=False,
 ):
-    """Perform a linesearch on func with start x_0 and direction d_x."""
+    """Perform a linesearch on func with start x_0 and direction d_x.
+
+    If `batched` is True, `func` must map a stack of candidates to a vector
+    with their values. All step sizes are then evaluated in a single call and
+    the largest one satisfying the Armijo condition is accepted.
+    """
     # pylint:disable=too-many-arguments
+    if batched:
+        return _batched_line_search(
+            func,
+            x_0,
+            d_x,
+            expected_improvement,
+            y_0=y_0,
+            accept_ratio=accept_ratio,
+            backtrack_ratio=backtrack_ratio,
+            max_backtracks=max_backtracks,
+            atol=atol,
+        )
+
     if y_0 is None:
         y_0 = func(x_0)
 
@@ -83,3 +102,38 @@ def line_search(
                 return x_new, expected_improvement * ratio, improvement
 
     return x_0, expected_improvement, 0
+
+
+def _batched_line_search(
+    func,
+    x_0,
+    d_x,
+    expected_improvement,
+    y_0,
+    accept_ratio,
+    backtrack_ratio,
+    max_backtracks,
+    atol,
+):
+    # pylint:disable=too-many-arguments
+    if not torch.is_tensor(x_0):
+        x_0 = torch.as_tensor(x_0, dtype=torch.get_default_dtype())
+    d_x = torch.as_tensor(d_x, dtype=x_0.dtype)
+    if y_0 is None:
+        y_0 = func(x_0.unsqueeze(0))[0].item()
+
+    if expected_improvement >= atol and max_backtracks > 0:
+        ratios = backtrack_ratio ** torch.arange(max_backtracks, dtype=x_0.dtype)
+        x_new = x_0 - ratios.view((-1,) + (1,) * d_x.dim()) * d_x
+        improvement = y_0 - func(x_new)
+        # Armijo condition
+        accepted = improvement / (expected_improvement * ratios) >= accept_ratio
+        if accepted.any():
+            idx = accepted.nonzero()[0, 0]
+            return (
+                x_new[idx],
+                expected_improvement * ratios[idx].item(),
+                improvement[idx].item(),
+            )
+
+    return x_0, expected_improvement, 0
@@ -16,6 +16,11 @@ copies or substantial portions of the Software.
 Adapted from: https://github.com/Thrandis/EKFAC-pytorch
 """
 import contextlib
+from collections import defaultdict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
 
 import torch
 import torch.nn as nn
@@ -23,10 +28,51 @@ import torch.nn.functional as F
 from torch.optim import Optimizer
 
 
+@dataclass
+class _AsyncInverse:
+    """Processing of covariances on a background thread.
+
+    Attributes:
+        enabled: Whether to process covariances in the background
+        executor: Single thread running the processing, created on first use
+        future: Result of the processing still to be applied, if any
+    """
+
+    enabled: bool = False
+    executor: Optional[ThreadPoolExecutor] = None
+    future: Optional[Future] = None
+
+    def submit(self, func, *args):
+        """Run a function in the background unless another one is pending."""
+        if self.future is not None:
+            return
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        self.future = self.executor.submit(func, *args)
+
+    def pop_result(self):
+        """Return the result of the pending function if done, else None."""
+        if self.future is None or not self.future.done():
+            return None
+        future, self.future = self.future, None
+        return future.result()
+
+    def shutdown(self):
+        """Stop the background thread without waiting for pending work."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+
+
 class KFACMixin:
-    """Adds methods for forward hooks, covariance computation and updating."""
+    """Adds methods for forward hooks, covariance computation and updating.
+
+    Covariance updates and their inversions are batched across layers with
+    factors of equal size. Inversions may run on a background thread, in
+    which case preconditioning uses the most recent inverses available.
+    """
 
     # pylint:disable=assignment-from-no-return,invalid-name
+    _async: _AsyncInverse
 
     @contextlib.contextmanager
     def record_stats(self):
@@ -68,19 +114,18 @@ class KFACMixin:
 
     def step(self):  # pylint:disable=arguments-differ
         """Preconditions and applies gradients."""
+        groups = self.param_groups[:-1]
+        states = [self.state[group["params"][0]] for group in groups]
+
+        # Update convariances and inverses
+        self._update_covs(groups, states)
+        self._update_inverses(states)
+
         fisher_norm = 0.0
-        for group in self.param_groups[:-1]:
+        for group, state in zip(groups, states):
             # Getting parameters
             params = group["params"]
             weight, bias = params if len(params) == 2 else (params[0], None)
-            state = self.state[weight]
-
-            # Update convariances and inverses
-            state.setdefault("step", 0)
-            state.update(self._compute_covs(group, state))
-            if state["step"] % self.update_freq == 0:
-                state.update(self._process_covs(state))
-            state["step"] += 1
 
             # Preconditionning
             gw, gb, new_state = self._precond(weight, bias, group, state)
@@ -93,8 +138,8 @@ class KFACMixin:
                 bias.grad.data = gb
 
             # Cleaning
-            self.state[weight].pop("x", None)
-            self.state[weight].pop("gy", None)
+            state.pop("x", None)
+            state.pop("gy", None)
 
         fisher_norm += sum(
             (p.grad * p.grad).sum() for p in self.param_groups[-1]["params"]
@@ -107,18 +152,106 @@ class KFACMixin:
                 param.grad.data.mul_(scale)
                 param.data.sub_(param.grad.data, alpha=group["lr"])
 
-    def _compute_covs(self, group, state):
-        """Computes the covariances."""
+    def _update_covs(self, groups, states):
+        """Updates the running covariances, batching layers of equal size."""
+        factors = [self._factors(group, state) for group, state in zip(groups, states)]
+        shapes = [(x.shape, gy.shape) for x, gy, _ in factors]
+        for idxs in _indices_by_key(shapes):
+            xs = torch.stack([factors[i][0] for i in idxs])
+            gys = torch.stack([factors[i][1] for i in idxs])
+            xxts = xs @ xs.transpose(-1, -2)
+            ggts = gys @ gys.transpose(-1, -2)
+            if "xxt" in states[idxs[0]]:
+                old_xxts = torch.stack([states[i]["xxt"] for i in idxs])
+                old_ggts = torch.stack([states[i]["ggt"] for i in idxs])
+                xxts = old_xxts * (1.0 - self.alpha) + xxts * self.alpha
+                ggts = old_ggts * (1.0 - self.alpha) + ggts * self.alpha
+
+            for i, xxt, ggt in zip(idxs, xxts.unbind(), ggts.unbind()):
+                states[i].update(xxt=xxt, ggt=ggt, num_locations=factors[i][2])
+
+    def _update_inverses(self, states):
+        """Processes the covariances every `update_freq` steps.
+
+        If `async_inverse` is set, only the first processing is synchronous.
+        Later ones are submitted to a background thread, and their results are
+        applied on the first step after they finish. Updates are skipped while
+        a previous one is still running.
+        """
+        results = self._async.pop_result()
+        if results is not None:
+            for state, processed in zip(states, results):
+                state.update(processed)
+
+        step = states[0].get("step", 0) if states else 0
+        if step % self.update_freq == 0:
+            covs = [(s["xxt"], s["ggt"], s["num_locations"]) for s in states]
+            initialized = step > 0
+            if self._async.enabled and initialized:
+                self._async.submit(self._process_covs, covs)
+            else:
+                for state, processed in zip(states, self._process_covs(covs)):
+                    state.update(processed)
+
+        for state in states:
+            state["step"] = state.get("step", 0) + 1
+
+    def _process_covs(self, covs):
+        """Processes the covariances of all layers, batching equal sizes.
 
-    def _process_covs(self, state):
-        """Process the covariances for preconditioning gradients later."""
+        Args:
+            covs: List of input covariance, output gradient covariance and
+                number of locations for each layer
+
+        Returns:
+            A list of state updates for each layer
+        """
+        results = [None] * len(covs)
+        shapes = [(xxt.shape, ggt.shape) for xxt, ggt, _ in covs]
+        for idxs in _indices_by_key(shapes):
+            xxt = torch.stack([covs[i][0] for i in idxs])
+            ggt = torch.stack([covs[i][1] for i in idxs])
+            num_locations = xxt.new_tensor([covs[i][2] for i in idxs])
+            batch = self._process_cov_batch(xxt, ggt, num_locations)
+            for pos, i in enumerate(idxs):
+                results[i] = {k: v[pos] for k, v in batch.items()}
+        return results
+
+    def _factors(self, group, state):
+        """Returns the input and output gradient factors and number of locations.
+
+        Factors are matrices whose products with their transposes are the
+        covariances.
+        """
+
+    def _process_cov_batch(self, xxt, ggt, num_locations):
+        """Process stacked covariances for preconditioning gradients later."""
 
     def _precond(self, weight, bias, group, state):
         """Applies preconditioning."""
 
     def __del__(self):
-        for handle in self._fwd_handles + self._bwd_handles:
+        for handle in self._handles:
             handle.remove()
+        self._async.shutdown()
+
+
+def _indices_by_key(keys):
+    """Group sequence indices by their corresponding keys."""
+    groups = defaultdict(list)
+    for idx, key in enumerate(keys):
+        groups[key].append(idx)
+    return list(groups.values())
+
+
+def _add_to_diagonal(mats, values):
+    """Adds a value to the diagonal of each matrix in a batch."""
+    eye = torch.eye(mats.shape[-1], dtype=mats.dtype, device=mats.device)
+    return mats + values[..., None, None] * eye
+
+
+def _trace(mats):
+    return mats.diagonal(dim1=-2, dim2=-1).sum(-1)
 
 
 class KFAC(KFACMixin, Optimizer):
@@ -136,6 +269,8 @@ class KFAC(KFACMixin, Optimizer):
         alpha (float): Running average parameter (if == 1, no r. ave.).
         kl_clip (float): Scale the gradients by the squared fisher norm.
         eta (float): upper bound for gradient scaling.
+        async_inverse (bool): Process covariances on a background thread after
+            the first update.
     """
 
     # pylint:disable=invalid-name,too-many-instance-attributes
@@ -151,6 +286,7 @@ class KFAC(KFACMixin, Optimizer):
         kl_clip=1e-3,
         eta=1.0,
         lr=1.0,
+        async_inverse=False,
     ):
         # pylint:disable=too-many-arguments,too-many-locals
         assert isinstance(net, nn.Module), "KFAC needs access to module structure."
@@ -160,8 +296,8 @@ class KFAC(KFACMixin, Optimizer):
         self.update_freq = update_freq
         self.alpha = alpha
         self.eta = eta
-        self._fwd_handles = []
-        self._bwd_handles = []
+        self._async = _AsyncInverse(enabled=async_inverse)
+        self._handles = []
         self._recording = False
 
         param_groups = []
@@ -169,8 +305,10 @@ class KFAC(KFACMixin, Optimizer):
         for mod in net.modules():
             mod_class = type(mod).__name__
             if mod_class in ["Linear", "Conv2d"]:
-                self._fwd_handles += [mod.register_forward_pre_hook(self.save_input)]
-                self._bwd_handles += [mod.register_backward_hook(self.save_grad_out)]
+                self._handles += [
+                    mod.register_forward_pre_hook(self.save_input),
+                    mod.register_backward_hook(self.save_grad_out),
+                ]
                 info = (
                     (mod.kernel_size, mod.padding, mod.stride)
                     if mod_class == "Conv2d"
@@ -190,7 +328,7 @@ class KFAC(KFACMixin, Optimizer):
         super().__init__(param_groups, {"lr": lr})
         self.state["kl_clip"] = kl_clip
 
-    def _compute_covs(self, group, state):
+    def _factors(self, group, state):
         x, gy = state["x"], state["gy"]
         # Computation of xxt
         if group["layer_type"] == "Conv2d":
@@ -207,11 +345,6 @@ class KFAC(KFACMixin, Optimizer):
             ones = torch.ones_like(x[:1])
             x = torch.cat([x, ones], dim=0)
 
-        # Computation of xxt
-        xxt = x @ x.T
-        if "xxt" in state:
-            xxt = state["xxt"] * (1.0 - self.alpha) + xxt * self.alpha
-
         # Computation of ggt
         if group["layer_type"] == "Conv2d":
             gy = gy.data.permute(1, 0, 2, 3)
@@ -221,25 +354,18 @@ class KFAC(KFACMixin, Optimizer):
             gy = gy.data.T
             num_locations = 1
 
-        ggt = gy @ gy.T
-        if "ggt" in state:
-            ggt = state["ggt"] * (1.0 - self.alpha) + ggt * self.alpha
+        return x, gy, num_locations
 
-        return {"xxt": xxt, "ggt": ggt, "num_locations": num_locations}
-
-    def _process_covs(self, state):
-        xxt, ggt, num_locations = (state[k] for k in "xxt ggt num_locations".split())
+    def _process_cov_batch(self, xxt, ggt, num_locations):
         # Computes pi
-        pi = 1.0
+        pi = torch.ones_like(num_locations)
         if self.pi:
-            pi = (torch.trace(xxt) * ggt.shape[0]) / (torch.trace(ggt) * xxt.shape[0])
+            pi = (_trace(xxt) * ggt.shape[-1]) / (_trace(ggt) * xxt.shape[-1])
 
         # Regularizes and inverts
         eps = self.eps / num_locations
-        diag_xxt = torch.diag(torch.empty(xxt.shape[0]).fill_(torch.sqrt(eps * pi)))
-        diag_ggt = torch.diag(torch.empty(ggt.shape[0]).fill_(torch.sqrt(eps / pi)))
-        ixxt = (xxt + diag_xxt).inverse()
-        iggt = (ggt + diag_ggt).inverse()
+        ixxt = _add_to_diagonal(xxt, torch.sqrt(eps * pi)).inverse()
+        iggt = _add_to_diagonal(ggt, torch.sqrt(eps / pi)).inverse()
         return {"ixxt": ixxt, "iggt": iggt}
 
     def _precond(self, weight, bias, group, state):
@@ -305,6 +431,8 @@ class EKFAC(KFACMixin, Optimizer):
         alpha (float): Running average parameter (if == 1, no r. ave.).
         kl_clip (float): Scale the gradients by the squared fisher norm.
         eta (float): upper bound for gradient scaling.
+        async_inverse (bool): Process covariances on a background thread after
+            the first update.
     """
 
     # pylint:disable=invalid-name
@@ -318,6 +446,7 @@ class EKFAC(KFACMixin, Optimizer):
         kl_clip=1e-3,
         eta=1.0,
         lr=1.0,
+        async_inverse=False,
     ):
         # pylint:disable=too-many-arguments
         assert isinstance(net, nn.Module), "EKFAC needs access to module structure."
@@ -325,8 +454,8 @@ class EKFAC(KFACMixin, Optimizer):
         self.update_freq = update_freq
         self.alpha = alpha
         self.eta = eta
-        self._fwd_handles = []
-        self._bwd_handles = []
+        self._async = _AsyncInverse(enabled=async_inverse)
+        self._handles = []
         self._recording = False
 
         param_groups = []
@@ -334,8 +463,10 @@ class EKFAC(KFACMixin, Optimizer):
         for mod in net.modules():
             mod_class = type(mod).__name__
             if mod_class in ["Linear"]:
-                self._fwd_handles += [mod.register_forward_pre_hook(self.save_input)]
-                self._bwd_handles += [mod.register_backward_hook(self.save_grad_out)]
+                self._handles += [
+                    mod.register_forward_pre_hook(self.save_input),
+                    mod.register_backward_hook(self.save_grad_out),
+                ]
                 info = None
                 params = [mod.weight]
                 if mod.bias is not None:
@@ -351,7 +482,7 @@ class EKFAC(KFACMixin, Optimizer):
         super().__init__(param_groups, {"lr": lr})
         self.state["kl_clip"] = kl_clip
 
-    def _compute_covs(self, group, state):
+    def _factors(self, group, state):
         x, gy = state["x"], state["gy"]
 
         # Computation of xxt
@@ -359,32 +490,23 @@ class EKFAC(KFACMixin, Optimizer):
         if len(group["params"]) == 2:
             x = torch.cat([x, torch.ones_like(x[:1])], dim=0)
 
-        xxt = x @ x.T
-        if "xxt" in state:
-            xxt = state["xxt"] * (1.0 - self.alpha) + xxt * self.alpha
-
         # Computation of ggt
         gy = gy.data.T
         num_locations = 1
 
-        ggt = gy @ gy.T
-        if "ggt" in state:
-            ggt = state["ggt"] * (1.0 - self.alpha) + ggt * self.alpha
-
-        return {"xxt": xxt, "ggt": ggt, "num_locations": num_locations}
-
-    def _process_covs(self, state):
-        xxt, ggt = state["xxt"], state["ggt"]
+        return x, gy, num_locations
 
+    def _process_cov_batch(self, xxt, ggt, num_locations):
+        # pylint:disable=unused-argument
         # Regularizes and inverts
-        pi = (torch.trace(xxt) * ggt.shape[0]) / (torch.trace(ggt) * xxt.shape[0])
+        pi = (_trace(xxt) * ggt.shape[-1]) / (_trace(ggt) * xxt.shape[-1])
         eps = self.eps
-        diag_xxt = torch.diag(torch.empty(xxt.shape[0]).fill_(torch.sqrt(eps * pi)))
-        diag_ggt = torch.diag(torch.empty(ggt.shape[0]).fill_(torch.sqrt(eps / pi)))
+        xxt = _add_to_diagonal(xxt, torch.sqrt(eps * pi))
+        ggt = _add_to_diagonal(ggt, torch.sqrt(eps / pi))
 
-        sa, ua = torch.symeig(xxt + diag_xxt, eigenvectors=True)
-        sb, ub = torch.symeig(ggt + diag_ggt, eigenvectors=True)
-        m2 = sb.unsqueeze(1) * sa.unsqueeze(0)
+        sa, ua = torch.symeig(xxt, eigenvectors=True)
+        sb, ub = torch.symeig(ggt, eigenvectors=True)
+        m2 = sb.unsqueeze(-1) * sa.unsqueeze(-2)
         return {"ua": ua, "ub": ub, "m2": m2}
 
     def _precond(self, weight, bias, group, state):
@@ -14,7 +14,9 @@ Notes:
 """
 import math
 from typing import Callable
+from typing import Iterable
 from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import Tuple
 
@@ -23,7 +25,121 @@ import torch.nn as nn
 from torch.optim import Optimizer
 
 
-class RAdam(Optimizer):
+def _rectification(
+    beta1: float, beta2: float, step: int, degenerated_to_sgd: bool
+) -> Tuple[float, float]:
+    # pylint:disable=invalid-name
+    beta2_t = beta2 ** step
+    N_sma_max = 2 / (1 - beta2) - 1
+    N_sma = N_sma_max - 2 * step * beta2_t / (1 - beta2_t)
+
+    # more conservative since it's an approximated value
+    if N_sma >= 5:
+        step_size = math.sqrt(
+            (1 - beta2_t)
+            * (N_sma - 4)
+            / (N_sma_max - 4)
+            * (N_sma - 2)
+            / N_sma
+            * N_sma_max
+            / (N_sma_max - 2)
+        ) / (1 - beta1 ** step)
+    elif degenerated_to_sgd:
+        step_size = 1.0 / (1 - beta1 ** step)
+    else:
+        step_size = -1
+    return N_sma, step_size
+
+
+class _ForeachAdamMixin:
+    """Multi-tensor step shared by the Adam variants in this module.
+
+    Parameters with the same hyperparameters and step count are updated together
+    with `torch._foreach_*` kernels, instead of looping over each parameter.
+    Enabled by passing `foreach=True` to the optimizer's constructor.
+    """
+
+    # pylint:disable=too-few-public-methods
+    foreach: bool = False
+
+    @classmethod
+    def fused_step(cls, optimizers: Iterable[Optimizer]):
+        """Perform a single multi-tensor step for several optimizers of this class.
+
+        Args:
+            optimizers: optimizers whose parameters to update
+        """
+        # pylint:disable=protected-access,too-many-locals
+        buckets = {}
+        for optim in optimizers:
+            for group in optim.param_groups:
+                key = (
+                    tuple(
+                        (k, tuple(v) if isinstance(v, list) else v)
+                        for k, v in sorted(group.items())
+                        if k not in ("params", "buffer")
+                    ),
+                    getattr(optim, "degenerated_to_sgd", None),
+                )
+                for par in group["params"]:
+                    if par.grad is None:
+                        continue
+                    if par.grad.is_sparse:
+                        raise RuntimeError(
+                            f"{cls.__name__} does not support sparse gradients"
+                        )
+
+                    state = optim.state[par]
+                    if len(state) == 0:
+                        state["step"] = 0
+                        state["exp_avg"] = torch.zeros_like(par.data)
+                        state["exp_avg_sq"] = torch.zeros_like(par.data)
+                    state["step"] += 1
+
+                    bucket = buckets.setdefault(
+                        key + (state["step"],), (optim, group, [], [], [], [])
+                    )
+                    bucket[2].append(par.data)
+                    bucket[3].append(par.grad.data)
+                    bucket[4].append(state["exp_avg"])
+                    bucket[5].append(state["exp_avg_sq"])
+
+        for (*_, step), bucket in buckets.items():
+            optim, group, params, grads, exp_avgs, exp_avg_sqs = bucket
+            beta1, beta2 = group["betas"]
+            torch._foreach_mul_(exp_avg_sqs, beta2)
+            torch._foreach_addcmul_(exp_avg_sqs, grads, grads, value=1 - beta2)
+            torch._foreach_mul_(exp_avgs, beta1)
+            torch._foreach_add_(exp_avgs, grads, alpha=1 - beta1)
+            optim._foreach_update(group, step, params, exp_avgs, exp_avg_sqs)
+
+    def _foreach_update(
+        self,
+        group: dict,
+        step: int,
+        params: List[torch.Tensor],
+        exp_avgs: List[torch.Tensor],
+        exp_avg_sqs: List[torch.Tensor],
+    ):
+        # pylint:disable=too-many-arguments,invalid-name,protected-access
+        beta1, beta2 = group["betas"]
+        N_sma, step_size = _rectification(beta1, beta2, step, self.degenerated_to_sgd)
+        if N_sma < 5 and step_size <= 0:
+            return
+
+        if group["weight_decay"] != 0:
+            torch._foreach_mul_(params, 1 - group["weight_decay"] * group["lr"])
+        if N_sma >= 5:
+            denom = torch._foreach_sqrt(exp_avg_sqs)
+            torch._foreach_add_(denom, group["eps"])
+            torch._foreach_addcdiv_(
+                params, exp_avgs, denom, value=-step_size * group["lr"]
+            )
+        else:
+            torch._foreach_add_(params, exp_avgs, alpha=-step_size * group["lr"])
+
+
+class RAdam(_ForeachAdamMixin, Optimizer):
     r"""Rectified Adam
 
     Reference:
@@ -40,6 +156,7 @@ class RAdam(Optimizer):
         eps: float = 1e-8,
         weight_decay: float = 0,
         degenerated_to_sgd: bool = True,
+        foreach: bool = False,
     ):
         # pylint:disable=too-many-arguments
         if lr < 0:
@@ -52,6 +169,7 @@ class RAdam(Optimizer):
             raise ValueError("Invalid beta parameter at index 1: {}".format(betas[1]))
 
         self.degenerated_to_sgd = degenerated_to_sgd
+        self.foreach = foreach
         if (
             isinstance(params, (list, tuple))
             and len(params) > 0
@@ -74,86 +192,77 @@ class RAdam(Optimizer):
     def step(
         self, closure: Callable[[], torch.Tensor] = None
     ) -> Optional[torch.Tensor]:
-        # pylint:disable=too-many-locals,invalid-name,too-many-branches
         loss = None
         if closure is not None:
             loss = closure()
 
+        if self.foreach:
+            self.fused_step([self])
+            return loss
+
         for group in self.param_groups:
             for p in group["params"]:
                 if p.grad is None:
                     continue
-                grad = p.grad.data.float()
-                if grad.is_sparse:
-                    raise RuntimeError("RAdam does not support sparse gradients")
-
-                p_data_fp32 = p.data.float()
-
-                state = self.state[p]
-
-                if len(state) == 0:
-                    state["step"] = 0
-                    state["exp_avg"] = torch.zeros_like(p_data_fp32)
-                    state["exp_avg_sq"] = torch.zeros_like(p_data_fp32)
-                else:
-                    state["exp_avg"] = state["exp_avg"].type_as(p_data_fp32)
-                    state["exp_avg_sq"] = state["exp_avg_sq"].type_as(p_data_fp32)
-
-                exp_avg, exp_avg_sq = state["exp_avg"], state["exp_avg_sq"]
-                beta1, beta2 = group["betas"]
-
-                exp_avg_sq.mul_(beta2).addcmul_(grad, grad, value=1 - beta2)
-                exp_avg.mul_(beta1).add_(grad, alpha=1 - beta1)
-
-                state["step"] += 1
-                buffered = group["buffer"][int(state["step"] % 10)]
-                if state["step"] == buffered[0]:
-                    N_sma, step_size = buffered[1], buffered[2]
-                else:
-                    buffered[0] = state["step"]
-                    beta2_t = beta2 ** state["step"]
-                    N_sma_max = 2 / (1 - beta2) - 1
-                    N_sma = N_sma_max - 2 * state["step"] * beta2_t / (1 - beta2_t)
-                    buffered[1] = N_sma
-
-                    # more conservative since it's an approximated value
-                    if N_sma >= 5:
-                        step_size = math.sqrt(
-                            (1 - beta2_t)
-                            * (N_sma - 4)
-                            / (N_sma_max - 4)
-                            * (N_sma - 2)
-                            / N_sma
-                            * N_sma_max
-                            / (N_sma_max - 2)
-                        ) / (1 - beta1 ** state["step"])
-                    elif self.degenerated_to_sgd:
-                        step_size = 1.0 / (1 - beta1 ** state["step"])
-                    else:
-                        step_size = -1
-                    buffered[2] = step_size
-
-                # more conservative since it's an approximated value
-                if N_sma >= 5:
-                    if group["weight_decay"] != 0:
-                        p_data_fp32.add_(
-                            p_data_fp32, alpha=-group["weight_decay"] * group["lr"]
-                        )
-                    denom = exp_avg_sq.sqrt().add_(group["eps"])
-                    p_data_fp32.addcdiv_(exp_avg, denom, value=-step_size * group["lr"])
-                    p.data.copy_(p_data_fp32)
-                elif step_size > 0:
-                    if group["weight_decay"] != 0:
-                        p_data_fp32.add_(
-                            p_data_fp32, alpha=-group["weight_decay"] * group["lr"]
-                        )
-                    p_data_fp32.add_(exp_avg, alpha=-step_size * group["lr"])
-                    p.data.copy_(p_data_fp32)
+                self._step_param(group, p)
 
         return loss
 
+    def _step_param(self, group: dict, p: nn.Parameter):
+        # pylint:disable=invalid-name
+        grad = p.grad.data.float()
+        if grad.is_sparse:
+            raise RuntimeError("RAdam does not support sparse gradients")
+
+        p_data_fp32 = p.data.float()
+
+        state = self.state[p]
+
+        if len(state) == 0:
+            state["step"] = 0
+            state["exp_avg"] = torch.zeros_like(p_data_fp32)
+            state["exp_avg_sq"] = torch.zeros_like(p_data_fp32)
+        else:
+            state["exp_avg"] = state["exp_avg"].type_as(p_data_fp32)
+            state["exp_avg_sq"] = state["exp_avg_sq"].type_as(p_data_fp32)
+
+        exp_avg, exp_avg_sq = state["exp_avg"], state["exp_avg_sq"]
+        beta1, beta2 = group["betas"]
+
+        exp_avg_sq.mul_(beta2).addcmul_(grad, grad, value=1 - beta2)
+        exp_avg.mul_(beta1).add_(grad, alpha=1 - beta1)
+
+        state["step"] += 1
+        buffered = group["buffer"][int(state["step"] % 10)]
+        if state["step"] == buffered[0]:
+            N_sma, step_size = buffered[1], buffered[2]
+        else:
+            buffered[0] = state["step"]
+            N_sma, step_size = _rectification(
+                beta1, beta2, state["step"], self.degenerated_to_sgd
+            )
+            buffered[1] = N_sma
+            buffered[2] = step_size
+
+        # more conservative since it's an approximated value
+        if N_sma >= 5:
+            if group["weight_decay"] != 0:
+                p_data_fp32.add_(
+                    p_data_fp32, alpha=-group["weight_decay"] * group["lr"]
+                )
+            denom = exp_avg_sq.sqrt().add_(group["eps"])
+            p_data_fp32.addcdiv_(exp_avg, denom, value=-step_size * group["lr"])
+            p.data.copy_(p_data_fp32)
+        elif step_size > 0:
+            if group["weight_decay"] != 0:
+                p_data_fp32.add_(
+                    p_data_fp32, alpha=-group["weight_decay"] * group["lr"]
+                )
+            p_data_fp32.add_(exp_avg, alpha=-step_size * group["lr"])
+            p.data.copy_(p_data_fp32)
+
 
-class PlainRAdam(Optimizer):
+class PlainRAdam(_ForeachAdamMixin, Optimizer):
     """Plain version of RAdam optimizer."""
 
     def __init__(
@@ -164,6 +273,7 @@ class PlainRAdam(Optimizer):
         eps: float = 1e-8,
         weight_decay: float = 0,
         degenerated_to_sgd: bool = True,
+        foreach: bool = False,
     ):
         # pylint:disable=too-many-arguments
         if lr < 0:
@@ -176,6 +286,7 @@ class PlainRAdam(Optimizer):
             raise ValueError("Invalid beta parameter at index 1: {}".format(betas[1]))
 
         self.degenerated_to_sgd = degenerated_to_sgd
+        self.foreach = foreach
         defaults = dict(lr=lr, betas=betas, eps=eps, weight_decay=weight_decay)
 
         super().__init__(params, defaults)
@@ -188,6 +299,10 @@ class PlainRAdam(Optimizer):
         if closure is not None:
             loss = closure()
 
+        if self.foreach:
+            self.fused_step([self])
+            return loss
+
         for group in self.param_groups:
             for p in group["params"]:
                 if p.grad is None:
@@ -253,7 +368,7 @@ class PlainRAdam(Optimizer):
         return loss
 
 
-class AdamW(Optimizer):
+class AdamW(_ForeachAdamMixin, Optimizer):
     """Adam optimizer with warmup."""
 
     def __init__(
@@ -264,6 +379,7 @@ class AdamW(Optimizer):
         eps: float = 1e-8,
         weight_decay: float = 0,
         warmup: int = 0,
+        foreach: bool = False,
     ):
         # pylint:disable=too-many-arguments
         if lr < 0:
@@ -275,6 +391,7 @@ class AdamW(Optimizer):
         if not 0.0 <= betas[1] < 1.0:
             raise ValueError("Invalid beta parameter at index 1: {}".format(betas[1]))
 
+        self.foreach = foreach
         defaults = dict(
             lr=lr, betas=betas, eps=eps, weight_decay=weight_decay, warmup=warmup
         )
@@ -288,6 +405,10 @@ class AdamW(Optimizer):
         if closure is not None:
             loss = closure()
 
+        if self.foreach:
+            self.fused_step([self])
+            return loss
+
         for group in self.param_groups:
             for p in group["params"]:
                 if p.grad is None:
@@ -342,3 +463,25 @@ class AdamW(Optimizer):
                 p.data.copy_(p_data_fp32)
 
         return loss
+
+    def _foreach_update(
+        self,
+        group: dict,
+        step: int,
+        params: List[torch.Tensor],
+        exp_avgs: List[torch.Tensor],
+        exp_avg_sqs: List[torch.Tensor],
+    ):
+        # pylint:disable=too-many-arguments,protected-access
+        beta1, beta2 = group["betas"]
+        if group["warmup"] > step:
+            scheduled_lr = 1e-8 + step * group["lr"] / group["warmup"]
+        else:
+            scheduled_lr = group["lr"]
+        step_size = scheduled_lr * math.sqrt(1 - beta2 ** step) / (1 - beta1 ** step)
+
+        if group["weight_decay"] != 0:
+            torch._foreach_mul_(params, 1 - group["weight_decay"] * scheduled_lr)
+        denom = torch._foreach_sqrt(exp_avg_sqs)
+        torch._foreach_add_(denom, group["eps"])
+        torch._foreach_addcdiv_(params, exp_avgs, denom, value=-step_size)
@@ -1,5 +1,8 @@
 """Utilities for building optimizers."""
 import contextlib
+import functools
+import importlib
+import importlib.util
 from typing import Type
 
 import torch
@@ -31,31 +34,70 @@ OPTIMIZERS.update(
 )
 
 
+def _with_foreach(cls: Type[Optimizer]) -> Type[Optimizer]:
+    return type(
+        cls.__name__,
+        (cls,),
+        {"__init__": functools.partialmethod(cls.__init__, foreach=True)},
+    )
+
+
+# Multi-tensor versions, where available. Older PyTorch versions lack both
+# `torch.optim._multi_tensor` and the `torch._foreach_*` kernels, in which case
+# the default versions are used
+FOREACH_OPTIMIZERS = {}
+if importlib.util.find_spec("torch.optim._multi_tensor") is not None:
+    _multi_tensor = importlib.import_module("torch.optim._multi_tensor")
+    FOREACH_OPTIMIZERS.update(
+        {
+            name: getattr(_multi_tensor, name)
+            for name in OPTIMIZERS
+            if hasattr(_multi_tensor, name)
+        }
+    )
+    FOREACH_OPTIMIZERS.update(
+        {
+            "RAdam": _with_foreach(RAdam),
+            "PlainRAdam": _with_foreach(PlainRAdam),
+            "AdamW": _with_foreach(AdamW),
+        }
+    )
+
+
 def build_optimizer(module: nn.Module, config: dict, wrap: bool = False) -> Optimizer:
     """Build optimizer with the desired config and tied to a module.
 
     Args:
         module: the module to tie the optimizer to (or its parameters)
         config: mapping containing the 'type' of the optimizer and additional
-            kwargs.
+            kwargs. If the optional 'foreach' key is True, uses the
+            multi-tensor version of the optimizer if available.
         wrap: whether to wrap the class with :func:`wrap_optim_cls`.
     """
-    cls = get_optimizer_class(config["type"], wrap=wrap)
-    return link_optimizer(cls, module, all_except(config, "type"))
+    foreach = config.get("foreach", False)
+    cls = get_optimizer_class(config["type"], wrap=wrap, foreach=foreach)
+    return link_optimizer(cls, module, all_except(config, "type", "foreach"))
 
 
-def get_optimizer_class(name: str, wrap: bool = True) -> Type[Optimizer]:
+def get_optimizer_class(
+    name: str, wrap: bool = True, foreach: bool = False
+) -> Type[Optimizer]:
     """Return the optimizer class given its name.
 
     Args:
         name: the optimizer's name
         wrap: whether to wrap the class with :func:`wrap_optim_cls`.
+        foreach: whether to return the multi-tensor version of the optimizer,
+            which updates all parameters with `torch._foreach_*` kernels.
+            Falls back to the default version if unavailable.
 
     Returns:
         The optimizer class
     """
     try:
         cls = OPTIMIZERS[name]
+        if foreach:
+            cls = FOREACH_OPTIMIZERS.get(name, cls)
         return wrap_optim_cls(cls) if wrap else cls
     except KeyError:
         raise ValueError(f"Couldn't find optimizer with name '{name}'")
@@ -1,10 +1,12 @@
 """PyTorch related utilities."""
 from typing import Dict
+from typing import Iterable
 from typing import Iterator
 from typing import Union
 
 import numpy as np
 import torch
+import torch.distributed as dist
 from torch import Tensor
 from torch.autograd import grad
 
@@ -21,6 +23,41 @@ def flat_grad(
     )
 
 
+def all_reduce_grads(params: Iterable[Tensor]):
+    """Average gradients across all processes in the default process group.
+
+    Gradients are flattened into a single buffer so that a single collective
+    call is made. Parameters without gradients contribute zeros and have their
+    gradients set to the average.
+
+    Args:
+        params: parameters whose gradients to average. Must be the same, in the
+            same order, in every process
+    """
+    params = list(params)
+    if not params:
+        return
+    flat = torch.cat(
+        [
+            torch.zeros(p.numel(), device=p.device)
+            if p.grad is None
+            else p.grad.flatten()
+            for p in params
+        ]
+    )
+    dist.all_reduce(flat)
+    flat.div_(dist.get_world_size())
+
+    idx = 0
+    for par in params:
+        avg_grad = flat[idx : idx + par.numel()].view_as(par)
+        if par.grad is None:
+            par.grad = avg_grad.clone()
+        else:
+            par.grad.copy_(avg_grad)
+        idx += par.numel()
+
+
 def convert_to_tensor(arr, device: torch.device) -> Tensor:
     """Convert array-like object to tensor and cast it to appropriate device.
 
@@ -0,0 +1,183 @@
+"""Columnar storage of rollout episodes.
+
+Episodes are stored in a directory with one flat binary file per field and a
+file of episode end offsets. Steps from all episodes are contiguous, so
+fields can be memory-mapped as single arrays of shape `(num_steps, ...)`.
+Field data is flushed before each episode's end offset is written, so logs
+still being written, or cut short by a crash, can be loaded up to their last
+complete episode.
+"""
+import json
+import os
+import os.path as osp
+from typing import Dict
+from typing import Tuple
+
+import numpy as np
+
+FIELDS = ("obs", "act", "reward", "done")
+META_FILE = "meta.json"
+OFFSETS_FILE = "offsets.bin"
+
+
+class EpisodeWriter:
+    """Appends transitions to a columnar episode directory.
+
+    Args:
+        path: Directory in which to store the episodes
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._files = None
+        self._offsets = None
+        self._num_steps = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add_step(self, obs, act, reward: float, done: bool):
+        """Append a single transition to the current episode."""
+        values = dict(
+            zip(
+                FIELDS,
+                (
+                    np.asarray(obs),
+                    np.asarray(act),
+                    np.float32(reward),
+                    np.bool_(done),
+                ),
+            )
+        )
+        if self._files is None:
+            self._open(values)
+
+        for name, value in values.items():
+            self._files[name].write(value.tobytes())
+        self._num_steps += 1
+
+    def end_episode(self):
+        """Mark the end of the current episode."""
+        if self._offsets is None:
+            return
+        # Offsets must never point past the data readers can see
+        for file in self._files.values():
+            file.flush()
+        self._offsets.write(np.int64(self._num_steps).tobytes())
+        self._offsets.flush()
+
+    def close(self):
+        """Flush and close all files."""
+        if self._files is None:
+            return
+        for file in self._files.values():
+            file.close()
+        self._offsets.close()
+        self._files = self._offsets = None
+
+    def _open(self, values: Dict[str, np.ndarray]):
+        meta = {
+            name: {"dtype": value.dtype.str, "shape": list(value.shape)}
+            for name, value in values.items()
+        }
+        with open(osp.join(self.path, META_FILE), "w") as file:
+            json.dump(meta, file)
+
+        self._files = {name: open(_field_path(self.path, name), "wb") for name in meta}
+        self._offsets = open(osp.join(self.path, OFFSETS_FILE), "wb")
+
+
+def _field_path(path: str, name: str) -> str:
+    return osp.join(path, f"{name}.bin")
+
+
+def load_episodes(path: str) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """Memory-map episodes written by `EpisodeWriter`.
+
+    Only complete episodes are loaded.
+
+    Returns:
+        A tuple of the mapping from field names to read-only arrays with all
+        steps, and the episode offsets. Episode `i` spans steps
+        `offsets[i]:offsets[i+1]`.
+    """
+    with open(osp.join(path, META_FILE)) as file:
+        meta = json.load(file)
+
+    with open(osp.join(path, OFFSETS_FILE), "rb") as file:
+        data = file.read()
+    # Ignore a partially written offset
+    ends = np.frombuffer(data[: len(data) - len(data) % 8], dtype=np.int64)
+    offsets = np.concatenate([[0], ends])
+    num_steps = int(offsets[-1])
+
+    fields = {}
+    for name, info in meta.items():
+        shape = (num_steps,) + tuple(info["shape"])
+        if num_steps == 0:
+            fields[name] = np.empty(shape, dtype=info["dtype"])
+        else:
+            fields[name] = np.memmap(
+                _field_path(path, name), dtype=info["dtype"], mode="r", shape=shape
+            )
+    return fields, offsets
+
+
+def timestep_index(offsets: np.ndarray) -> np.ndarray:
+    """Timestep within its episode of each step."""
+    lengths = np.diff(offsets)
+    return np.arange(offsets[-1]) - np.repeat(offsets[:-1], lengths)
+
+
+def timestep_stats(
+    values: np.ndarray, offsets: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean and sample standard deviation of values across episodes per timestep.
+
+    Args:
+        values: Array of shape `(num_steps, ...)` with the values of all steps
+        offsets: Episode offsets as returned by `load_episodes`
+
+    Returns:
+        Arrays of shape `(max_episode_length, ...)` with the mean and standard
+        deviation of values at each timestep. Timesteps reached by a single
+        episode have NaN standard deviation.
+    """
+    timesteps = timestep_index(offsets)
+    counts = np.bincount(timesteps)
+    columns = values.reshape(len(values), -1)
+
+    means = np.empty((len(counts), columns.shape[1]))
+    stds = np.empty_like(means)
+    for dim in range(columns.shape[1]):
+        column = np.asarray(columns[:, dim], dtype=np.float64)
+        means[:, dim] = np.bincount(timesteps, weights=column) / counts
+        sq_devs = np.square(column - means[timesteps, dim])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            stds[:, dim] = np.sqrt(
+                np.bincount(timesteps, weights=sq_devs) / (counts - 1)
+            )
+
+    shape = (len(counts),) + values.shape[1:]
+    return means.reshape(shape), stds.reshape(shape)
+
+
+def convert_shelve(shelf_path: str, path: str):
+    """Convert episodes saved by RLlib's `RolloutSaver` with shelve.
+
+    Args:
+        shelf_path: Path to the shelve file, without extension
+        path: Directory in which to store the columnar episodes
+    """
+    import shelve
+
+    with shelve.open(shelf_path, flag="r") as rollouts, EpisodeWriter(path) as writer:
+        for episode_index in range(rollouts["num_episodes"]):
+            for transition in rollouts[str(episode_index)]:
+                obs, act, _, rew, done, *_ = transition
+                writer.add_step(obs, act, rew, done)
+            writer.end_episode()
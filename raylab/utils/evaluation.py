@@ -0,0 +1,187 @@
+"""Batched and parallel evaluation of policies from checkpoints."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+import torch
+from ray.rllib import Policy
+
+from raylab.envs import get_env_creator
+
+EpisodeStats = Dict[str, np.ndarray]
+
+
+class _EpisodeSchedule:
+    """Assigns pending episodes to environments as they become free.
+
+    Attributes:
+        episode_of: Index of the episode running in each busy environment
+        obs: Latest observation of each busy environment
+    """
+
+    def __init__(self, envs: list, seeds: List[int]):
+        self.envs = envs
+        self.seeds = seeds
+        self.episode_of: Dict[int, int] = {}
+        self.obs: Dict[int, np.ndarray] = {}
+        self._pending = iter(range(len(seeds)))
+        for env_idx in range(len(envs)):
+            self.start_episode(env_idx)
+
+    def start_episode(self, env_idx: int):
+        """Reset an environment for the next episode, or free it if none left."""
+        episode = next(self._pending, None)
+        if episode is None:
+            self.episode_of.pop(env_idx, None)
+            return
+        env = self.envs[env_idx]
+        env.seed(self.seeds[episode])
+        self.episode_of[env_idx] = episode
+        self.obs[env_idx] = env.reset()
+
+
+def run_episodes(
+    policy: Policy, envs: list, seeds: Sequence[int], max_steps: Optional[int] = None
+) -> EpisodeStats:
+    """Run one episode per seed, stepping all environments in lockstep.
+
+    Each environment runs episodes until none are left, so that actions for
+    all active environments are computed with a single call to
+    `policy.compute_actions`.
+
+    Args:
+        policy: Policy whose actions to evaluate
+        envs: Environment instances to step in parallel
+        seeds: Environment seed for each episode
+        max_steps: Optional maximum number of steps per episode
+
+    Returns:
+        A dictionary with the seed, total reward and length of each episode, in
+        the order of `seeds`
+    """
+    seeds = list(seeds)
+    returns = np.zeros(len(seeds), dtype=np.float64)
+    lengths = np.zeros(len(seeds), dtype=np.int64)
+
+    schedule = _EpisodeSchedule(envs, seeds)
+    while schedule.episode_of:
+        active = sorted(schedule.episode_of)
+        actions, _, _ = policy.compute_actions(
+            np.stack([schedule.obs[i] for i in active])
+        )
+        for env_idx, action in zip(active, actions):
+            episode = schedule.episode_of[env_idx]
+            schedule.obs[env_idx], reward, done, _ = envs[env_idx].step(action)
+            returns[episode] += reward
+            lengths[episode] += 1
+            if done or (max_steps and lengths[episode] >= max_steps):
+                schedule.start_episode(env_idx)
+
+    return {
+        "seed": np.asarray(seeds, dtype=np.int64),
+        "episode_reward": returns,
+        "episode_length": lengths,
+    }
+
+
+_POLICY_CACHE = {}
+
+
+def _load_policy(checkpoint: str, agent_name: str, env: Optional[str], kwargs: dict):
+    # Consecutive chunks usually belong to the same checkpoint
+    key = (checkpoint, agent_name, env, repr(kwargs))
+    if key not in _POLICY_CACHE:
+        from raylab.utils.checkpoints import get_policy_from_checkpoint
+
+        _POLICY_CACHE.clear()
+        _POLICY_CACHE[key] = get_policy_from_checkpoint(
+            checkpoint, agent_name, env=env, **kwargs
+        )
+    return _POLICY_CACHE[key]
+
+
+def _evaluate_chunk(job: tuple) -> Tuple[str, EpisodeStats]:
+    checkpoint, agent_name, env, seeds, max_steps, kwargs = job
+    torch.set_num_threads(1)
+    torch.manual_seed(seeds[0])
+    policy, config = _load_policy(checkpoint, agent_name, env, kwargs)
+
+    env_creator = get_env_creator(config["env"])
+    envs = [env_creator(config.get("env_config", {})) for _ in seeds]
+    try:
+        stats = run_episodes(policy, envs, seeds, max_steps=max_steps)
+    finally:
+        for env_ in envs:
+            env_.close()
+    return checkpoint, stats
+
+
+def evaluate_checkpoints(
+    checkpoints: Sequence[str],
+    agent_name: str,
+    episodes: int,
+    env: Optional[str] = None,
+    seed: int = 0,
+    num_envs: int = 8,
+    max_steps: Optional[int] = None,
+    workers: Optional[int] = None,
+    use_eval_config: bool = True,
+    config_overrides: Optional[dict] = None,
+) -> Iterator[Tuple[str, EpisodeStats]]:
+    """Evaluate several checkpoints of a raylab agent in parallel.
+
+    Episodes of each checkpoint are split in chunks of `num_envs`, which are
+    distributed across a process pool. Each chunk steps its environments in
+    lockstep with batched action computation. Episode `i` of every checkpoint
+    uses environment seed `seed + i`, so results are comparable across
+    checkpoints and reproducible across runs.
+
+    Args:
+        checkpoints: Paths to checkpoint files
+        agent_name: Registered name of the raylab agent
+        episodes: Number of episodes per checkpoint
+        env: Optional environment id overriding the one in the configuration
+        seed: Seed for the first episode
+        num_envs: Number of environments stepped in lockstep per process
+        max_steps: Optional maximum number of steps per episode
+        workers: Maximum number of worker processes. If 0, evaluates in the
+            current process. If None, uses the number of processors
+        use_eval_config: Whether to merge the evaluation config with the
+            agent's configuration
+        config_overrides: Optional overrides to the agent's configuration
+
+    Yields:
+        Pairs of checkpoint path and episode statistics as in `run_episodes`,
+        in the order of `checkpoints`
+    """
+    # pylint:disable=too-many-arguments,too-many-locals
+    kwargs = dict(use_eval_config=use_eval_config, config_overrides=config_overrides)
+    seeds = np.arange(seed, seed + episodes).tolist()
+    jobs = [
+        (checkpoint, agent_name, env, seeds[i : i + num_envs], max_steps, kwargs)
+        for checkpoint in checkpoints
+        for i in range(0, episodes, num_envs)
+    ]
+
+    executor = None
+    if workers != 0:
+        executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+    try:
+        results = (executor.map if executor else map)(_evaluate_chunk, jobs)
+        chunks: List[EpisodeStats] = []
+        for checkpoint, stats in results:
+            chunks.append(stats)
+            if sum(len(c["seed"]) for c in chunks) == episodes:
+                yield checkpoint, {
+                    k: np.concatenate([c[k] for c in chunks]) for k in stats
+                }
+                chunks = []
+    finally:
+        if executor:
+            executor.shutdown()
@@ -3,8 +3,9 @@
 import itertools
 import json
 import os
-from ast import literal_eval
+import pickle
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from functools import reduce
 
 import numpy as np
@@ -12,6 +13,9 @@ import pandas as pd
 
 
 _NUMERIC_KINDS = set("uifc")
+CACHE_FILE = ".exp_data_cache.pkl"
+# Supported progress file extensions, in order of preference
+PROGRESS_EXTENSIONS = (".columns.pkl", ".csv")
 
 
 def is_numeric(array):
@@ -81,6 +85,10 @@ def load_progress(progress_path, verbose=True):
 
     if progress_path.endswith(".csv"):
         return pd.read_csv(progress_path, index_col=None, comment="#")
+    if progress_path.endswith(PROGRESS_EXTENSIONS[0]):
+        from raylab.logger.columnar_logger import read_columnar_progress
+
+        return read_columnar_progress(progress_path)
 
     dicts = []
     with open(progress_path, "rt") as file:
@@ -144,30 +152,108 @@ def get_folders_with_target_files(directories, istarget):
     )
 
 
-def read_exp_folder_data(exp_folders, isprogress, isconfig, verbose=False):
-    exps_data = []
+def file_signature(path):
+    """Modification time and size of a file, used to detect changes."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_cached_exp_data(cache_path, signature):
+    """Return the cached experiment data if its signature matches, else None."""
+    try:
+        with open(cache_path, "rb") as file:
+            cached_signature, exp = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return None
+    return exp if cached_signature == signature else None
+
+
+def write_cached_exp_data(cache_path, signature, exp):
+    """Save experiment data with its signature, ignoring unwritable folders."""
+    try:
+        with open(cache_path, "wb") as file:
+            pickle.dump((signature, exp), file, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+def load_exp_data(progress_path, params_path=None, use_cache=False, verbose=False):
+    """Load progress and parameters of a single trial.
+
+    If `use_cache` is set, the parsed data is saved in a cache file in the
+    trial folder, keyed by the modification time and size of the source files.
+    Subsequent calls only re-parse the trial if any of these changed.
+    """
+    paths = (progress_path,) if params_path is None else (progress_path, params_path)
+    signature = tuple(file_signature(p) for p in paths)
+    cache_path = os.path.join(os.path.dirname(progress_path), CACHE_FILE)
+    if use_cache:
+        exp = read_cached_exp_data(cache_path, signature)
+        if exp is not None:
+            return exp
+
+    progress = load_progress(progress_path, verbose=verbose)
+    params = (
+        load_params(params_path)
+        if params_path is not None
+        else dict(exp_name="experiment")
+    )
+    if "trial_id" in progress:
+        params["id"] = progress["trial_id"][0]
+    exp = ExperimentData(
+        progress=progress, params=params, flat_params=flatten_dict(params)
+    )
+
+    if use_cache:
+        write_cached_exp_data(cache_path, signature, exp)
+    return exp
+
+
+def _try_load_exp_data(job):
+    progress_path, params_path, use_cache, verbose = job
+    try:
+        return load_exp_data(
+            progress_path, params_path, use_cache=use_cache, verbose=verbose
+        )
+    except (IOError, pd.errors.EmptyDataError) as error:
+        if verbose:
+            print(error)
+        return None
+
+
+def _progress_preference(file):
+    return next(
+        (i for i, ext in enumerate(PROGRESS_EXTENSIONS) if file.endswith(ext)),
+        len(PROGRESS_EXTENSIONS),
+    )
+
+
+def _exp_folder_jobs(exp_folders, isprogress, isconfig, use_cache, verbose):
+    jobs = []
     for path, files in exp_folders:
-        try:
-            progress_path = os.path.join(path, first_that(isprogress, files))
-            progress = load_progress(progress_path, verbose=verbose)
-            params_file = first_that(isconfig, files)
-            params = (
-                load_params(os.path.join(path, params_file))
-                if params_file is not None
-                else dict(exp_name="experiment")
-            )
-            if "trial_id" in progress:
-                params["id"] = progress["trial_id"][0]
-            exps_data.append(
-                ExperimentData(
-                    progress=progress, params=params, flat_params=flatten_dict(params)
-                )
-            )
-        except (IOError, pd.errors.EmptyDataError) as error:
-            if verbose:
-                print(error)
+        progress_files = sorted(filter(isprogress, files), key=_progress_preference)
+        progress_path = os.path.join(path, progress_files[0])
+        params_file = first_that(isconfig, files)
+        params_path = os.path.join(path, params_file) if params_file else None
+        jobs.append((progress_path, params_path, use_cache, verbose))
+    return jobs
+
+
+def _map_jobs(func, jobs, workers=None):
+    if workers is not None and workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(len(jobs) // (workers * 4), 1)
+            return list(executor.map(func, jobs, chunksize=chunksize))
+    return list(map(func, jobs))
 
-    return exps_data
+
+def read_exp_folder_data(
+    exp_folders, isprogress, isconfig, verbose=False, use_cache=False, workers=None
+):
+    # pylint:disable=too-many-arguments
+    jobs = _exp_folder_jobs(exp_folders, isprogress, isconfig, use_cache, verbose)
+    results = _map_jobs(_try_load_exp_data, jobs, workers=workers)
+    return [exp for exp in results if exp is not None]
 
 
 def load_exps_data(
@@ -177,13 +263,32 @@ def load_exps_data(
     error_prefix="error",
     include_errors=False,
     verbose=False,
+    use_cache=False,
+    workers=None,
 ):
+    """Load progress and parameters of all trials under the given directories.
+
+    Args:
+        directories: path or list of paths to search recursively for trials
+        progress_prefix: prefix of progress file names
+        config_prefix: prefix of parameter file names
+        error_prefix: prefix of error file names
+        include_errors: whether to include trials with error files
+        verbose: whether to print progress and errors
+        use_cache: whether to reuse (and update) the per-trial cache of parsed
+            files. Only trials with new or modified files are parsed again
+        workers: number of processes to parse trials in parallel. Parses them
+            in the current process if None
+
+    Returns:
+        A list of experiment data, one for each trial
+    """
     # pylint:disable=too-many-arguments
     if isinstance(directories, str):
         directories = [directories]
 
     def isprogress(file):
-        return file.startswith(progress_prefix) and file.endswith(".csv")
+        return file.startswith(progress_prefix) and file.endswith(PROGRESS_EXTENSIONS)
 
     def isconfig(file):
         return file.startswith(config_prefix) and file.endswith(".json")
@@ -198,21 +303,31 @@ def load_exps_data(
     if verbose:
         print("finished walking exp folders")
 
-    exps_data = read_exp_folder_data(exp_folders, isprogress, isconfig, verbose=verbose)
+    exps_data = read_exp_folder_data(
+        exp_folders,
+        isprogress,
+        isconfig,
+        verbose=verbose,
+        use_cache=use_cache,
+        workers=workers,
+    )
     return exps_data
 
 
 def extract_distinct_params(exps_data, excluded_params=("seed", "log_dir")):
-    repr_config_pairs = [repr(kv) for d in exps_data for kv in d.flat_params.items()]
-    uniq_pairs = list(set(repr_config_pairs))
-    evald_pairs = map(literal_eval, uniq_pairs)
-    stringified_pairs = sorted(
-        evald_pairs, key=lambda x: tuple("" if it is None else str(it) for it in x)
-    )
+    # Values are deduplicated by their representation, so that unhashable
+    # values (e.g., lists) are supported without parsing them back
+    distinct = {}
+    for exp in exps_data:
+        for key, val in exp.flat_params.items():
+            distinct.setdefault(key, {}).setdefault(repr(val), val)
+
+    def stringify(item):
+        return "" if item is None else str(item)
 
     proposals = [
-        (k, [x[1] for x in v])
-        for k, v in itertools.groupby(stringified_pairs, lambda x: x[0])
+        (key, sorted(distinct[key].values(), key=stringify))
+        for key in sorted(distinct, key=stringify)
     ]
 
     filtered = [
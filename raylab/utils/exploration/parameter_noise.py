@@ -8,9 +8,9 @@ from ray.rllib import SampleBatch
 from ray.rllib.models.action_dist import ActionDistribution
 
 from raylab.policy import TorchPolicy
-from raylab.torch.nn.utils import perturb_params
 from raylab.utils.param_noise import AdaptiveParamNoiseSpec
 from raylab.utils.param_noise import ddpg_distance_metric
+from raylab.utils.param_noise import ParameterPerturbation
 
 from .base import Model
 from .random_uniform import RandomUniform
@@ -22,14 +22,32 @@ class ParameterNoise(RandomUniform):
     Expects `actor` attribute of `policy.module` to be an instance of
     `raylab.policy.modules.actor.policy.deterministic.DeterministicPolicy`.
 
+    Parameter noise is kept in a separate buffer and only the noise is
+    resampled on each episode start. With a single perturbation, the behavior
+    policy's parameters are overwritten in place by the perturbed actor's.
+    With multiple perturbations, all are evaluated in one batched forward pass
+    of the actor and row `i` of each observation batch uses perturbation
+    `i % num_perturbations`, matching the environment indices of vectorized
+    environments. On episode start, only the perturbation of the sub-environment
+    that started the episode is resampled, as given by the episode's `env_id`.
+    If the episode does not carry its environment index, perturbations are
+    resampled in round-robin order instead, which matches the sub-environments
+    as long as they reset in lockstep.
+
     Args:
         param_noise_spec: Arguments for `AdaptiveParamNoiseSpec`.
+        num_perturbations: Number of independently perturbed behavior policies.
     """
 
-    def __init__(self, *args, param_noise_spec: dict = None, **kwargs):
+    def __init__(
+        self, *args, param_noise_spec: dict = None, num_perturbations: int = 1, **kwargs
+    ):
         super().__init__(*args, **kwargs)
         param_noise_spec = param_noise_spec or {}
         self._param_noise_spec = AdaptiveParamNoiseSpec(**param_noise_spec)
+        self._num_perturbations = num_perturbations
+        self._perturbation: Optional[ParameterPerturbation] = None
+        self._episodes_started = 0
 
     def get_exploration_action(
         self,
@@ -45,9 +63,27 @@ class ParameterNoise(RandomUniform):
                     timestep=timestep,
                     explore=explore,
                 )
+            if self._num_perturbations > 1:
+                return self._batched_behavior_action(action_distribution)
             return action_distribution.sample()
         return action_distribution.deterministic_sample()
 
+    def _batched_behavior_action(
+        self, action_distribution: ActionDistribution
+    ) -> Tuple[torch.Tensor, None]:
+        obs = action_distribution.inputs["obs"]
+        perturbation = self._get_perturbation(action_distribution.model.actor)
+        actions = perturbation.batched_call(
+            self._param_noise_spec.curr_stddev, lambda actor: actor(obs)
+        )
+        rows = torch.arange(obs.size(0), device=obs.device)
+        return actions[rows % self._num_perturbations, rows], None
+
+    def _get_perturbation(self, actor: torch.nn.Module) -> ParameterPerturbation:
+        if self._perturbation is None:
+            self._perturbation = ParameterPerturbation(actor, self._num_perturbations)
+        return self._perturbation
+
     def on_episode_start(
         self,
         policy: TorchPolicy,
@@ -57,11 +93,18 @@ class ParameterNoise(RandomUniform):
         tf_sess: Any = None,
     ):
         # pylint:disable=unused-argument
-        perturb_params(
-            policy.module.behavior,
-            policy.module.actor,
-            self._param_noise_spec.curr_stddev,
-        )
+        perturbation = self._get_perturbation(policy.module.actor)
+        if self._num_perturbations > 1:
+            env_index = getattr(episode, "env_id", None)
+            if env_index is None:
+                env_index = self._episodes_started
+            perturbation.resample(env_index % self._num_perturbations)
+        else:
+            perturbation.resample()
+            perturbation.perturb(
+                policy.module.behavior, self._param_noise_spec.curr_stddev
+            )
+        self._episodes_started += 1
 
     @torch.no_grad()
     def postprocess_trajectory(
@@ -81,10 +124,9 @@ class ParameterNoise(RandomUniform):
 
         noisy = module.actor.unsquash_action(actions)
         target = module.actor.unconstrained_action(cur_obs)
-        noisy, target = map(lambda x: x.cpu().detach().numpy(), (noisy, target))
 
         distance = ddpg_distance_metric(noisy, target)
-        self._param_noise_spec.adapt(distance)
+        self._param_noise_spec.adapt(distance.item())
 
     @classmethod
     def check_model_compat(cls, model: Model):
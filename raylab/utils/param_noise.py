@@ -4,8 +4,15 @@ https://github.com/openai/baselines/blob/master/baselines/ddpg/noise.py
 """
 from dataclasses import dataclass
 from dataclasses import field
+from typing import Callable
+from typing import Optional
 
-import numpy as np
+import torch
+import torch.nn as nn
+from torch import Tensor
+from torch.nn.utils import parameters_to_vector
+
+from raylab.torch.nn.utils import batched_params_call
 
 
 @dataclass
@@ -36,9 +43,80 @@ class AdaptiveParamNoiseSpec:
 def ddpg_distance_metric(actions1, actions2):
     """Compute "distance" between actions taken by two policies at the same states.
 
-    Expects numpy arrays.
+    Expects numpy arrays or tensors. Tensors are reduced on their device.
     """
     diff = actions1 - actions2
-    mean_diff = np.mean(np.square(diff), axis=0)
-    dist = np.sqrt(np.mean(mean_diff))
+    mean_diff = (diff ** 2).mean(0)
+    dist = mean_diff.mean() ** 0.5
     return dist
+
+
+class ParameterPerturbation:
+    """Independent Gaussian perturbations of a module's parameters.
+
+    Keeps standard normal noise for each perturbation in a single buffer of
+    shape `(num_perturbations, num_params)`, so that resampling does not touch
+    the module. Layer normalization parameters are not perturbed.
+
+    Args:
+        module: the module whose parameters to perturb
+        num_perturbations: number of independent perturbations
+    """
+
+    def __init__(self, module: nn.Module, num_perturbations: int = 1):
+        self.module = module
+        layer_norms = (m for m in module.modules() if isinstance(m, nn.LayerNorm))
+        layer_norm_params = set(p for m in layer_norms for p in m.parameters())
+        self.mask = torch.cat(
+            [
+                torch.full((p.numel(),), float(p not in layer_norm_params))
+                for p in module.parameters()
+            ]
+        ).to(next(module.parameters()).device)
+        self.noise = self.mask.new_empty(num_perturbations, self.mask.numel())
+        self.resample()
+
+    def resample(self, index: Optional[int] = None):
+        """Resample the noise of one or all perturbations in place."""
+        noise = self.noise if index is None else self.noise[index]
+        noise.normal_().mul_(self.mask)
+
+    @torch.no_grad()
+    def perturbed_params(self, stddev: float) -> Tensor:
+        """Flat parameter vectors of all perturbations, stacked."""
+        params = parameters_to_vector(self.module.parameters())
+        return torch.add(params, self.noise, alpha=stddev)
+
+    @torch.no_grad()
+    def perturb(self, target: nn.Module, stddev: float, index: int = 0):
+        """Set the parameters of a copy of the module to a perturbed version.
+
+        Writes directly into the target's parameters and buffers.
+
+        Args:
+            target: module with the same architecture as the perturbed one
+            stddev: the standard deviation of the parameter noise
+            index: which perturbation to use
+        """
+        idx = 0
+        for param, tparam in zip(self.module.parameters(), target.parameters()):
+            noise = self.noise[index, idx : idx + param.numel()].view_as(param)
+            torch.add(param, noise, alpha=stddev, out=tparam.data)
+            idx += param.numel()
+        for buffer, tbuffer in zip(self.module.buffers(), target.buffers()):
+            tbuffer.copy_(buffer)
+
+    @torch.no_grad()
+    def batched_call(
+        self, stddev: float, func: Callable[[nn.Module], Tensor]
+    ) -> Tensor:
+        """Evaluate a function of the module under all perturbations at once.
+
+        Args:
+            stddev: the standard deviation of the parameter noise
+            func: function from the perturbed module to a tensor
+
+        Returns:
+            The outputs of `func` stacked along the first dimension
+        """
+        return batched_params_call(self.module, self.perturbed_params(stddev), func)
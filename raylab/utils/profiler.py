@@ -0,0 +1,221 @@
+"""Low-overhead hierarchical profiler for training hot paths.
+
+Code marks hot-path phases with :func:`profile` sections, which cost a single
+global lookup unless a :class:`Profiler` is active. Sections entered while
+another one is open are nested under it, so that the time spent in, e.g., an
+optimizer step is reported as `learn_on_batch/improve_policy/.../step`.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+import numpy as np
+import torch
+
+_ACTIVE: Optional["Profiler"] = None
+
+
+class Profiler:
+    """Records the wall-clock duration of nested code sections.
+
+    Durations are aggregated per section path until :meth:`stats` is called,
+    usually once per training iteration.
+
+    Args:
+        percentiles: Percentiles of the section durations to report
+        cuda_sync: Whether to synchronize CUDA devices at section boundaries.
+            Otherwise, asynchronous kernels are accounted for in the first
+            section that waits on them, e.g., with `.item()`
+        chrome_trace_dir: Optional directory in which to save every section
+            as an event in a Chrome trace file, viewable in `chrome://tracing`
+            or Perfetto. Each process appends to its own file
+
+    Attributes:
+        durations: Section durations in seconds recorded since the last call
+            to :meth:`stats`, keyed by section path
+    """
+
+    def __init__(
+        self,
+        percentiles: Sequence[float] = (50, 90, 99),
+        cuda_sync: bool = False,
+        chrome_trace_dir: Optional[str] = None,
+    ):
+        self.percentiles = tuple(percentiles)
+        self.cuda_sync = cuda_sync and torch.cuda.is_available()
+        self.chrome_trace_dir = chrome_trace_dir
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self._stack: List[str] = []
+        self._events: List[dict] = []
+
+    @classmethod
+    def from_config(cls, config: dict) -> Optional["Profiler"]:
+        """Build a profiler from a policy's `profiler` config, if enabled."""
+        if not config.get("enabled", False):
+            return None
+        return cls(
+            percentiles=config.get("percentiles", (50, 90, 99)),
+            cuda_sync=config.get("cuda_sync", False),
+            chrome_trace_dir=config.get("chrome_trace_dir"),
+        )
+
+    @property
+    def active(self) -> bool:
+        """Whether sections are currently recorded by this profiler."""
+        return _ACTIVE is self
+
+    def activate(self) -> "_Activation":
+        """Context in which :func:`profile` sections are recorded by this profiler."""
+        return _Activation(self)
+
+    def section(self, name: str) -> "_Section":
+        """Context which records its duration under `name`."""
+        return _Section(self, name)
+
+    def stats(self) -> Dict[str, float]:
+        """Summarize and clear the section durations recorded so far.
+
+        Also appends the recorded sections to the Chrome trace file, if any.
+
+        Returns:
+            A flat dictionary with the number of calls, total time and
+            duration percentiles (in milliseconds) for each section path
+        """
+        stats = {}
+        for path, durations in sorted(self.durations.items()):
+            millis = np.asarray(durations) * 1000
+            prefix = f"profile/{path}/"
+            stats[prefix + "calls"] = len(millis)
+            stats[prefix + "total_ms"] = float(millis.sum())
+            for pct, value in zip(
+                self.percentiles, np.percentile(millis, self.percentiles)
+            ):
+                stats[prefix + f"p{pct:g}_ms"] = float(value)
+
+        self.durations.clear()
+        self.export_chrome_trace()
+        return stats
+
+    def export_chrome_trace(self):
+        """Append the recorded sections to this process' Chrome trace file.
+
+        Uses the JSON array trace format, whose closing bracket is optional,
+        so that events can be appended on every training iteration.
+        """
+        if self.chrome_trace_dir is None or not self._events:
+            return
+
+        os.makedirs(self.chrome_trace_dir, exist_ok=True)
+        path = os.path.join(self.chrome_trace_dir, f"trace-{os.getpid()}.json")
+        lines = [] if os.path.exists(path) else ["["]
+        lines += [json.dumps(event) + "," for event in self._events]
+        with open(path, "a") as file:
+            file.write("\n".join(lines) + "\n")
+        self._events.clear()
+
+    def _record(self, path: str, start: float, end: float):
+        self.durations[path].append(end - start)
+        if self.chrome_trace_dir is not None:
+            self._events.append(
+                {
+                    "name": path.rsplit("/", maxsplit=1)[-1],
+                    "cat": path,
+                    "ph": "X",
+                    "ts": start * 1e6,
+                    "dur": (end - start) * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                }
+            )
+
+
+class _Activation:
+    # pylint:disable=too-few-public-methods
+    __slots__ = ("profiler", "previous")
+
+    def __init__(self, profiler: Profiler):
+        self.profiler = profiler
+        self.previous = None
+
+    def __enter__(self):
+        global _ACTIVE  # pylint:disable=global-statement
+        self.previous, _ACTIVE = _ACTIVE, self.profiler
+
+    def __exit__(self, *exc_info):
+        global _ACTIVE  # pylint:disable=global-statement
+        _ACTIVE = self.previous
+
+
+class _Section:
+    # pylint:disable=too-few-public-methods
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: Profiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        profiler = self.profiler
+        if profiler.cuda_sync:
+            torch.cuda.synchronize()
+        profiler._stack.append(self.name)  # pylint:disable=protected-access
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        profiler = self.profiler
+        if profiler.cuda_sync:
+            torch.cuda.synchronize()
+        end = time.perf_counter()
+        # pylint:disable=protected-access
+        path = "/".join(profiler._stack)
+        profiler._stack.pop()
+        profiler._record(path, self.start, end)
+
+
+class _NullSection:
+    # pylint:disable=too-few-public-methods
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_SECTION = _NullSection()
+
+
+def profile(name: str):
+    """Context which records its duration in the active profiler, if any.
+
+    Examples:
+        >>> with profile("replay_sample"):
+        ...     batch = replay.sample(batch_size)
+    """
+    if _ACTIVE is None:
+        return _NULL_SECTION
+    return _ACTIVE.section(name)
+
+
+def profiled(name: str) -> Callable[[Callable], Callable]:
+    """Decorator to record every call of a function as a :func:`profile` section."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            with profile(name):
+                return func(*args, **kwargs)
+
+        return wrapped
+
+    return decorator
@@ -35,10 +35,16 @@ class NumpyReplayBuffer:
             specification
         compute_stats: Whether to track mean and stddev for normalizing
             observations
+        num_shards: Number of buffers among which added transitions are split.
+            This buffer only stores every `num_shards`-th transition added
+        shard_index: Position of this buffer among the shards, i.e., of the
+            first added transition this buffer stores
     """
 
     # pylint:disable=too-many-instance-attributes
     compute_stats: bool = False
+    num_shards: int = 1
+    shard_index: int = 0
 
     def __init__(self, obs_space: Space, action_space: Space, size: int):
         self._maxsize = size
@@ -61,6 +67,7 @@ class NumpyReplayBuffer:
         self._curr_size = 0
         self._rng = np.random.default_rng()
         self._obs_stats: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._num_added = 0
 
     def __len__(self) -> int:
         return self._curr_size
@@ -93,14 +100,26 @@ class NumpyReplayBuffer:
     def normalize(self, obs: np.ndarray) -> np.ndarray:
         """Normalize observation using the stored mean and stddev."""
         obs = np.asarray(obs)
-        if not self.compute_stats:
+        stats = self.obs_stats()
+        if stats is None:
             return obs
 
+        mean, std = stats
+        return (obs - mean) / std
+
+    def obs_stats(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Mean and stddev used to normalize observations.
+
+        Returns:
+            None if the buffer does not normalize observations, else a tuple
+            of mean and standard deviation broadcastable to observations
+        """
+        if not self.compute_stats:
+            return None
+
         if not self._obs_stats:
             self.update_obs_stats()
-
-        mean, std = self._obs_stats
-        return (obs - mean) / std
+        return self._obs_stats
 
     def update_obs_stats(self):
         """Compute mean and standard deviation for observation normalization.
@@ -129,6 +148,8 @@ class NumpyReplayBuffer:
         Args:
             samples: The sample batch
         """
+        if self.num_shards > 1:
+            samples = self._select_shard(samples)
         if samples.count >= self._maxsize:
             samples = samples.slice(samples.count - self._maxsize, None)
             end_idx = 0
@@ -153,6 +174,13 @@ class NumpyReplayBuffer:
         self._curr_size = min(self._curr_size + samples.count, self._maxsize)
         self._obs_stats = None
 
+    def _select_shard(self, samples: SampleBatch) -> SampleBatch:
+        start = (self.shard_index - self._num_added) % self.num_shards
+        self._num_added += samples.count
+        return SampleBatch(
+            {f.name: samples[f.name][start :: self.num_shards] for f in self.fields}
+        )
+
     def sample(self, batch_size: int) -> SampleBatch:
         """Transition batch uniformly sampled with replacement."""
         return SampleBatch(self[self.sample_idxes(batch_size)])
@@ -0,0 +1,178 @@
+"""Low-latency local serving of exported actors.
+
+Example:
+    >>> with MicroBatchServer.from_file("export/actor.pt") as server:
+    ...     action = server.compute_action(obs)
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+Request = Tuple[np.ndarray, Future]
+
+
+class MicroBatchServer:
+    """Computes actions for concurrent requests with batched forward passes.
+
+    A background thread collects pending requests until either
+    `max_batch_size` requests are queued or `max_latency_us` microseconds have
+    passed since the first one arrived. It then stacks the observations, runs
+    a single forward pass and scatters the actions back to each request.
+
+    Args:
+        actor: Module mapping observation batches to action batches, usually
+            loaded from `TorchPolicy.export_model`'s output
+        max_batch_size: Maximum number of requests per forward pass
+        max_latency_us: Maximum time in microseconds to wait for a batch to
+            fill up before running the forward pass
+    """
+
+    def __init__(
+        self, actor: nn.Module, max_batch_size: int = 32, max_latency_us: int = 500
+    ):
+        self.actor = actor
+        self.max_batch_size = max_batch_size
+        self.max_latency_us = max_latency_us
+        self._queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "MicroBatchServer":
+        """Create a server for an actor saved with `torch.jit.save`."""
+        return cls(torch.jit.load(path, map_location="cpu"), **kwargs)
+
+    def start(self):
+        """Start the batching thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the batching thread after serving all queued requests."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def submit(self, obs: np.ndarray) -> Future:
+        """Queue a single observation.
+
+        Returns:
+            A future holding the corresponding action
+        """
+        future = Future()
+        self._queue.put((np.asarray(obs, dtype=np.float32), future))
+        return future
+
+    def compute_action(self, obs: np.ndarray, timeout: Optional[float] = None):
+        """Compute the action for a single observation, blocking until done."""
+        return self.submit(obs).result(timeout)
+
+    def listen(self, address, authkey: bytes):
+        """Serve requests from other processes until interrupted.
+
+        Clients connect with `multiprocessing.connection.Client(address,
+        authkey)`, `send` a single observation and `recv` the action. Each
+        connection is handled by its own thread, so requests from different
+        clients are batched together.
+
+        Warning:
+            Connections exchange pickled objects, and unpickling data from an
+            untrusted client allows it to run arbitrary code. Clients must
+            therefore authenticate with the secret `authkey`, e.g., one
+            generated by `secrets.token_bytes`. Even so, the socket must never
+            be reachable from outside the host: bind TCP sockets to a loopback
+            address or use a Unix socket.
+
+        Args:
+            address: Local socket address, e.g., `("localhost", 6000)` or a
+                Unix socket path
+            authkey: Secret key for authenticating clients
+
+        Raises:
+            ValueError: If `authkey` is empty
+        """
+        if not authkey:
+            raise ValueError("An authentication key is required to serve actions")
+
+        self.start()
+        with Listener(address, authkey=authkey) as listener:
+            while True:
+                try:
+                    conn = listener.accept()
+                except (AuthenticationError, ConnectionError, EOFError):
+                    # Rejected or dropped client
+                    continue
+                threading.Thread(
+                    target=self._handle_connection, args=(conn,), daemon=True
+                ).start()
+
+    def _handle_connection(self, conn):
+        with conn:
+            while True:
+                try:
+                    obs = conn.recv()
+                except EOFError:
+                    break
+                conn.send(self.compute_action(obs))
+
+    def _serve(self):
+        stop = False
+        while not stop:
+            requests, stop = self._collect()
+            if requests:
+                self._process(requests)
+
+    def _collect(self) -> Tuple[List[Request], bool]:
+        request = self._queue.get()
+        if request is None:
+            return [], True
+
+        requests = [request]
+        deadline = time.perf_counter() + self.max_latency_us * 1e-6
+        while len(requests) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                request = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if request is None:
+                return requests, True
+            requests.append(request)
+        return requests, False
+
+    def _process(self, requests: List[Request]):
+        obs, futures = zip(*requests)
+        try:
+            with torch.no_grad():
+                actions = self.actor(torch.from_numpy(np.stack(obs))).numpy()
+        except Exception as err:  # pylint:disable=broad-except
+            for future in futures:
+                future.set_exception(err)
+            return
+
+        for future, action in zip(futures, actions):
+            future.set_result(action)
@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# pylint:disable=missing-docstring
+"""Measure learning and acting throughput of every registered agent.
+
+Each agent's policy is built on a small built-in environment, with its replay
+buffer (if any) filled with synthetic transitions. The script then times
+`learn_on_batch` and `compute_actions` for several batch sizes and network
+widths. It reports steps per second, the process' peak memory, and the
+per-phase breakdown of `learn_on_batch` from the policy profiler.
+
+Each configuration runs on the CPU in a fresh process, so that peak memory
+and allocator state are not shared between configurations. Results are saved
+as JSON. If a baseline file is given, throughputs are compared against it and
+the script exits with an error if any of them regressed.
+"""
+import concurrent.futures
+import itertools
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import time
+
+import click
+import numpy as np
+import torch
+from ray.rllib import SampleBatch
+
+from raylab.agents.registry import AGENTS
+from raylab.agents.registry import get_agent_cls
+from raylab.envs import get_env_creator
+from raylab.policy.modules.registry import MODULES
+from raylab.utils.debug import fake_batch
+from raylab.utils.debug import fake_space_samples
+from raylab.utils.profiler import Profiler
+
+METRICS = ("learn_steps_per_s", "act_steps_per_s")
+
+
+def module_config(policy_cls, units):
+    """Full module config for the policy with all hidden layers of width `units`."""
+    config = policy_cls.options.defaults["module"].copy()
+    type_ = config.pop("type")
+    full = MODULES[type_].spec_cls.from_dict(config).to_dict()
+
+    def set_units(spec):
+        if isinstance(spec, dict):
+            if "units" in spec:
+                spec["units"] = (units, units)
+                spec["activation"] = spec.get("activation") or "ReLU"
+            for value in spec.values():
+                set_units(value)
+
+    set_units(full)
+    return {"type": type_, **full}
+
+
+def synthetic_batch(policy, count):
+    """Fake transitions with every field stored in the policy's replay buffer."""
+    batch = fake_batch(policy.observation_space, policy.action_space, count)
+    batch[SampleBatch.INFOS] = np.array([{} for _ in range(count)])
+    fields = policy.replay.fields if hasattr(policy, "replay") else ()
+    for field in fields:
+        if field.name not in batch:
+            batch[field.name] = np.zeros((count,) + field.shape, dtype=field.dtype)
+    with torch.no_grad():
+        return policy.postprocess_trajectory(batch)
+
+
+def build_policy(agent, env_name, batch_size, units, buffer_size):
+    policy_cls = get_agent_cls(agent)._policy_class  # pylint:disable=protected-access
+    env = get_env_creator(env_name)({})
+    config = {
+        "env": env_name,
+        "policy": {"module": module_config(policy_cls, units)},
+    }
+    if "batch_size" in policy_cls.options.defaults:
+        config["policy"]["batch_size"] = batch_size
+    if "buffer_size" in policy_cls.options.defaults:
+        config["policy"]["buffer_size"] = buffer_size
+    policy = policy_cls(env.observation_space, env.action_space, config)
+
+    if hasattr(policy, "set_reward_from_config"):
+        policy.set_reward_from_config()
+        policy.set_termination_from_config()
+    if hasattr(policy, "replay"):
+        policy.replay.add(synthetic_batch(policy, buffer_size))
+    return policy
+
+
+def run_config(agent, env_name, batch_size, units, buffer_size, steps, seed):
+    """Benchmark one agent configuration. Runs in a separate process."""
+    # pylint:disable=too-many-arguments,too-many-locals
+    torch.manual_seed(seed)
+    np.random.seed(seed)
+    policy = build_policy(agent, env_name, batch_size, units, buffer_size)
+
+    # Off-policy agents learn from replayed minibatches of `batch_size`,
+    # receiving a single new transition per call. On-policy agents learn from
+    # the incoming batch.
+    count = 1 if hasattr(policy, "replay") else batch_size
+    samples = synthetic_batch(policy, count)
+    obs = fake_space_samples(policy.observation_space, batch_size)
+
+    # Warmup, e.g., initial dynamics model training
+    policy.learn_on_batch(samples)
+    policy.compute_actions(obs)
+
+    learn_times = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        policy.learn_on_batch(samples)
+        learn_times.append(time.perf_counter() - start)
+
+    act_times = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        policy.compute_actions(obs)
+        act_times.append(time.perf_counter() - start)
+
+    policy.profiler = Profiler(percentiles=(50,))
+    for _ in range(steps):
+        policy.learn_on_batch(samples)
+    phases = {
+        key[len("profile/") : -len("/total_ms")]: value / steps
+        for key, value in policy.profiler_stats().items()
+        if key.endswith("/total_ms")
+    }
+
+    return {
+        "agent": agent,
+        "env": env_name,
+        "batch_size": batch_size,
+        "units": units,
+        "learn_steps_per_s": 1 / statistics.median(learn_times),
+        "act_steps_per_s": 1 / statistics.median(act_times),
+        # Kilobytes on Linux
+        "peak_memory_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "phases_ms": phases,
+    }
+
+
+def config_key(result):
+    return result["agent"], result["env"], result["batch_size"], result["units"]
+
+
+def compare(results, baseline, tolerance):
+    """Print throughput ratios to the baseline and return the regressions."""
+    print(f"{'agent':>10} {'batch':>6} {'units':>6} {'metric':>18} {'ratio':>7}")
+    baseline = {config_key(r): r for r in baseline}
+    regressions = []
+    for result in results:
+        base = baseline.get(config_key(result))
+        if base is None:
+            continue
+        for metric in METRICS:
+            ratio = result[metric] / base[metric]
+            flag = ""
+            if ratio < 1 - tolerance:
+                regressions.append((config_key(result), metric, ratio))
+                flag = " !"
+            agent, _, batch_size, units = config_key(result)
+            print(
+                f"{agent:>10} {batch_size:>6} {units:>6} {metric:>18} {ratio:>7.2f}"
+                + flag
+            )
+    return regressions
+
+
+@click.command()
+@click.option(
+    "--agent",
+    "-a",
+    "agents",
+    multiple=True,
+    default=tuple(AGENTS),
+    help="Agents to benchmark. Defaults to all registered agents.",
+)
+@click.option("--env", "env_name", default="Navigation", show_default=True)
+@click.option("--batch-size", "-b", type=int, multiple=True, default=(64, 256))
+@click.option("--units", "-u", type=int, multiple=True, default=(64, 256))
+@click.option("--buffer-size", type=int, default=10000, show_default=True)
+@click.option("--steps", "-n", type=int, default=20, show_default=True)
+@click.option("--threads", type=int, default=1, show_default=True)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    default="benchmark_agents.json",
+    show_default=True,
+)
+@click.option(
+    "--baseline",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Results of a previous run to compare against.",
+)
+@click.option(
+    "--tolerance",
+    type=float,
+    default=0.1,
+    show_default=True,
+    help="Maximum relative throughput drop before reporting a regression.",
+)
+def main(**kwargs):
+    """Benchmark agents and save the results as JSON."""
+    # pylint:disable=too-many-locals
+    # Children inherit the environment: keep the benchmark on the CPU and avoid
+    # oversubscribing cores across BLAS and PyTorch thread pools
+    os.environ["CUDA_VISIBLE_DEVICES"] = ""
+    os.environ["OMP_NUM_THREADS"] = str(kwargs["threads"])
+    context = multiprocessing.get_context("spawn")
+
+    print(
+        f"{'agent':>10} {'batch':>6} {'units':>6} {'learn/s':>9} {'act/s':>9}"
+        f" {'peak MB':>8}"
+    )
+    results = []
+    for agent, batch_size, units in itertools.product(
+        kwargs["agents"], kwargs["batch_size"], kwargs["units"]
+    ):
+        args = (
+            agent,
+            kwargs["env_name"],
+            batch_size,
+            units,
+            kwargs["buffer_size"],
+            kwargs["steps"],
+            kwargs["seed"],
+        )
+        with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as pool:
+            result = pool.submit(run_config, *args).result()
+        results.append(result)
+        print(
+            f"{agent:>10} {batch_size:>6} {units:>6}"
+            f" {result['learn_steps_per_s']:>9.1f} {result['act_steps_per_s']:>9.1f}"
+            f" {result['peak_memory_mb']:>8.1f}"
+        )
+
+    with open(kwargs["output"], "w") as file:
+        json.dump(results, file, indent=2)
+
+    if kwargs["baseline"] is not None:
+        with open(kwargs["baseline"]) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, kwargs["tolerance"])
+        if regressions:
+            print(f"{len(regressions)} throughput regressions", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()  # pylint:disable=no-value-for-parameter
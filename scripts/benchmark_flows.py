@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# pylint:disable=missing-docstring
+"""Compare sampling and log-likelihood throughput of normalizing flows.
+
+Sampling corresponds to the forward (encode) direction of a flow, while
+log-likelihood evaluation corresponds to the reverse (decode) direction.
+"""
+import timeit
+
+import click
+import torch
+
+from raylab.policy.modules.networks import MLP
+from raylab.torch.nn.distributions.flows import AffineCouplingTransform
+from raylab.torch.nn.distributions.flows import CompositeTransform
+from raylab.torch.nn.distributions.flows import IAF
+from raylab.torch.nn.distributions.flows import MAF
+from raylab.torch.nn.distributions.flows import PiecewiseRQSCouplingTransform
+from raylab.torch.nn.distributions.flows.masks import create_alternating_binary_mask
+
+
+def coupling_flow(cls, size, num_layers, hidden_size):
+    def transform_net_create_fn(in_features, out_features):
+        return MLP(in_features, out_features, hidden_size)
+
+    return CompositeTransform(
+        [
+            cls(
+                create_alternating_binary_mask(size, even=bool(idx % 2)),
+                transform_net_create_fn,
+            )
+            for idx in range(num_layers)
+        ]
+    )
+
+
+def autoregressive_flow(cls, size, num_layers, hidden_size):
+    return CompositeTransform(
+        [
+            cls(size, parity=bool(idx % 2), hidden_size=hidden_size)
+            for idx in range(num_layers)
+        ]
+    )
+
+
+FLOWS = {
+    "MAF": lambda *args: autoregressive_flow(MAF, *args),
+    "IAF": lambda *args: autoregressive_flow(IAF, *args),
+    "AffineCoupling": lambda *args: coupling_flow(AffineCouplingTransform, *args),
+    "RQSCoupling": lambda *args: coupling_flow(PiecewiseRQSCouplingTransform, *args),
+}
+
+
+@click.command()
+@click.option("--sizes", "-s", type=int, multiple=True, default=(4, 16, 64))
+@click.option("--batch-size", "-b", type=int, default=256, show_default=True)
+@click.option("--num-layers", "-l", type=int, default=4, show_default=True)
+@click.option("--hidden-size", type=int, default=64, show_default=True)
+@click.option("--number", "-n", type=int, default=20, show_default=True)
+def main(sizes, batch_size, num_layers, hidden_size, number):
+    """Print samples and log-probs per second for each flow and event size."""
+    # pylint:disable=too-many-arguments
+    print(f"{'flow':>16} {'size':>6} {'sample/s':>12} {'log_prob/s':>12}")
+    for size in sizes:
+        inputs = torch.randn(batch_size, size)
+        for name, flow_fn in FLOWS.items():
+            flow = flow_fn(size, num_layers, hidden_size)
+            params = {}
+
+            with torch.no_grad():
+                sample_time = min(
+                    timeit.repeat(lambda: flow(inputs, params), number=number, repeat=3)
+                )
+                log_prob_time = min(
+                    timeit.repeat(
+                        lambda: flow(inputs, params, reverse=True),
+                        number=number,
+                        repeat=3,
+                    )
+                )
+
+            sample_rate = batch_size * number / sample_time
+            log_prob_rate = batch_size * number / log_prob_time
+            print(f"{name:>16} {size:>6} {sample_rate:>12.0f} {log_prob_rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()  # pylint:disable=no-value-for-parameter
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# pylint:disable=missing-docstring
+"""Time ACKTR actor and critic updates with K-FAC and EKFAC optimizers.
+
+Mirrors `ACKTRTorchPolicy`: the actor records curvature statistics from
+sampled actions before preconditioning the surrogate loss gradient, while the
+critic records them from its regression loss.
+"""
+import timeit
+
+import click
+import torch
+from gym.spaces import Box
+
+from raylab.policy.modules import get_module
+from raylab.torch.optim.kfac import EKFAC
+from raylab.torch.optim.kfac import KFAC
+
+OPTIMIZERS = {"KFAC": KFAC, "EKFAC": EKFAC}
+
+
+def actor_update(actor, optim, obs, act, fvp_samples):
+    with optim.record_stats():
+        _, log_prob = actor.sample(obs, (fvp_samples,))
+        log_prob.mean().backward()
+
+    optim.zero_grad()
+    (-actor.log_prob(obs, act).mean()).backward()
+    optim.step()
+
+
+def critic_update(critic, optim, obs, targets):
+    with optim.record_stats():
+        critic(obs).squeeze(-1).pow(2).mean().backward()
+
+    optim.zero_grad()
+    critic(obs).squeeze(-1).sub(targets).pow(2).mean().backward()
+    optim.step()
+
+
+@click.command()
+@click.option("--obs-dim", type=int, default=17, show_default=True)
+@click.option("--act-dim", type=int, default=6, show_default=True)
+@click.option("--units", type=int, multiple=True, default=(64, 64, 64))
+@click.option("--batch-size", "-b", type=int, default=2048, show_default=True)
+@click.option("--fvp-samples", type=int, default=10, show_default=True)
+@click.option("--update-freq", type=int, default=1, show_default=True)
+@click.option("--number", "-n", type=int, default=20, show_default=True)
+def main(obs_dim, act_dim, units, batch_size, fvp_samples, update_freq, number):
+    """Print the mean time in milliseconds of each update."""
+    # pylint:disable=too-many-arguments,too-many-locals
+    obs_space = Box(-1, 1, shape=(obs_dim,))
+    action_space = Box(-1, 1, shape=(act_dim,))
+    obs = torch.randn(batch_size, obs_dim)
+    act = torch.rand(batch_size, act_dim) * 2 - 1
+    targets = torch.randn(batch_size)
+
+    print(f"{'optimizer':>10} {'async':>6} {'actor (ms)':>12} {'critic (ms)':>12}")
+    for name, cls in OPTIMIZERS.items():
+        for async_inverse in (False, True):
+            module = get_module(
+                obs_space,
+                action_space,
+                {
+                    "type": "TRPO",
+                    "actor": {"encoder": {"units": units}},
+                    "critic": {"units": units},
+                },
+            )
+            kwargs = dict(
+                eps=1e-3,
+                update_freq=update_freq,
+                alpha=0.95,
+                async_inverse=async_inverse,
+            )
+            actor_optim = cls(module.actor, **kwargs)
+            critic_optim = cls(module.critic, **kwargs)
+
+            times = [
+                timeit.timeit(
+                    lambda: actor_update(
+                        module.actor, actor_optim, obs, act, fvp_samples
+                    ),
+                    number=number,
+                ),
+                timeit.timeit(
+                    lambda: critic_update(module.critic, critic_optim, obs, targets),
+                    number=number,
+                ),
+            ]
+            actor_ms, critic_ms = (t / number * 1e3 for t in times)
+            print(
+                f"{name:>10} {str(async_inverse):>6} {actor_ms:>12.2f}"
+                f" {critic_ms:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()  # pylint:disable=no-value-for-parameter
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# pylint:disable=missing-docstring
+"""Measure latency and throughput of exported actors at various concurrencies.
+
+Compares a `MicroBatchServer` against calling the actor once per request
+(serialized by a lock, as a single forward pass at a time is the baseline).
+Runs fully offline: without `--actor`, a randomly initialized MLP policy is
+exported and served.
+"""
+import statistics
+import threading
+import time
+
+import click
+import numpy as np
+import torch
+from gym.spaces import Box
+
+from raylab.policy.export import export_actor
+from raylab.policy.modules.actor import MLPDeterministicPolicy
+from raylab.utils.serving import MicroBatchServer
+
+
+def random_actor(obs_dim, act_dim, units):
+    obs_space = Box(-np.inf, np.inf, shape=(obs_dim,))
+    action_space = Box(-1, 1, shape=(act_dim,))
+    spec = MLPDeterministicPolicy.spec_cls(units=units, activation="ReLU")
+    return export_actor(MLPDeterministicPolicy(obs_space, action_space, spec))
+
+
+def unbatched(actor):
+    lock = threading.Lock()
+
+    def compute_action(obs):
+        with lock, torch.no_grad():
+            return actor(torch.from_numpy(obs[None]))[0].numpy()
+
+    return compute_action
+
+
+def run_clients(compute_action, obs_dim, concurrency, requests):
+    latencies = [[] for _ in range(concurrency)]
+
+    def client(idx):
+        obs = np.random.randn(obs_dim).astype(np.float32)
+        for _ in range(requests):
+            start = time.perf_counter()
+            compute_action(obs)
+            latencies[idx].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    flat = sorted(lat for lats in latencies for lat in lats)
+    return {
+        "p50": statistics.median(flat) * 1e6,
+        "p99": flat[int(0.99 * (len(flat) - 1))] * 1e6,
+        "throughput": len(flat) / elapsed,
+    }
+
+
+@click.command()
+@click.option("--actor", type=click.Path(exists=True, dir_okay=False), default=None)
+@click.option("--obs-dim", type=int, default=17, show_default=True)
+@click.option("--act-dim", type=int, default=6, show_default=True)
+@click.option("--units", type=int, multiple=True, default=(256, 256))
+@click.option("--concurrency", "-c", type=int, multiple=True, default=(1, 4, 16, 64))
+@click.option("--requests", "-n", type=int, default=200, show_default=True)
+@click.option("--max-batch-size", type=int, default=32, show_default=True)
+@click.option("--max-latency-us", type=int, default=500, show_default=True)
+def main(
+    actor,
+    obs_dim,
+    act_dim,
+    units,
+    concurrency,
+    requests,
+    max_batch_size,
+    max_latency_us,
+):
+    """Print p50/p99 latency (us) and throughput (requests/s) per concurrency."""
+    # pylint:disable=too-many-arguments
+    torch.set_num_threads(1)
+    if actor is not None:
+        actor = torch.jit.load(actor, map_location="cpu")
+    else:
+        actor = random_actor(obs_dim, act_dim, units)
+
+    print(
+        f"{'mode':>10} {'clients':>8} {'p50 (us)':>10} {'p99 (us)':>10}"
+        f" {'req/s':>10}"
+    )
+    server = MicroBatchServer(
+        actor, max_batch_size=max_batch_size, max_latency_us=max_latency_us
+    )
+    with server:
+        for clients in concurrency:
+            modes = {
+                "unbatched": unbatched(actor),
+                "batched": server.compute_action,
+            }
+            for mode, compute_action in modes.items():
+                stats = run_clients(compute_action, obs_dim, clients, requests)
+                print(
+                    f"{mode:>10} {clients:>8} {stats['p50']:>10.0f}"
+                    f" {stats['p99']:>10.0f} {stats['throughput']:>10.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()  # pylint:disable=no-value-for-parameter
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# pylint:disable=missing-docstring
+"""Measure the wall-clock startup time of raylab imports and CLI commands.
+
+Each command runs in a fresh Python process, so that no module is cached.
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+import click
+
+COMMANDS = {
+    "import raylab": [sys.executable, "-c", "import raylab"],
+    "import raylab.envs.registry": [
+        sys.executable,
+        "-c",
+        "import raylab.envs.registry",
+    ],
+    "register_all": [sys.executable, "-c", "import raylab; raylab.register_all()"],
+    "raylab --help": [
+        sys.executable,
+        "-c",
+        "from raylab.cli import raylab; raylab(['--help'])",
+    ],
+    "raylab info list SoftAC": [
+        sys.executable,
+        "-c",
+        "from raylab.cli import raylab; raylab(['info', 'list', 'SoftAC'])",
+    ],
+}
+
+
+def time_command(args):
+    start = time.perf_counter()
+    subprocess.run(
+        args, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option("--repeat", "-r", type=int, default=5, show_default=True)
+def main(repeat):
+    """Print the mean and minimum startup time of each command in seconds."""
+    print(f"{'command':>32} {'mean':>8} {'min':>8}")
+    for name, args in COMMANDS.items():
+        times = [time_command(args) for _ in range(repeat)]
+        print(f"{name:>32} {statistics.mean(times):>8.3f} {min(times):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()  # pylint:disable=no-value-for-parameter
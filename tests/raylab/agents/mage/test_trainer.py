@@ -25,3 +25,10 @@ def test_default_config(trainer_cls):
 def test_init(trainer):
     assert hasattr(trainer, "workers")
     assert not hasattr(trainer, "virtual_replay")
+
+
+def test_rejects_data_parallel_learners(trainer_cls):
+    with pytest.raises(AssertionError):
+        trainer_cls(
+            env="CartPoleSwingUp-v1", config={"num_learners": 2, "learning_starts": 2}
+        )
@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 import pytest
 
 
@@ -12,7 +14,8 @@ def policy_cls():
 
 
 @pytest.fixture(
-    params=EXPLORATION_TYPES, ids=tuple(s.split(".")[-1] for s in EXPLORATION_TYPES),
+    params=EXPLORATION_TYPES,
+    ids=tuple(s.split(".")[-1] for s in EXPLORATION_TYPES),
 )
 def exploration(request):
     return "raylab.utils.exploration." + request.param
@@ -20,3 +23,51 @@ def exploration(request):
 
 def test_policy_creation(policy_cls, obs_space, action_space, exploration):
     policy_cls(obs_space, action_space, {"exploration_config": {"type": exploration}})
+
+
+def test_batched_parameter_noise(policy_cls, obs_space, action_space):
+    config = {
+        "exploration_config": {
+            "type": "raylab.utils.exploration.ParameterNoise",
+            "num_perturbations": 3,
+            "pure_exploration_steps": 0,
+        }
+    }
+    policy = policy_cls(obs_space, action_space, config)
+    obs = [obs_space.sample() for _ in range(5)]
+
+    actions, _, _ = policy.compute_actions(obs, explore=True)
+    assert actions.shape == (5,) + action_space.shape
+    assert all(action_space.contains(act) for act in actions)
+
+
+@pytest.fixture
+def batched_policy(policy_cls, obs_space, action_space):
+    config = {
+        "exploration_config": {
+            "type": "raylab.utils.exploration.ParameterNoise",
+            "num_perturbations": 3,
+            "pure_exploration_steps": 0,
+        }
+    }
+    policy = policy_cls(obs_space, action_space, config)
+    policy.exploration.on_episode_start(policy)
+    return policy
+
+
+def test_resample_episode_env(batched_policy):
+    policy = batched_policy
+    noise = policy.exploration._perturbation.noise.clone()
+
+    policy.exploration.on_episode_start(policy, episode=SimpleNamespace(env_id=4))
+    changed = (policy.exploration._perturbation.noise != noise).any(dim=-1)
+    assert changed.tolist() == [False, True, False]
+
+
+def test_resample_round_robin(batched_policy):
+    policy = batched_policy
+    for index in (1, 2, 0):
+        noise = policy.exploration._perturbation.noise.clone()
+        policy.exploration.on_episode_start(policy, episode=SimpleNamespace())
+        changed = (policy.exploration._perturbation.noise != noise).any(dim=-1)
+        assert changed.nonzero().flatten().tolist() == [index]
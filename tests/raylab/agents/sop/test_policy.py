@@ -43,3 +43,18 @@ def test_delayed_policy_update(policy, samples):
     assert all(
         not torch.allclose(new, old) for new, old in zip(actor.parameters(), params)
     )
+
+
+@pytest.mark.parametrize("ratio,counts", [(0.5, (3, 3, 2)), (2, (1, 2, 3))])
+def test_update_to_data_ratio(obs_space, action_space, ratio, counts):
+    policy = SOPTorchPolicy(
+        obs_space, action_space, {"policy": {"update_to_data_ratio": ratio}}
+    )
+
+    total = 0
+    for count in counts:
+        samples = fake_batch(obs_space, action_space, batch_size=count)
+        steps = policy.num_improvement_steps(samples)
+        total += steps
+        assert steps <= ratio * count + 1
+    assert total == int(ratio * sum(counts))
@@ -0,0 +1,51 @@
+import pytest
+import torch
+from ray.rllib import SampleBatch
+
+from raylab.agents.acktr import ACKTRTorchPolicy
+from raylab.agents.trpo import TRPOTorchPolicy
+from raylab.policy.stats import LEARNER_STATS_KEY
+from raylab.utils.debug import fake_batch
+
+
+@pytest.fixture(params=(TRPOTorchPolicy, ACKTRTorchPolicy), ids=("TRPO", "ACKTR"))
+def policy_cls(request):
+    return request.param
+
+
+@pytest.fixture
+def make_policy(policy_cls, obs_space, action_space):
+    def make(batched):
+        options = {"val_iters": 2, "line_search_options": {"batched": batched}}
+        return policy_cls(obs_space, action_space, {"policy": options})
+
+    return make
+
+
+def on_policy_samples(policy, batch_size=32):
+    samples = fake_batch(policy.observation_space, policy.action_space, batch_size)
+    obs, act = map(
+        policy.convert_to_tensor,
+        (samples[SampleBatch.CUR_OBS], samples[SampleBatch.ACTIONS]),
+    )
+    with torch.no_grad():
+        logp = policy.module.actor.log_prob(obs, act)
+    samples[SampleBatch.ACTION_LOGP] = logp.numpy()
+    return policy.postprocess_trajectory(samples)
+
+
+def test_batched_line_search(make_policy):
+    batched, unbatched = make_policy(True), make_policy(False)
+    unbatched.module.load_state_dict(batched.module.state_dict())
+    samples = on_policy_samples(batched)
+
+    torch.manual_seed(42)
+    info = batched.learn_on_batch(samples)[LEARNER_STATS_KEY]
+    torch.manual_seed(42)
+    expected = unbatched.learn_on_batch(samples)[LEARNER_STATS_KEY]
+
+    for key in ("expected_improvement", "actual_improvement"):
+        assert info[key] == pytest.approx(expected[key], rel=1e-4, abs=1e-6)
+    params = batched.module.actor.parameters()
+    expected_params = unbatched.module.actor.parameters()
+    assert all(torch.allclose(p, q, atol=1e-5) for p, q in zip(params, expected_params))
@@ -87,3 +87,16 @@ def test_second_train(trainer, timesteps_per_iteration, learning_starts):
 
     policy = trainer.get_policy()
     assert policy.global_timestep == expected_timesteps
+
+
+def test_async_rollouts(trainer_cls, config, timesteps_per_iteration):
+    config = {
+        **config,
+        "async_rollouts": True,
+        "num_workers": 2,
+        "broadcast_interval": 2,
+    }
+    trainer = trainer_cls(config=config)
+    res = trainer.train()
+
+    assert res["timesteps_total"] >= timesteps_per_iteration
@@ -1,8 +1,13 @@
 import pytest
 from ray.rllib import Policy
 from ray.rllib.agents.trainer import COMMON_CONFIG
+from ray.rllib.execution.common import LEARNER_INFO
+from ray.rllib.policy.policy import LEARNER_STATS_KEY
+from ray.rllib.policy.sample_batch import DEFAULT_POLICY_ID
 
 from raylab.agents.trainer import Trainer
+from raylab.policy import learner_stats
+from raylab.utils.profiler import Profiler
 
 
 @pytest.fixture
@@ -117,3 +122,40 @@ def test_second_train(trainer, timesteps_per_iteration):
 
     policy = trainer.get_policy()
     assert policy.global_timestep == expected_timesteps
+
+
+@pytest.fixture
+def profiled_trainer_cls(dummy_policy_cls):
+    class Profiled(dummy_policy_cls):
+        # pylint:disable=all
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.profiler = Profiler()
+            self.learn_calls = 0
+
+        @learner_stats
+        def learn_on_batch(self, samples):
+            self.learn_calls += 1
+            return super().learn_on_batch(samples)
+
+        def profiler_stats(self):
+            return self.profiler.stats()
+
+    class Sub(Trainer):
+        _name = "Dummy"
+        _policy_class = Profiled
+
+    return Sub
+
+
+def test_profiler_stats(profiled_trainer_cls, config):
+    trainer = profiled_trainer_cls(config=config)
+    policy = trainer.get_policy()
+
+    for _ in range(2):
+        res = trainer.train()
+        stats = res["info"][LEARNER_INFO][DEFAULT_POLICY_ID][LEARNER_STATS_KEY]
+        # Accumulated over the iteration
+        assert policy.learn_calls > 1
+        assert stats["profile/learn_on_batch/calls"] == policy.learn_calls
+        policy.learn_calls = 0
@@ -11,3 +11,15 @@ def test_command_line_interface():
     help_result = runner.invoke(cli.raylab, ["--help"])
     assert help_result.exit_code == 0
     assert "--help  Show this message and exit." in help_result.output
+
+
+def test_rollout_columnar_requires_out(tmp_path):
+    checkpoint = tmp_path / "checkpoint-1"
+    checkpoint.touch()
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.raylab, ["rollout", str(checkpoint), "--agent", "SAC", "--columnar"]
+    )
+    assert result.exit_code == 2
+    assert "--columnar requires an output directory" in result.output
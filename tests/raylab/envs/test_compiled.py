@@ -0,0 +1,86 @@
+import pytest
+import torch
+
+from raylab.envs import CompiledEnvFn
+from raylab.envs import get_reward_fn
+from raylab.envs import get_termination_fn
+from raylab.envs.registry import ENVS
+from raylab.envs.rewards import REWARDS
+from raylab.envs.termination import TERMINATIONS
+from raylab.utils.debug import fake_space_samples
+
+
+VALID_ENVS = sorted(
+    set(ENVS.keys()).intersection(set(REWARDS.keys()), set(TERMINATIONS.keys()))
+)
+
+
+@pytest.fixture(params=VALID_ENVS)
+def env_id(request):
+    return request.param
+
+
+@pytest.fixture
+def env_config(env_id):
+    config = {}
+    if env_id.endswith("-v3"):
+        config["kwargs"] = dict(exclude_current_positions_from_observation=False)
+    return config
+
+
+@pytest.fixture(params=((10,), (4, 10)), ids=("Batch", "Particles"))
+def inputs(request, envs, env_id, env_config):
+    env = envs[env_id](env_config)
+    size = int(torch.Size(request.param).numel())
+
+    def sample(space):
+        samples = torch.as_tensor(fake_space_samples(space, batch_size=size))
+        return samples.float().reshape(request.param + samples.shape[1:])
+
+    obs_space, action_space = env.observation_space, env.action_space
+    return sample(obs_space), sample(action_space), sample(obs_space)
+
+
+def test_compiled_env_fns(env_id, env_config, inputs):
+    for getter in (get_reward_fn, get_termination_fn):
+        eager = getter(env_id, env_config)
+        compiled = getter(env_id, env_config, compiled=True)
+        assert isinstance(compiled, CompiledEnvFn)
+
+        expected = eager(*inputs)
+        outputs = compiled(*inputs)
+        assert outputs.shape == expected.shape
+        assert outputs.dtype == expected.dtype
+        assert torch.allclose(outputs.float(), expected.float(), atol=1e-5)
+
+
+def test_specialization(mocker):
+    def reward_fn(state, action, next_state):
+        return (next_state - state).sum(-1) - action.pow(2).sum(-1)
+
+    compiled = CompiledEnvFn(reward_fn, max_specializations=2)
+    check = mocker.spy(compiled, "check")
+
+    for particles in (2, 2, 3, 4):
+        state, next_state = torch.randn(2, particles, 5, 3).unbind(0)
+        action = torch.randn(particles, 5, 1)
+        rew = compiled(state, action, next_state)
+        assert rew.shape == (particles, 5)
+        assert torch.allclose(rew, reward_fn(state, action, next_state))
+
+    assert check.call_count == 2
+    assert len(compiled._specialized) == 2
+
+
+def test_data_dependent_fallback():
+    def termination_fn(state, action, next_state):
+        # pylint:disable=unused-argument
+        if bool(next_state.abs().max() > 1):
+            return next_state[..., 0] > 1
+        return torch.zeros_like(next_state[..., 0]).bool()
+
+    compiled = CompiledEnvFn(termination_fn)
+    state = torch.randn(10, 3)
+    done = compiled(state, torch.randn(10, 1), state * 0.1)
+    assert not done.any()
+    assert all(f is compiled.default for f in compiled._specialized.values())
@@ -0,0 +1,41 @@
+import json
+
+from raylab.envs import registry
+
+
+def test_gym_ids():
+    assert registry.filtered_gym_env_ids().issubset(registry.IDS)
+
+
+def test_env_ids_manifest(tmp_path, mocker):
+    path = str(tmp_path / "manifest.json")
+
+    manifest = registry.env_ids_manifest(path)
+    assert set(manifest).issubset(registry.EXTERNAL_LIBRARIES)
+    for ids in manifest.values():
+        assert set(ids).issubset(registry.IDS)
+    with open(path, "r") as file:
+        assert json.load(file)["ids"] == manifest
+
+    spy = mocker.spy(registry, "_compute_env_ids_manifest")
+    assert registry.env_ids_manifest(path) == manifest
+    assert spy.call_count == 0
+
+
+def test_stale_manifest(tmp_path, mocker):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"signature": {}, "ids": {}}))
+
+    spy = mocker.spy(registry, "_compute_env_ids_manifest")
+    registry.env_ids_manifest(str(path))
+    assert spy.call_count == 1
+    assert json.loads(path.read_text())["signature"]
+
+
+def test_no_manifest_file(tmp_path, monkeypatch, mocker):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    spy = mocker.spy(registry, "_compute_env_ids_manifest")
+
+    registry.env_ids_manifest()
+    assert spy.call_count == 1
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+import torch
+from ray.rllib.env.vector_env import VectorEnv
+
+import raylab.envs as envs
+from raylab.envs.wrappers import CorrelatedIrrelevant
+from raylab.envs.wrappers import GaussianRandomWalks
+from raylab.envs.wrappers import LinearRedundant
+from raylab.envs.wrappers import NonlinearRedundant
+from raylab.envs.wrappers import RandomIrrelevant
+from raylab.envs.wrappers import VectorCorrelatedIrrelevant
+from raylab.envs.wrappers import VectorGaussianRandomWalks
+from raylab.envs.wrappers import VectorLinearRedundant
+from raylab.envs.wrappers import VectorNonlinearRedundant
+from raylab.envs.wrappers import VectorRandomIrrelevant
+from raylab.envs.wrappers import VectorSinglePrecision
+from raylab.envs.wrappers.utils import ignore_rightmost_variables
+
+
+NUM_ENVS = 3
+
+WRAPPERS = {
+    VectorCorrelatedIrrelevant: (CorrelatedIrrelevant, (4,)),
+    VectorGaussianRandomWalks: (GaussianRandomWalks, (4,)),
+    VectorLinearRedundant: (LinearRedundant, ()),
+    VectorNonlinearRedundant: (NonlinearRedundant, ()),
+    VectorRandomIrrelevant: (RandomIrrelevant, (4,)),
+}
+
+
+@pytest.fixture
+def vector_env(env_creator, env_config):
+    existing = [env_creator(env_config) for _ in range(NUM_ENVS)]
+    return VectorEnv.wrap(existing_envs=existing, num_envs=NUM_ENVS)
+
+
+@pytest.fixture(params=tuple(WRAPPERS), ids=lambda cls: cls.__name__)
+def wrapper_cls(request):
+    return request.param
+
+
+@pytest.fixture
+def wrapped(wrapper_cls, vector_env):
+    _, args = WRAPPERS[wrapper_cls]
+    return wrapper_cls(vector_env, *args)
+
+
+def test_observation_space(wrapper_cls, wrapped, env):
+    single_cls, args = WRAPPERS[wrapper_cls]
+    single = single_cls(env, *args)
+
+    assert wrapped.num_envs == NUM_ENVS
+    assert wrapped.observation_space == single.observation_space
+    assert wrapped.added_size == single.added_size
+
+
+def test_seed(wrapped):
+    assert hasattr(wrapped, "np_random")
+    assert len(wrapped.seed(42)) == 1
+
+
+def test_vector_reset(wrapped):
+    obs = wrapped.vector_reset()
+    assert len(obs) == NUM_ENVS
+    assert all(o in wrapped.observation_space for o in obs)
+
+
+def test_reset_at(wrapped):
+    wrapped.vector_reset()
+    obs = wrapped.reset_at(1)
+    assert obs in wrapped.observation_space
+
+
+def test_vector_step(wrapped):
+    wrapped.vector_reset()
+    actions = [wrapped.action_space.sample() for _ in range(NUM_ENVS)]
+    obs, rews, dones, infos = wrapped.vector_step(actions)
+
+    assert len(obs) == len(rews) == len(dones) == len(infos) == NUM_ENVS
+    assert all(o in wrapped.observation_space for o in obs)
+
+
+def test_observations_not_reused(wrapped):
+    obs = wrapped.vector_reset()
+    actions = [wrapped.action_space.sample() for _ in range(NUM_ENVS)]
+    new_obs, _, _, _ = wrapped.vector_step(actions)
+
+    assert not any(np.shares_memory(o, n) for o, n in zip(obs, new_obs))
+
+
+def test_original_observations(mocker, wrapped):
+    spy = mocker.spy(wrapped.env, "vector_reset")
+    obs = np.stack(wrapped.vector_reset())
+    base = np.stack(spy.spy_return).astype(obs.dtype)
+
+    original = wrapped.original_observations(obs)
+    assert np.allclose(original, base)
+
+    tensor = wrapped.original_observations(torch.from_numpy(obs))
+    assert torch.is_tensor(tensor)
+    assert np.allclose(tensor.numpy(), base)
+
+
+def test_wrapped_reward_fn(env_name, env_config, wrapped):
+    base = envs.get_reward_fn(env_name, env_config)
+    reward_fn = ignore_rightmost_variables(base, wrapped.added_size)
+
+    obs = wrapped.vector_reset()
+    actions = [wrapped.action_space.sample() for _ in range(NUM_ENVS)]
+    new_obs, rews, _, _ = wrapped.vector_step(actions)
+
+    inputs = (np.stack(x).astype(np.float32) for x in (obs, actions, new_obs))
+    rews_ = reward_fn(*map(torch.from_numpy, inputs)).numpy()
+    assert np.allclose(rews, rews_, atol=1e-5)
+
+
+def test_single_precision(vector_env):
+    wrapped = VectorSinglePrecision(vector_env)
+    assert wrapped.observation_space.dtype == np.float32
+    assert wrapped.action_space.dtype == np.float32
+
+    obs = wrapped.vector_reset()
+    assert all(o.dtype == np.float32 for o in obs)
+    assert all(o in wrapped.observation_space for o in obs)
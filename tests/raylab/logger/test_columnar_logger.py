@@ -0,0 +1,80 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from raylab.logger.columnar_logger import ColumnarLogger
+from raylab.logger.columnar_logger import read_columnar_progress
+from raylab.utils.exp_data import load_params
+from raylab.utils.exp_data import load_progress
+
+
+@pytest.fixture
+def logger_cls():
+    return ColumnarLogger.with_options(flush_interval=3)
+
+
+@pytest.fixture
+def results():
+    results = [
+        {"training_iteration": i, "info": {"loss": float(i)}, "config": {"lr": 0.1}}
+        for i in range(5)
+    ]
+    # New keys may appear in later iterations
+    results[-1]["evaluation"] = {"episode_reward_mean": 1.0}
+    return results
+
+
+def test_flush_interval(logger_cls, results, tmp_path):
+    logger = logger_cls({}, str(tmp_path))
+    for result in results[:2]:
+        logger.on_result(result)
+    assert not (tmp_path / "progress.columns.pkl").exists()
+
+    logger.on_result(results[2])
+    progress = read_columnar_progress(str(tmp_path / "progress.columns.pkl"))
+    assert len(progress) == 3
+
+
+def test_read(logger_cls, results, tmp_path):
+    logger = logger_cls({}, str(tmp_path))
+    for result in results:
+        logger.on_result(result)
+    logger.close()
+
+    progress = load_progress(str(tmp_path / "progress.columns.pkl"), verbose=False)
+    assert len(progress) == len(results)
+    assert progress["training_iteration"].tolist() == list(range(5))
+    assert progress["info/loss"].tolist() == [float(i) for i in range(5)]
+    assert not any(col.startswith("config") for col in progress.columns)
+    assert np.isnan(progress["evaluation/episode_reward_mean"].iloc[0])
+    assert progress["evaluation/episode_reward_mean"].iloc[-1] == 1.0
+
+
+def test_read_truncated(logger_cls, results, tmp_path):
+    logger = logger_cls({}, str(tmp_path))
+    for result in results:
+        logger.on_result(result)
+    logger.close()
+
+    path = tmp_path / "progress.columns.pkl"
+    data = path.read_bytes()
+    # Cut the last batch short, as an interrupted write would
+    path.write_bytes(data[:-10])
+
+    progress = read_columnar_progress(str(path))
+    assert progress["training_iteration"].tolist() == list(range(3))
+
+
+def test_params_files(logger_cls, results, tmp_path):
+    config = {"lr": 0.1, "policy": {"buffer_size": 100}}
+    logger = logger_cls(config, str(tmp_path))
+    for result in results:
+        logger.on_result(result)
+    logger.close()
+
+    assert (tmp_path / "params.json").exists()
+    assert (tmp_path / "params.pkl").exists()
+    assert load_params(str(tmp_path / "params.json"))["lr"] == 0.1
+    with open(tmp_path / "params.pkl", "rb") as file:
+        assert pickle.load(file) == config
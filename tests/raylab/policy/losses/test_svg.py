@@ -3,7 +3,9 @@ import torch
 from ray.rllib import SampleBatch
 
 from raylab.policy.losses.svg import OneStepSVG
+from raylab.policy.losses.svg import pad_episodes
 from raylab.policy.losses.svg import ReproduceRewards
+from raylab.policy.losses.svg import TrajectorySVG
 
 
 @pytest.fixture
@@ -100,3 +102,50 @@ def test_propagates_gradients(repr_rewards, consistent_batch, actor):
     rew.sum().backward()
 
     assert all(p.grad is not None for p in actor.parameters())
+
+
+@pytest.fixture
+def episodes(consistent_batch):
+    sizes = (10, 25, 1, 40)
+    episodes, start = [], 0
+    for size in sizes:
+        episodes += [{k: v[start : start + size] for k, v in consistent_batch.items()}]
+        start += size
+    return episodes
+
+
+def test_pad_episodes(episodes):
+    act, new_obs, init_obs, mask = pad_episodes(episodes)
+
+    horizon, num_eps = 40, len(episodes)
+    assert act.shape[:2] == (horizon, num_eps)
+    assert new_obs.shape[:2] == (horizon, num_eps)
+    assert init_obs.shape[0] == num_eps
+    assert mask.shape == (horizon, num_eps)
+    assert mask.sum().item() == sum(len(ep[SampleBatch.ACTIONS]) for ep in episodes)
+    for idx, episode in enumerate(episodes):
+        length = len(episode[SampleBatch.ACTIONS])
+        assert torch.allclose(act[:length, idx], episode[SampleBatch.ACTIONS])
+        assert torch.allclose(new_obs[:length, idx], episode[SampleBatch.NEXT_OBS])
+
+
+@pytest.fixture
+def trajectory_svg(model, actor, critic, reward_fn):
+    loss = TrajectorySVG(model, actor, critic)
+    loss.set_reward_fn(reward_fn)
+    return loss
+
+
+def test_batched_trajectory_svg(trajectory_svg, episodes, actor):
+    def loss_and_grads(batched: bool):
+        trajectory_svg.batched = batched
+        actor.zero_grad()
+        loss, _ = trajectory_svg(episodes)
+        loss.backward()
+        return loss, [p.grad.clone() for p in actor.parameters()]
+
+    seq_loss, seq_grads = loss_and_grads(batched=False)
+    loss, grads = loss_and_grads(batched=True)
+
+    assert torch.allclose(loss, seq_loss, atol=1e-5)
+    assert all(torch.allclose(g, s, atol=1e-5) for g, s in zip(grads, seq_grads))
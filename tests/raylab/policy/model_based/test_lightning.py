@@ -16,6 +16,7 @@ from raylab.options import configure
 from raylab.policy import OptimizerCollection
 from raylab.policy.losses import Loss
 from raylab.policy.model_based.lightning import DataModule
+from raylab.policy.model_based.lightning import EnsembleSnapshots
 from raylab.policy.model_based.lightning import LightningModel
 from raylab.policy.model_based.lightning import LightningModelTrainer
 from raylab.policy.model_based.lightning import TrainingSpec
@@ -302,3 +303,84 @@ def test_checkpointing(build_trainer):
     trainer.check_early_stopping(early_stopping, pl_model)
     after_params = list(pl_model.parameters())
     assert not any([torch.allclose(b, a) for b, a in zip(before_params, after_params)])
+
+
+class DivergingLoss(DummyLoss):
+    """First model's loss increases every step while the others decrease."""
+
+    def __init__(self, models):
+        super().__init__(models)
+        self._seq = itertools.count()
+        self.models = models
+
+    def _losses(self):
+        step = float(next(self._seq))
+        trends = torch.full((self.ensemble_size,), -step)
+        trends[0] = step
+        params = torch.stack(
+            [sum(p.sum() for p in m.parameters()) for m in self.models]
+        )
+        return trends + 1e-3 * params
+
+    def __call__(self, _):
+        losses = self._losses()
+        info = {"loss(models)": losses.mean().item()}
+        self.last_output = (losses, info)
+        return losses.mean(), info
+
+
+def test_per_member_early_stopping(mocker, build_trainer, ensemble_size):
+    trainer = build_trainer(DivergingLoss)
+    spec = trainer.spec.training
+    spec.max_epochs = 4
+    spec.max_steps = None
+    spec.patience = 1
+
+    pl_model = trainer.pl_model
+    pl_trainer, early_stopping = spec.build_trainer(
+        check_val=False, snapshots=trainer.snapshots
+    )
+    save = mocker.spy(EnsembleSnapshots, "save")
+    freeze = mocker.spy(early_stopping, "freeze")
+
+    trainer.run_training(pl_model, pl_trainer, trainer.datamodule)
+    info = trainer.trainer_info(pl_trainer)
+    trainer.check_early_stopping(early_stopping, pl_model)
+
+    # The first model converges on the second epoch
+    assert save.call_args_list[0][0][2] == list(range(ensemble_size))
+    assert all(0 not in c[0][2] for c in save.call_args_list[1:])
+    assert [0] in [c[0][1] for c in freeze.call_args_list]
+    if ensemble_size > 1:
+        # Others keep training
+        assert info["model_epochs"] == spec.max_epochs
+    else:
+        assert info["model_epochs"] == 2
+    assert all(p.requires_grad for p in pl_model.parameters())
+    assert trainer.snapshots.saved.all()
+
+
+def test_resume_per_member_state(build_trainer, models):
+    trainer = build_trainer(DivergingLoss)
+    spec = trainer.spec.training
+    spec.max_epochs = 2
+    spec.max_steps = None
+    spec.patience = 1
+
+    pl_model = trainer.pl_model
+    pl_trainer, early_stopping = spec.build_trainer(check_val=False)
+    trainer.run_training(pl_model, pl_trainer, trainer.datamodule)
+    state = early_stopping.on_save_checkpoint(pl_trainer, pl_model)
+
+    _, resumed = spec.build_trainer(check_val=False)
+    resumed.on_load_checkpoint(copy.deepcopy(state))
+    resumed.setup(pl_trainer, pl_model, "fit")
+
+    # Per-member progress is not reset on setup
+    for key, value in state["members"].items():
+        assert torch.equal(getattr(resumed._members, key), value)
+    # The first model converged on the second epoch and stays frozen
+    assert resumed._members.frozen[0]
+    assert not any(p.requires_grad for p in models[0].parameters())
+    resumed.unfreeze()
+    assert all(p.requires_grad for p in pl_model.parameters())
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+import torch
+
+from raylab.policy.export import export_actor
+
+
+@pytest.fixture
+def obs_stats(obs_space):
+    mean = np.random.randn(*obs_space.shape).astype(np.float32)
+    std = np.random.uniform(0.5, 2.0, size=obs_space.shape).astype(np.float32)
+    return mean, std
+
+
+def test_deterministic_actor(deterministic_policies, obs_stats, obs, tmp_path):
+    policy, _ = deterministic_policies
+    exported = export_actor(policy, obs_stats)
+
+    mean, std = map(torch.from_numpy, obs_stats)
+    expected = policy((obs - mean) / std)
+    assert torch.allclose(exported(obs), expected)
+
+    path = str(tmp_path / "actor.pt")
+    torch.jit.save(exported, path)
+    loaded = torch.jit.load(path)
+    assert torch.allclose(loaded(obs), expected)
+
+
+def test_stochastic_actor(stochastic_policy, obs, action_space):
+    exported = export_actor(stochastic_policy)
+
+    act = exported(obs)
+    expected, _ = stochastic_policy.deterministic(obs)
+    assert torch.allclose(act, expected)
+    low, high = map(torch.from_numpy, (action_space.low, action_space.high))
+    assert (act >= low).all() and (act <= high).all()
+
+
+def test_export_copies(deterministic_policies, obs):
+    policy, _ = deterministic_policies
+    exported = export_actor(policy)
+    before = exported(obs)
+
+    with torch.no_grad():
+        for param in policy.parameters():
+            param.add_(1.0)
+    assert torch.allclose(exported(obs), before)
+    assert all(p.requires_grad for p in policy.parameters())
@@ -40,3 +40,60 @@ def test_setitem(collection, optimizer):
     assert "param" not in collection
     assert not collection
     assert not list(collection)
+
+
+def _distributed_step(rank, world_size, init_method, results):
+    import torch.distributed as dist
+    from torch.optim import SGD
+
+    dist.init_process_group(
+        "gloo", init_method=init_method, rank=rank, world_size=world_size
+    )
+    param = nn.Parameter(torch.zeros(3))
+    collection = OptimizerCollection()
+    collection["param"] = SGD([param], lr=1.0)
+    collection.distributed = True
+
+    with collection.optimize("param"):
+        param.mul(rank + 1).sum().backward()
+
+    results[rank] = param.detach().clone()
+    dist.destroy_process_group()
+
+
+@pytest.mark.slow
+def test_distributed_optimize(tmp_path):
+    import torch.multiprocessing as mp
+
+    world_size = 2
+    manager = mp.Manager()
+    results = manager.dict()
+    init_method = f"file://{tmp_path / 'store'}"
+    mp.spawn(
+        _distributed_step, args=(world_size, init_method, results), nprocs=world_size
+    )
+
+    expected = torch.full((3,), -sum(range(1, world_size + 1)) / world_size)
+    assert all(torch.allclose(results[r], expected) for r in range(world_size))
+
+
+@pytest.fixture(params=(True, False), ids=lambda x: f"Foreach({x})")
+def foreach(request):
+    return request.param
+
+
+def test_optimize_many(collection, foreach):
+    from raylab.torch.optim import build_optimizer
+
+    module = nn.ModuleDict({"actor": nn.Linear(3, 2), "critic": nn.Linear(3, 1)})
+    for name in module:
+        config = {"type": "RAdam", "lr": 0.1, "foreach": foreach}
+        collection[name] = build_optimizer(module[name], config)
+    params = [p.clone() for p in module.parameters()]
+
+    inputs = torch.randn(4, 3)
+    with collection.optimize("actor", "critic"):
+        loss = module["actor"](inputs).sum() + module["critic"](inputs).sum()
+        loss.backward()
+
+    assert all(not torch.equal(p, q) for p, q in zip(module.parameters(), params))
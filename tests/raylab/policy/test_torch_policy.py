@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+import torch
+
+from raylab.agents.sac import SACTorchPolicy
+from raylab.agents.sop import SOPTorchPolicy
+from raylab.utils.serving import MicroBatchServer
+
+
+@pytest.fixture(params=(SOPTorchPolicy, SACTorchPolicy), ids=("SOP", "SAC"))
+def policy_cls(request):
+    return request.param
+
+
+@pytest.fixture
+def policy(policy_cls, obs_space, action_space):
+    return policy_cls(obs_space, action_space, {"policy": {"fast_actions": True}})
+
+
+@pytest.fixture
+def obs_batch(obs_space):
+    return np.stack([obs_space.sample() for _ in range(10)])
+
+
+def test_fast_actions(policy, obs_batch):
+    assert policy._obs_buffer is not None
+
+    actions, state_out, info = policy.compute_actions(obs_batch, explore=False)
+    assert not state_out
+    assert not info
+
+    policy._obs_buffer = None
+    expected, _, _ = policy.compute_actions(obs_batch, explore=False)
+    assert np.allclose(actions, expected)
+
+
+def test_fast_actions_reuse_buffer(policy, obs_batch):
+    policy.compute_actions(obs_batch, explore=False)
+    buffer = policy._obs_buffer
+
+    actions, _, _ = policy.compute_actions(obs_batch[:1], explore=False)
+    assert policy._obs_buffer is buffer
+    assert actions.shape[0] == 1
+
+
+def test_export_model(policy, obs_batch, tmp_path):
+    policy.export_model(str(tmp_path))
+    path = str(tmp_path / "actor.pt")
+    expected, _, _ = policy.compute_actions(obs_batch, explore=False)
+
+    actor = torch.jit.load(path)
+    with torch.no_grad():
+        actions = actor(torch.as_tensor(obs_batch, dtype=torch.float32)).numpy()
+    assert np.allclose(actions, expected, atol=1e-6)
+
+    with MicroBatchServer.from_file(path) as server:
+        actions = np.stack([server.compute_action(o, timeout=5) for o in obs_batch])
+    assert np.allclose(actions, expected, atol=1e-6)
@@ -1,4 +1,5 @@
 import copy
+import pickle
 
 import pytest
 
@@ -28,3 +29,49 @@ def allow_new_subkey_list():
 
 def test_rllib_info(common_config, common_info, allow_new_subkey_list):
     recursive_check_info(common_config, common_info, allow_new_subkey_list)
+
+
+@pytest.fixture
+def options():
+    from raylab.options import RaylabOptions
+
+    options = RaylabOptions()
+    options.set_option("module/", {"type": "MLP", "units": [32, 32]})
+    options.set_option("gamma", 0.99)
+    return options
+
+
+def test_copy_defaults(options):
+    defaults = options.copy_defaults()
+    assert defaults == options.defaults
+
+    defaults["module"].pop("type")
+    defaults["module"]["units"].append(64)
+    assert options.defaults["module"] == {"type": "MLP", "units": [32, 32]}
+    assert options.copy_defaults()["module"] == {"type": "MLP", "units": [32, 32]}
+
+
+def test_copy_defaults_after_set_option(options):
+    options.copy_defaults()
+    options.set_option("lambda", 0.95)
+
+    assert options.copy_defaults()["lambda"] == 0.95
+
+
+def test_copy_unpicklable_defaults(options, mocker):
+    options.set_option("env_config/", {"creator": lambda: None})
+    dumps = mocker.spy(pickle, "dumps")
+
+    first = options.copy_defaults()
+    second = options.copy_defaults()
+    assert dumps.call_count == 1
+    assert first["env_config"] is not options.defaults["env_config"]
+    assert second == options.defaults
+
+
+def test_merge_defaults_with(options):
+    merged = options.merge_defaults_with({"module": {"units": [64]}})
+    assert merged == {"module": {"type": "MLP", "units": [64]}, "gamma": 0.99}
+
+    merged["gamma"] = 0.5
+    assert options.merge_defaults_with({})["gamma"] == 0.99
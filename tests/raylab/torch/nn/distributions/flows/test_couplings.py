@@ -7,6 +7,8 @@ from raylab.torch.nn.distributions.flows.coupling import AdditiveCouplingTransfo
 from raylab.torch.nn.distributions.flows.coupling import AffineCouplingTransform
 from raylab.torch.nn.distributions.flows.coupling import PiecewiseRQSCouplingTransform
 from raylab.torch.nn.distributions.flows.masks import create_alternating_binary_mask
+from raylab.torch.nn.distributions.flows.masks import create_mid_split_binary_mask
+from raylab.torch.nn.distributions.flows.masks import create_random_binary_mask
 
 PARITIES = (True, False)
 IN_SIZES = (2, 3)
@@ -58,3 +60,31 @@ def test_call(cls, mask, transform_net_create_fn):
     assert logdet.shape == (10,)
     assert torch.allclose(inputs, latent, atol=1e-5)
     assert torch.allclose(logabsdet, -logdet, atol=1e-5)
+
+
+def test_contiguous_mask(cls, transform_net_create_fn):
+    mask = create_mid_split_binary_mask(4)
+    coupling = cls(mask, transform_net_create_fn)
+    assert not coupling.reorder_inputs
+    assert not coupling.reorder_outputs
+    assert not coupling.identity_first
+
+    inputs = torch.randn(10, 4)
+    params = {}
+    out, _ = coupling(inputs, params)
+    assert torch.equal(out[..., 2:], inputs[..., 2:])
+
+    latent, _ = coupling(out, params, reverse=True)
+    assert torch.allclose(inputs, latent, atol=1e-5)
+
+
+def test_load_other_mask(cls, transform_net_create_fn):
+    source = cls(create_random_binary_mask(6), transform_net_create_fn)
+    coupling = cls(create_random_binary_mask(6), transform_net_create_fn)
+    state = source.state_dict()
+    assert not any("order" in key or "inverse" in key for key in state)
+    coupling.load_state_dict(state)
+
+    inputs = torch.randn(10, 6)
+    params = {}
+    assert torch.allclose(coupling(inputs, params)[0], source(inputs, params)[0])
@@ -0,0 +1,85 @@
+import copy
+
+import pytest
+import torch
+
+from raylab.torch.nn.distributions.flows.glow_1x1conv import Invertible1x1Conv
+from raylab.torch.nn.utils import update_polyak
+from raylab.torch.optim.radam import RAdam
+
+
+@pytest.fixture(params=(1, 2, 4))
+def module(request):
+    return Invertible1x1Conv(request.param)
+
+
+@pytest.fixture(params=((), (1,), (4,)))
+def inputs(request, module):
+    return torch.randn(*request.param + (module.dim,)).requires_grad_()
+
+
+def test_invertible_1x1_conv(module, inputs):
+    latent, log_det = module(inputs)
+    W = module._assemble_W()
+    assert torch.allclose(latent, inputs @ W)
+    assert torch.allclose(log_det, torch.slogdet(W)[1], atol=1e-5)
+
+    latent.sum().backward()
+    assert inputs.grad is not None
+
+    latent = latent.detach().requires_grad_()
+    input_, log_det_ = module.backward(latent)
+    assert torch.allclose(input_, inputs, atol=1e-5)
+    assert torch.allclose(log_det_, -log_det)
+    (input_.sum() + log_det_).backward()
+    assert latent.grad is not None
+    assert all(p.grad is not None for p in module.parameters())
+
+
+def sgd_step(module, inputs):
+    optim = torch.optim.SGD(module.parameters(), lr=0.01)
+    optim.zero_grad()
+    module(inputs)[0].pow(2).sum().backward()
+    optim.step()
+
+
+def radam_step(module, inputs):
+    # Updates parameters through `.data`, which doesn't bump their versions
+    optim = RAdam(module.parameters(), lr=0.01)
+    optim.zero_grad()
+    module(inputs)[0].pow(2).sum().backward()
+    optim.step()
+
+
+def polyak_update(module, inputs):
+    # pylint:disable=unused-argument
+    target = copy.deepcopy(module)
+    with torch.no_grad():
+        for param in target.parameters():
+            param.mul_(1.1)
+    update_polyak(target, module, polyak=0.5)
+
+
+@pytest.fixture(params=(sgd_step, radam_step, polyak_update))
+def update(request):
+    return request.param
+
+
+def test_cache_invalidation(module, inputs, update):
+    with torch.no_grad():
+        latent, _ = module(inputs)
+        input_, _ = module.backward(latent)
+        W_inv = module._cached()[1]
+        assert module._cached()[1] is W_inv
+    assert torch.allclose(input_, inputs, atol=1e-5)
+    assert torch.allclose(W_inv, torch.inverse(module._assemble_W()), atol=1e-5)
+
+    update(module, inputs)
+
+    with torch.no_grad():
+        latent, log_det = module(inputs)
+        W = module._assemble_W()
+        assert module._cached()[1] is not W_inv
+        assert torch.allclose(latent, inputs @ W)
+        assert torch.allclose(log_det, torch.slogdet(W)[1], atol=1e-5)
+        assert torch.allclose(module.backward(latent)[0], inputs, atol=1e-5)
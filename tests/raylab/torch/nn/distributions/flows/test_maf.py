@@ -31,3 +31,27 @@ def test_flow(module, torch_script):
     assert logpx.grad_fn is not None
     inputs_.sum().backward()
     assert latent.grad is not None
+
+
+def test_inverse(module):
+    inputs = torch.randn(10, 4)
+
+    with torch.no_grad():
+        latent, log_det = module(inputs)
+        inputs_, log_det_ = module(latent, reverse=True)
+
+    assert torch.allclose(inputs, inputs_, atol=1e-5)
+    assert torch.allclose(log_det, -log_det_, atol=1e-5)
+
+
+def test_encode_jacobian():
+    module = MAF(4, parity=False)
+    inputs = torch.randn(4)
+
+    latent, _ = module(inputs)
+    jac = torch.autograd.functional.jacobian(lambda x: module(x)[0], inputs)
+    jac_inv = torch.autograd.functional.jacobian(
+        lambda z: module(z, reverse=True)[0], latent.detach()
+    )
+
+    assert torch.allclose(jac @ jac_inv, torch.eye(4), atol=1e-5)
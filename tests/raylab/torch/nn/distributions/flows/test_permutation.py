@@ -0,0 +1,171 @@
+import pytest
+import torch
+
+from raylab.policy.modules.networks import MLP
+from raylab.torch.nn.distributions.flows import AffineConstantFlow
+from raylab.torch.nn.distributions.flows import AffineCouplingTransform
+from raylab.torch.nn.distributions.flows import CompositeTransform
+from raylab.torch.nn.distributions.flows import ConditionalTransform
+from raylab.torch.nn.distributions.flows import PermutationTransform
+from raylab.torch.nn.distributions.flows.masks import create_alternating_binary_mask
+from raylab.torch.nn.distributions.flows.masks import create_random_binary_mask
+from raylab.torch.nn.distributions.flows.utils import sum_rightmost
+
+
+def make_coupling(mask):
+    return AffineCouplingTransform(mask, lambda i, o: MLP(i, o, 6))
+
+
+@pytest.fixture(params=(3, 4))
+def features(request):
+    return request.param
+
+
+@pytest.fixture
+def inputs(features):
+    return torch.randn(10, features)
+
+
+def sequential(transforms, inputs, params):
+    out, log_det = inputs, 0.0
+    for transform in transforms:
+        out, log_det_ = transform(out, params)
+        log_det = log_det + sum_rightmost(log_det_, 1 - transform.event_dim)
+    return out, log_det
+
+
+def num_reorders(composite):
+    count = 0
+    for transform in composite.transforms:
+        if isinstance(transform, PermutationTransform):
+            count += transform.reorder
+        elif isinstance(transform, AffineCouplingTransform):
+            count += transform.reorder_inputs + transform.reorder_outputs
+    return count
+
+
+def test_permutation(features, inputs, torch_script):
+    module = PermutationTransform(torch.randperm(features))
+    module = torch.jit.script(module) if torch_script else module
+
+    out, log_det = module(inputs, {})
+    assert torch.equal(out, inputs[..., module.permutation])
+    assert torch.equal(log_det, torch.zeros(10))
+
+    latent, _ = module(out, {}, reverse=True)
+    assert torch.equal(latent, inputs)
+
+
+def test_fused_couplings(features, inputs, torch_script):
+    couplings = [
+        make_coupling(create_alternating_binary_mask(features, even=i % 2 == 0))
+        for i in range(4)
+    ]
+    params = {}
+    expected, expected_log_det = sequential(couplings, inputs, params)
+
+    composite = CompositeTransform(couplings)
+    assert num_reorders(composite) <= 2
+    composite = torch.jit.script(composite) if torch_script else composite
+
+    out, log_det = composite(inputs, params)
+    assert torch.allclose(out, expected, atol=1e-6)
+    assert torch.allclose(log_det, expected_log_det, atol=1e-6)
+
+    latent, log_det_ = composite(out, params, reverse=True)
+    assert torch.allclose(latent, inputs, atol=1e-5)
+    assert torch.allclose(log_det_, -log_det, atol=1e-5)
+
+
+def test_fused_mixed(features, inputs):
+    transforms = [
+        PermutationTransform(torch.randperm(features)),
+        make_coupling(create_random_binary_mask(features)),
+        PermutationTransform(torch.randperm(features)),
+        make_coupling(create_random_binary_mask(features)),
+        ConditionalTransform(transform=AffineConstantFlow((features,))),
+        make_coupling(create_alternating_binary_mask(features)),
+    ]
+    params = {}
+    expected, expected_log_det = sequential(transforms, inputs, params)
+
+    composite = CompositeTransform(transforms)
+    out, log_det = composite(inputs, params)
+    assert torch.allclose(out, expected, atol=1e-6)
+    assert torch.allclose(log_det, expected_log_det, atol=1e-6)
+
+    nested = CompositeTransform([composite])
+    assert num_reorders(nested) == num_reorders(composite)
+    out, _ = nested(inputs, params)
+    assert torch.allclose(out, expected, atol=1e-6)
+    latent, _ = nested(out, params, reverse=True)
+    assert torch.allclose(latent, inputs, atol=1e-5)
+
+
+def test_fused_in_place(features):
+    couplings = [
+        make_coupling(create_alternating_binary_mask(features, even=i % 2 == 0))
+        for i in range(4)
+    ]
+
+    composite = CompositeTransform(couplings)
+    assert all(a is b for a, b in zip(composite.transforms, couplings))
+    assert all(a is b for a, b in zip(composite.inv_transforms, couplings[::-1]))
+
+
+def mixed_transforms(features):
+    return [
+        PermutationTransform(torch.randperm(features)),
+        make_coupling(create_random_binary_mask(features)),
+        make_coupling(create_random_binary_mask(features)),
+        ConditionalTransform(transform=AffineConstantFlow((features,))),
+        make_coupling(create_random_binary_mask(features)),
+    ]
+
+
+def test_load_state_dict(features, inputs):
+    transforms = mixed_transforms(features)
+    source = CompositeTransform(transforms)
+    state = source.state_dict()
+    # Same keys as the sequence of transforms, without fusion
+    assert set(state) == {
+        f"{name}.{idx}.{key}"
+        for name, sequence in (
+            ("transforms", transforms),
+            ("inv_transforms", transforms[::-1]),
+        )
+        for idx, transform in enumerate(sequence)
+        for key in transform.state_dict()
+    }
+
+    # Masks and permutations are loaded as well
+    composite = CompositeTransform(mixed_transforms(features))
+    composite.load_state_dict(state)
+    params = {}
+    out, log_det = composite(inputs, params)
+    expected, expected_log_det = source(inputs, params)
+    assert torch.allclose(out, expected, atol=1e-6)
+    assert torch.allclose(log_det, expected_log_det, atol=1e-6)
+    latent, _ = composite(out, params, reverse=True)
+    assert torch.allclose(latent, inputs, atol=1e-5)
+
+
+def test_load_nested_state_dict(features, inputs):
+    source = torch.nn.ModuleDict(
+        {"flow": CompositeTransform(mixed_transforms(features))}
+    )
+    target = torch.nn.ModuleDict(
+        {"flow": CompositeTransform(mixed_transforms(features))}
+    )
+    target.load_state_dict(source.state_dict())
+
+    params = {}
+    out, _ = target["flow"](inputs, params)
+    expected, _ = source["flow"](inputs, params)
+    assert torch.allclose(out, expected, atol=1e-6)
+    assert num_reorders(target["flow"]) == num_reorders(source["flow"])
+
+    state = source.state_dict()
+    del state["flow.transforms.1.identity_features"]
+    with pytest.raises(RuntimeError, match="identity_features"):
+        target.load_state_dict(state)
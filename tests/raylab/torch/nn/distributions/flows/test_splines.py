@@ -0,0 +1,112 @@
+# pylint:disable=missing-docstring,too-many-arguments
+import math
+
+import pytest
+import torch
+import torch.nn.functional as F
+
+from raylab.torch.nn.distributions.flows.splines import rational_quadratic_spline
+from raylab.torch.nn.distributions.flows.splines import searchsorted
+from raylab.torch.nn.distributions.flows.splines import (
+    unconstrained_rational_quadratic_spline,
+)
+
+
+def masked_rational_quadratic_spline(
+    inputs,
+    unnormalized_widths,
+    unnormalized_heights,
+    unnormalized_derivatives,
+    inverse=False,
+    tail_bound=1.0,
+):
+    """Reference implementation with boolean-mask indexing."""
+    inside_interval_mask = (inputs >= -tail_bound) & (inputs <= tail_bound)
+    outside_interval_mask = ~inside_interval_mask
+
+    outputs = torch.zeros_like(inputs)
+    logabsdet = torch.zeros_like(inputs)
+
+    unnormalized_derivatives = F.pad(unnormalized_derivatives, pad=(1, 1))
+    constant = math.log(math.exp(1 - 1e-3) - 1)
+    unnormalized_derivatives[..., 0] = constant
+    unnormalized_derivatives[..., -1] = constant
+
+    outputs[outside_interval_mask] = inputs[outside_interval_mask]
+
+    spline_out = rational_quadratic_spline(
+        inputs=inputs[inside_interval_mask],
+        unnormalized_widths=unnormalized_widths[inside_interval_mask, :],
+        unnormalized_heights=unnormalized_heights[inside_interval_mask, :],
+        unnormalized_derivatives=unnormalized_derivatives[inside_interval_mask, :],
+        inverse=inverse,
+        left=-tail_bound,
+        right=tail_bound,
+        bottom=-tail_bound,
+        top=tail_bound,
+    )
+    outputs[inside_interval_mask], logabsdet[inside_interval_mask] = spline_out
+    return outputs, logabsdet
+
+
+@pytest.fixture(params=(True, False), ids=lambda x: f"Inverse({x})")
+def inverse(request):
+    return request.param
+
+
+@pytest.fixture
+def spline_params():
+    num_bins = 8
+    shape = (20, 3)
+    return (
+        torch.randn(*shape, num_bins, requires_grad=True),
+        torch.randn(*shape, num_bins, requires_grad=True),
+        torch.randn(*shape, num_bins - 1, requires_grad=True),
+    )
+
+
+@pytest.fixture
+def inputs():
+    # Some inputs fall outside the tail bound
+    return (torch.randn(20, 3) * 2).requires_grad_()
+
+
+def test_searchsorted():
+    bin_locations = torch.linspace(-1, 1, 5).expand(4, 5).contiguous()
+    inputs = torch.tensor([-1.5, -1.0, 0.2, 1.0])
+    copy = bin_locations.clone()
+
+    bin_idx = searchsorted(bin_locations, inputs)
+
+    assert bin_idx.tolist() == [0, 0, 2, 3]
+    assert torch.equal(bin_locations, copy)
+
+
+def test_equivalence(inputs, spline_params, inverse):
+    tail_bound = 1.5
+    outputs, logabsdet = unconstrained_rational_quadratic_spline(
+        inputs, *spline_params, inverse=inverse, tail_bound=tail_bound
+    )
+    outputs_, logabsdet_ = masked_rational_quadratic_spline(
+        inputs, *spline_params, inverse=inverse, tail_bound=tail_bound
+    )
+
+    assert torch.allclose(outputs, outputs_, atol=1e-6)
+    assert torch.allclose(logabsdet, logabsdet_, atol=1e-6)
+
+    tensors = (inputs,) + spline_params
+    grads = torch.autograd.grad(outputs.sum() + logabsdet.sum(), tensors)
+    grads_ = torch.autograd.grad(outputs_.sum() + logabsdet_.sum(), tensors)
+    for grad, grad_ in zip(grads, grads_):
+        assert torch.isfinite(grad).all()
+        assert torch.allclose(grad, grad_, atol=1e-5)
+
+
+def test_inverse(inputs, spline_params):
+    outputs, logabsdet = unconstrained_rational_quadratic_spline(inputs, *spline_params)
+    inputs_, logabsdet_ = unconstrained_rational_quadratic_spline(
+        outputs, *spline_params, inverse=True
+    )
+
+    assert torch.allclose(inputs, inputs_, atol=1e-5)
+    assert torch.allclose(logabsdet, -logabsdet_, atol=1e-5)
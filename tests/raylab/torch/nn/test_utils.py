@@ -0,0 +1,52 @@
+import torch
+import torch.nn as nn
+from torch.nn.utils import parameters_to_vector
+from torch.nn.utils import vector_to_parameters
+
+from raylab.torch.nn.utils import batched_params_call
+from raylab.torch.nn.utils import memoize_forward
+
+
+def make_module():
+    return nn.Sequential(nn.Linear(4, 10), nn.Tanh(), nn.Linear(10, 2))
+
+
+def test_batched_params_call():
+    module = make_module()
+    inputs = torch.randn(8, 4)
+    params = parameters_to_vector(module.parameters())
+    candidates = params + torch.randn(5, params.numel())
+
+    outputs = batched_params_call(module, candidates, lambda m: m(inputs))
+    assert outputs.shape == (5, 8, 2)
+
+    assert torch.allclose(parameters_to_vector(module.parameters()), params)
+    for cand, out in zip(candidates, outputs):
+        copy = make_module()
+        vector_to_parameters(cand, copy.parameters())
+        assert torch.allclose(copy(inputs), out, atol=1e-6)
+
+
+def test_memoize_forward(mocker):
+    module = make_module()
+    spy = mocker.spy(module, "forward")
+    inputs = torch.randn(8, 4)
+
+    with memoize_forward(module):
+        with torch.no_grad():
+            out = module(inputs)
+        assert not out.requires_grad
+
+        out = module(inputs)
+        assert out.requires_grad
+        assert module(inputs) is out
+        with torch.no_grad():
+            assert torch.equal(module(inputs), out)
+
+        other = module(torch.randn(8, 4))
+        assert not torch.allclose(other, out)
+        assert spy.call_count == 3
+
+    assert module.forward is spy
+    module(inputs)
+    assert spy.call_count == 4
@@ -0,0 +1,63 @@
+import pytest
+import torch
+
+from raylab.torch.optim.hessian_free import line_search
+
+
+@pytest.fixture
+def target():
+    torch.manual_seed(42)
+    return torch.randn(10)
+
+
+def quadratic(target):
+    def func(params):
+        return (params - target).pow(2).sum(-1)
+
+    return func
+
+
+@pytest.fixture(params=(0.1, 0.5, 0.9), ids=lambda x: f"AcceptRatio({x})")
+def accept_ratio(request):
+    return request.param
+
+
+@pytest.fixture(params=(1.0, 3.0, -1.0), ids=lambda x: f"StepScale({x})")
+def step_scale(request):
+    return request.param
+
+
+def test_batched_line_search(target, accept_ratio, step_scale):
+    func = quadratic(target)
+    x_0 = torch.zeros_like(target)
+    grad = 2 * (x_0 - target)
+    d_x = step_scale * grad / 2
+    expected_improvement = grad.dot(d_x).item()
+    kwargs = dict(y_0=func(x_0).item(), accept_ratio=accept_ratio)
+
+    x_seq, expected_seq, improvement_seq = line_search(
+        lambda x: func(x).item(), x_0, d_x, expected_improvement, **kwargs
+    )
+    x_bat, expected_bat, improvement_bat = line_search(
+        func, x_0, d_x, expected_improvement, batched=True, **kwargs
+    )
+
+    assert torch.allclose(x_seq, x_bat)
+    assert expected_seq == pytest.approx(expected_bat)
+    assert improvement_seq == pytest.approx(improvement_bat)
+
+
+def test_batched_line_search_barrier(target):
+    func = quadratic(target)
+    x_0 = torch.zeros_like(target)
+    d_x = -target * 2
+
+    def barrier(params):
+        values = func(params)
+        return values.masked_fill(params.norm(dim=-1) > target.norm(), float("inf"))
+
+    x_new, _, improvement = line_search(
+        barrier, x_0, d_x, target.dot(target).item(), batched=True
+    )
+    assert x_new.norm() <= target.norm()
+    assert improvement > 0
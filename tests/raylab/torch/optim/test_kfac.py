@@ -1,4 +1,5 @@
 import pytest
+import torch
 import torch.nn as nn
 
 
@@ -26,3 +27,40 @@ def test_all_linear_registered(optim, module):
     optim_params = set(p for group in optim.param_groups for p in group["params"])
 
     assert not linear_params.symmetric_difference(optim_params)
+
+
+@pytest.fixture(params=(True, False), ids=lambda x: f"AsyncInverse({x})")
+def async_inverse(request):
+    return request.param
+
+
+def test_step(optim_cls, module, async_inverse):
+    optim = optim_cls(module, eps=1e-3, update_freq=2, async_inverse=async_inverse)
+    params = [p.clone() for p in module.parameters()]
+
+    for _ in range(4):
+        inputs = torch.randn(32, 4)
+        with optim.record_stats():
+            module(inputs).pow(2).mean().backward()
+        optim.zero_grad()
+        module(inputs).sum().backward()
+        optim.step()
+
+    for old, new in zip(params, module.parameters()):
+        assert torch.isfinite(new).all()
+        assert not torch.allclose(old, new)
+
+
+def test_batched_covs(optim, module):
+    inputs = torch.randn(32, 4)
+    linears = [m for m in module.modules() if isinstance(m, nn.Linear)]
+    with torch.no_grad():
+        hidden = module[1](linears[0](inputs))
+
+    with optim.record_stats():
+        module(inputs).sum().backward()
+    optim.step()
+
+    for layer, layer_in in zip(linears, (inputs, hidden)):
+        x = torch.cat([layer_in / len(inputs), torch.ones(len(inputs), 1)], -1)
+        assert torch.allclose(optim.state[layer.weight]["xxt"], x.T @ x, atol=1e-6)
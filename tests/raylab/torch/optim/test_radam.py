@@ -0,0 +1,70 @@
+import pytest
+import torch
+import torch.nn as nn
+
+from raylab.torch.optim.radam import AdamW
+from raylab.torch.optim.radam import PlainRAdam
+from raylab.torch.optim.radam import RAdam
+
+
+@pytest.fixture(params=(RAdam, PlainRAdam, AdamW))
+def optim_cls(request):
+    return request.param
+
+
+@pytest.fixture(params=(0, 1e-2), ids=lambda x: f"WeightDecay({x})")
+def weight_decay(request):
+    return request.param
+
+
+def make_module():
+    torch.manual_seed(42)
+    return nn.Sequential(nn.Linear(4, 10), nn.ReLU(), nn.Linear(10, 2))
+
+
+def train(module, optimizers, steps=10):
+    inputs = torch.randn(steps, 8, 4)
+    for batch in inputs:
+        for optim in optimizers:
+            optim.zero_grad()
+        module(batch).pow(2).mean().backward()
+        yield
+
+
+def test_foreach_step(optim_cls, weight_decay):
+    loop, foreach = make_module(), make_module()
+    kwargs = dict(lr=1e-2, weight_decay=weight_decay)
+    loop_optim = optim_cls(loop.parameters(), **kwargs)
+    foreach_optim = optim_cls(foreach.parameters(), foreach=True, **kwargs)
+
+    torch.manual_seed(0)
+    for _ in train(loop, [loop_optim]):
+        loop_optim.step()
+    torch.manual_seed(0)
+    for _ in train(foreach, [foreach_optim]):
+        foreach_optim.step()
+
+    for par, other in zip(loop.parameters(), foreach.parameters()):
+        assert torch.allclose(par, other, atol=1e-6)
+
+
+def test_fused_step(optim_cls):
+    separate, fused = make_module(), make_module()
+
+    def make_optims(module):
+        return [
+            optim_cls(module[0].parameters(), lr=1e-2, foreach=True),
+            optim_cls(module[2].parameters(), lr=1e-3, foreach=True),
+        ]
+
+    separate_optims, fused_optims = make_optims(separate), make_optims(fused)
+    torch.manual_seed(0)
+    for _ in train(separate, separate_optims):
+        for optim in separate_optims:
+            optim.step()
+    torch.manual_seed(0)
+    for _ in train(fused, fused_optims):
+        optim_cls.fused_step(fused_optims)
+
+    for par, other in zip(separate.parameters(), fused.parameters()):
+        assert torch.allclose(par, other, atol=1e-6)
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from raylab.utils.episodes import EpisodeWriter
+from raylab.utils.episodes import load_episodes
+from raylab.utils.episodes import timestep_stats
+
+
+@pytest.fixture
+def episodes():
+    rng = np.random.default_rng(42)
+    return [
+        [
+            (
+                rng.normal(size=3).astype(np.float32),
+                rng.normal(size=2).astype(np.float32),
+                rng.normal(),
+                step == length - 1,
+            )
+            for step in range(length)
+        ]
+        for length in (5, 8, 1, 8)
+    ]
+
+
+@pytest.fixture
+def path(episodes, tmp_path):
+    path = str(tmp_path / "rollouts")
+    with EpisodeWriter(path) as writer:
+        for episode in episodes:
+            for transition in episode:
+                writer.add_step(*transition)
+            writer.end_episode()
+    return path
+
+
+def test_load_episodes(episodes, path):
+    fields, offsets = load_episodes(path)
+
+    assert offsets.tolist() == [0, 5, 13, 14, 22]
+    assert fields["obs"].shape == (22, 3)
+    assert fields["act"].shape == (22, 2)
+    assert fields["reward"].shape == (22,)
+    assert fields["done"].sum() == len(episodes)
+
+    obs = np.stack([t[0] for e in episodes for t in e])
+    assert np.array_equal(fields["obs"], obs)
+
+
+def test_load_while_writing(episodes, tmp_path):
+    path = str(tmp_path / "rollouts")
+    with EpisodeWriter(path) as writer:
+        for transition in episodes[0]:
+            writer.add_step(*transition)
+        writer.end_episode()
+        writer.add_step(*episodes[1][0])
+
+        fields, offsets = load_episodes(path)
+        assert offsets.tolist() == [0, 5]
+        obs = np.stack([t[0] for t in episodes[0]])
+        assert np.array_equal(fields["obs"], obs)
+
+
+def test_timestep_stats(episodes, path):
+    fields, offsets = load_episodes(path)
+    means, stds = timestep_stats(fields["obs"], offsets)
+
+    rows = [
+        {"timestep": t, **{f"obs[{i}]": o for i, o in enumerate(trans[0])}}
+        for e in episodes
+        for t, trans in enumerate(e)
+    ]
+    grouped = pd.DataFrame(rows).groupby("timestep")
+    assert np.allclose(means, grouped.mean().to_numpy())
+    assert np.allclose(stds, grouped.std().to_numpy(), equal_nan=True)
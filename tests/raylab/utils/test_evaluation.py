@@ -0,0 +1,62 @@
+import gym
+import numpy as np
+import pytest
+from gym.spaces import Box
+
+from raylab.utils.evaluation import run_episodes
+
+
+class RandomLengthEnv(gym.Env):  # pylint:disable=abstract-method
+    observation_space = Box(-1, 1, shape=(2,))
+    action_space = Box(-1, 1, shape=(1,))
+
+    def __init__(self):
+        self.rng = np.random.default_rng()
+        self.horizon = self.time = 0
+
+    def seed(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+
+    def reset(self):
+        self.time = 0
+        self.horizon = self.rng.integers(1, 20)
+        return self.rng.uniform(-1, 1, size=2).astype(np.float32)
+
+    def step(self, action):
+        self.time += 1
+        obs = self.rng.uniform(-1, 1, size=2).astype(np.float32)
+        return obs, float(obs[0] * action[0]), self.time >= self.horizon, {}
+
+
+class DummyPolicy:
+    def __init__(self):
+        self.batch_sizes = []
+
+    def compute_actions(self, obs_batch):
+        self.batch_sizes.append(len(obs_batch))
+        return obs_batch[:, :1], [], {}
+
+
+@pytest.fixture
+def seeds():
+    return list(range(10))
+
+
+@pytest.mark.parametrize("num_envs", (1, 3, 10))
+def test_run_episodes(seeds, num_envs):
+    policy = DummyPolicy()
+    envs = [RandomLengthEnv() for _ in range(num_envs)]
+    stats = run_episodes(policy, envs, seeds)
+
+    assert stats["seed"].tolist() == seeds
+    assert max(policy.batch_sizes) == num_envs
+
+    expected = run_episodes(DummyPolicy(), [RandomLengthEnv()], seeds)
+    assert np.allclose(stats["episode_reward"], expected["episode_reward"])
+    assert np.array_equal(stats["episode_length"], expected["episode_length"])
+
+
+def test_max_steps(seeds):
+    envs = [RandomLengthEnv() for _ in range(4)]
+    stats = run_episodes(DummyPolicy(), envs, seeds, max_steps=5)
+    assert (stats["episode_length"] <= 5).all()
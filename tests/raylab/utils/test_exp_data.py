@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from raylab.utils import exp_data
+
+
+def make_trial(path, idx, lr, units):
+    path.mkdir(parents=True)
+    progress = "timesteps_total,episode_reward_mean\n"
+    progress += "".join(f"{i * 10},{i * idx}\n" for i in range(5))
+    (path / "progress.csv").write_text(progress)
+    params = {"seed": idx, "optimizer": {"lr": lr}, "units": units}
+    (path / "params.json").write_text(json.dumps(params))
+
+
+@pytest.fixture
+def results_dir(tmp_path):
+    make_trial(tmp_path / "exp" / "trial_0", 0, 1e-3, [64, 64])
+    make_trial(tmp_path / "exp" / "trial_1", 1, 1e-4, [64, 64])
+    make_trial(tmp_path / "exp" / "trial_2", 2, 1e-4, [32])
+    return tmp_path
+
+
+@pytest.fixture(params=(None, 2), ids=lambda x: f"Workers({x})")
+def workers(request):
+    return request.param
+
+
+def test_load_exps_data(results_dir, workers):
+    exps_data = exp_data.load_exps_data(str(results_dir), workers=workers)
+
+    assert len(exps_data) == 3
+    assert all(len(exp.progress) == 5 for exp in exps_data)
+    assert sorted(exp.flat_params["seed"] for exp in exps_data) == [0, 1, 2]
+    assert all("optimizer/lr" in exp.flat_params for exp in exps_data)
+
+
+def test_cache(results_dir, mocker):
+    exps_data = exp_data.load_exps_data(str(results_dir), use_cache=True)
+    assert all(
+        (results_dir / "exp" / f"trial_{i}" / exp_data.CACHE_FILE).exists()
+        for i in range(3)
+    )
+
+    spy = mocker.spy(exp_data, "load_progress")
+    cached = exp_data.load_exps_data(str(results_dir), use_cache=True)
+    assert spy.call_count == 0
+    assert len(cached) == len(exps_data)
+
+    progress_path = results_dir / "exp" / "trial_0" / "progress.csv"
+    progress_path.write_text(progress_path.read_text() + "50,100\n")
+    updated = exp_data.load_exps_data(str(results_dir), use_cache=True)
+    assert spy.call_count == 1
+    assert sorted(len(exp.progress) for exp in updated) == [5, 5, 6]
+
+
+def test_extract_distinct_params(results_dir):
+    exps_data = exp_data.load_exps_data(str(results_dir))
+
+    distinct = dict(exp_data.extract_distinct_params(exps_data))
+    assert "seed" not in distinct
+    assert distinct["optimizer/lr"] == [0.0001, 0.001]
+    assert distinct["units"] == [[32], [64, 64]]
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+import torch
+import torch.nn as nn
+
+from raylab.utils.param_noise import ddpg_distance_metric
+from raylab.utils.param_noise import ParameterPerturbation
+
+
+def make_module():
+    return nn.Sequential(nn.Linear(3, 8), nn.LayerNorm(8), nn.Tanh(), nn.Linear(8, 2))
+
+
+@pytest.fixture
+def module():
+    return make_module()
+
+
+@pytest.fixture(params=(1, 4), ids=lambda x: f"Perturbations({x})")
+def num_perturbations(request):
+    return request.param
+
+
+@pytest.fixture
+def perturbation(module, num_perturbations):
+    return ParameterPerturbation(module, num_perturbations)
+
+
+def test_perturb(module, perturbation, num_perturbations):
+    target = make_module()
+    layer_norm = set(target[1].parameters())
+
+    for index in range(num_perturbations):
+        perturbation.perturb(target, stddev=0.1, index=index)
+        for param, tparam in zip(module.parameters(), target.parameters()):
+            if tparam in layer_norm:
+                assert torch.equal(param, tparam)
+            else:
+                assert not torch.allclose(param, tparam)
+
+
+def test_resample(perturbation):
+    noise = perturbation.noise.clone()
+    perturbation.resample(index=0)
+    assert not torch.allclose(perturbation.noise[0], noise[0])
+    assert torch.equal(perturbation.noise[1:], noise[1:])
+
+
+def test_batched_call(module, perturbation, num_perturbations):
+    obs = torch.randn(10, 3)
+    outputs = perturbation.batched_call(0.1, lambda m: m(obs))
+    assert outputs.shape == (num_perturbations, 10, 2)
+
+    target = make_module()
+    for index in range(num_perturbations):
+        perturbation.perturb(target, stddev=0.1, index=index)
+        assert torch.allclose(outputs[index], target(obs), atol=1e-6)
+
+
+def test_ddpg_distance_metric():
+    actions1, actions2 = np.random.randn(2, 10, 4).astype(np.float32)
+    expected = ddpg_distance_metric(actions1, actions2)
+    distance = ddpg_distance_metric(*map(torch.from_numpy, (actions1, actions2)))
+
+    assert torch.is_tensor(distance)
+    assert distance.item() == pytest.approx(expected, rel=1e-5)
@@ -0,0 +1,104 @@
+import json
+import os
+
+import pytest
+from ray.rllib.policy.policy import LEARNER_STATS_KEY
+
+from raylab.policy import learner_stats
+from raylab.utils.profiler import profile
+from raylab.utils.profiler import Profiler
+
+
+@pytest.fixture
+def profiler():
+    return Profiler(percentiles=(50, 90))
+
+
+def test_inactive(profiler):
+    with profile("outer"):
+        pass
+
+    assert not profiler.active
+    assert not profiler.durations
+    assert profiler.stats() == {}
+
+
+def test_nested_sections(profiler):
+    with profiler.activate():
+        assert profiler.active
+        with profile("outer"):
+            for _ in range(3):
+                with profile("inner"):
+                    pass
+    assert not profiler.active
+
+    assert sorted(profiler.durations) == ["outer", "outer/inner"]
+    stats = profiler.stats()
+    assert stats["profile/outer/calls"] == 1
+    assert stats["profile/outer/inner/calls"] == 3
+    assert {"p50_ms", "p90_ms", "total_ms"} <= {
+        k.split("/")[-1] for k in stats if k.startswith("profile/outer/inner/")
+    }
+    assert stats["profile/outer/total_ms"] >= stats["profile/outer/inner/total_ms"]
+    assert not profiler.durations
+
+
+def test_section_exception(profiler):
+    with profiler.activate():
+        with pytest.raises(RuntimeError):
+            with profile("outer"):
+                raise RuntimeError
+
+        with profile("after"):
+            pass
+
+    assert sorted(profiler.durations) == ["after", "outer"]
+
+
+def test_chrome_trace(tmpdir):
+    profiler = Profiler(chrome_trace_dir=str(tmpdir))
+    for _ in range(2):
+        with profiler.activate(), profile("outer"), profile("inner"):
+            pass
+        profiler.stats()
+
+    path = os.path.join(str(tmpdir), f"trace-{os.getpid()}.json")
+    with open(path) as file:
+        # Closing bracket is optional in the JSON array trace format
+        events = json.loads(file.read().rstrip().rstrip(",") + "]")
+
+    assert len(events) == 4
+    assert {e["name"] for e in events} == {"outer", "inner"}
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+
+
+def test_from_config():
+    assert Profiler.from_config({"enabled": False}) is None
+    profiler = Profiler.from_config({"enabled": True, "percentiles": [95]})
+    assert profiler.percentiles == (95,)
+
+
+class DummyPolicy:
+    # pylint:disable=too-few-public-methods
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    @learner_stats
+    def learn_on_batch(self):
+        with profile("improve_policy"):
+            return {"loss": 0.0}
+
+
+def test_learner_stats(profiler):
+    policy = DummyPolicy(profiler)
+    for _ in range(2):
+        info = policy.learn_on_batch()[LEARNER_STATS_KEY]
+        assert info == {"loss": 0.0}
+
+    # Durations accumulate until the stats are reported
+    stats = profiler.stats()
+    assert stats["profile/learn_on_batch/calls"] == 2
+    assert stats["profile/learn_on_batch/improve_policy/calls"] == 2
+
+    info = DummyPolicy(None).learn_on_batch()[LEARNER_STATS_KEY]
+    assert info == {"loss": 0.0}
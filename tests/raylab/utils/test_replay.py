@@ -136,3 +136,19 @@ def empty_replay(request, replay: NumpyReplayBuffer):
 def test_empty(empty_replay: NumpyReplayBuffer, sample_batch: SampleBatch):
     obs = empty_replay.normalize(sample_batch[SampleBatch.CUR_OBS])
     assert np.allclose(obs, sample_batch[SampleBatch.CUR_OBS])
+
+
+def test_shards(replay_cls, obs_space, action_space):
+    replays = [replay_cls(size=100) for _ in range(3)]
+    for idx, replay in enumerate(replays):
+        replay.num_shards, replay.shard_index = len(replays), idx
+
+    batches = [fake_batch(obs_space, action_space, batch_size=n) for n in (10, 1, 4)]
+    for batch in batches:
+        for replay in replays:
+            replay.add(batch)
+
+    assert [len(r) for r in replays] == [5, 5, 5]
+    obs = np.concatenate([b[SampleBatch.CUR_OBS] for b in batches])
+    for idx, replay in enumerate(replays):
+        assert np.array_equal(replay.all_samples()[SampleBatch.CUR_OBS], obs[idx::3])
@@ -0,0 +1,105 @@
+import secrets
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+
+import numpy as np
+import pytest
+import torch
+import torch.nn as nn
+
+from raylab.utils.serving import MicroBatchServer
+
+
+class BatchRecorder(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes = []
+
+    def forward(self, obs):  # pylint:disable=arguments-differ
+        self.batch_sizes.append(len(obs))
+        return obs * 2
+
+
+@pytest.fixture
+def actor():
+    return BatchRecorder()
+
+
+def test_compute_action(actor):
+    with MicroBatchServer(actor) as server:
+        obs = np.random.randn(3).astype(np.float32)
+        assert np.allclose(server.compute_action(obs, timeout=5), obs * 2)
+
+
+def test_micro_batching(actor):
+    server = MicroBatchServer(actor, max_batch_size=8, max_latency_us=100_000)
+    obs = np.random.randn(20, 3).astype(np.float32)
+    futures = [server.submit(o) for o in obs]
+
+    with server:
+        actions = np.stack([f.result(timeout=5) for f in futures])
+    assert np.allclose(actions, obs * 2)
+    assert actor.batch_sizes == [8, 8, 4]
+
+
+def test_concurrent_clients(actor):
+    results = {}
+
+    def client(idx, server):
+        obs = np.full(3, idx, dtype=np.float32)
+        results[idx] = [server.compute_action(obs, timeout=5) for _ in range(10)]
+
+    with MicroBatchServer(actor, max_batch_size=4) as server:
+        threads = [threading.Thread(target=client, args=(i, server)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sum(actor.batch_sizes) == 80
+    for idx, actions in results.items():
+        assert all(np.allclose(a, 2 * idx) for a in actions)
+
+
+def test_error_propagation():
+    def actor(obs):
+        raise ValueError("bad input")
+
+    with MicroBatchServer(actor) as server:
+        future = server.submit(np.zeros(3))
+        with pytest.raises(ValueError):
+            future.result(timeout=5)
+
+
+def connect(address, authkey, timeout=5):
+    deadline = time.time() + timeout
+    while True:
+        try:
+            return Client(address, authkey=authkey)
+        except FileNotFoundError:
+            if time.time() > deadline:
+                raise
+            time.sleep(0.01)
+
+
+def test_listen(actor, tmp_path):
+    address, authkey = str(tmp_path / "actor.sock"), secrets.token_bytes(32)
+    server = MicroBatchServer(actor)
+    threading.Thread(target=server.listen, args=(address, authkey), daemon=True).start()
+
+    with pytest.raises(AuthenticationError):
+        connect(address, b"wrong key")
+
+    with connect(address, authkey) as conn:
+        obs = np.random.randn(3).astype(np.float32)
+        for _ in range(3):
+            conn.send(obs)
+            assert np.allclose(conn.recv(), obs * 2)
+
+
+def test_listen_requires_authkey(actor):
+    server = MicroBatchServer(actor)
+    with pytest.raises(ValueError):
+        server.listen(("localhost", 0), b"")